@@ -15,11 +15,6 @@ from utils.logger import setup_logger
 from utils.config_loader import ConfigLoader
 from data.database import Database
 from data.data_collector import DataCollector
-from data.position_tracker import PositionTracker
-from integrations.bybit import BybitClient
-from trading.order_manager import OrderManager
-from trading.market_data import MarketData
-from trading.bot import TradingBot
 
 logger = setup_logger()
 
@@ -90,6 +85,13 @@ def test_dashboard_state_data():
     logger.info("="*60)
 
     try:
+        # Heavy modules are only needed here; keep them off the module import path
+        from data.position_tracker import PositionTracker
+        from integrations.bybit import BybitClient
+        from trading.order_manager import OrderManager
+        from trading.market_data import MarketData
+        from trading.bot import TradingBot
+
         config = ConfigLoader().config
         db = Database("data/trading.db")
         dc = DataCollector(db)
@@ -32,9 +32,10 @@ import os
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
+import numpy as np
 import pandas as pd
-import json
-from typing import Dict, List, Any, Optional
+import orjson
+from typing import Dict, List, Any, Optional, Tuple
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -53,6 +54,78 @@ from trading.strategies_refactored import (
 )
 from trading.indicators import Indicators
 from trading.regime_detector import RegimeDetector
+from utils.jit import njit, NUMBA_AVAILABLE
+
+_STRATEGY_MAP = {
+    "emaTrend": EmaTrendStrategy,
+    "macdTrend": MacdTrendStrategy,
+    "rsiMeanReversion": RsiMeanReversionStrategy,
+    "bollingerMeanReversion": BollingerMeanReversionStrategy,
+    "adxTrend": AdxTrendStrategy,
+    "volumeProfile": VolumeProfileStrategy,
+    "volatilityBreakout": VolatilityBreakoutStrategy,
+    "multiTimeframe": MultiTimeframeStrategy
+}
+
+# (strategy_name, id(config)) -> (config, strategy instance)
+_STRATEGY_CACHE: Dict[Tuple[str, int], Tuple[Dict[str, Any], Any]] = {}
+
+# Exit codes returned by the exit scan, in tie-break priority order
+_EXIT_TYPES = ("stop_loss", "take_profit", "time_exit")
+
+# Regime type -> code for the per-candle regime array (tallied with np.bincount)
+_REGIME_CODES = {"trending": 0, "ranging": 1, "volatile": 2}
+
+# Result serialization: pretty-printed, numpy scalars/arrays and naive datetimes handled natively
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+
+@njit(cache=True)
+def _exit_kernel(lows, highs, is_buy, stop_loss, take_profit, time_exit_candles):
+    """
+    First exit in the holding window (compiled with numba when available)
+
+    Returns:
+        (candle index, exit code) or (-1, -1) if nothing triggers
+    """
+    for k in range(lows.shape[0]):
+        if is_buy:
+            sl_hit = lows[k] <= stop_loss
+            tp_hit = highs[k] >= take_profit
+        else:
+            sl_hit = highs[k] >= stop_loss
+            tp_hit = lows[k] <= take_profit
+
+        if sl_hit:
+            return k, 0
+        if tp_hit:
+            return k, 1
+        if time_exit_candles > 0 and k + 1 >= time_exit_candles:
+            return k, 2
+
+    return -1, -1
+
+
+def _find_exit_numpy(lows, highs, is_buy, stop_loss, take_profit, time_exit_candles):
+    """NumPy equivalent of _exit_kernel, used when numba is not installed"""
+    if is_buy:
+        sl_hits = lows <= stop_loss
+        tp_hits = highs >= take_profit
+    else:
+        sl_hits = highs >= stop_loss
+        tp_hits = lows <= take_profit
+
+    no_hit = len(lows)
+    sl_idx = int(np.argmax(sl_hits)) if sl_hits.any() else no_hit
+    tp_idx = int(np.argmax(tp_hits)) if tp_hits.any() else no_hit
+    time_idx = time_exit_candles - 1 if 0 < time_exit_candles <= no_hit else no_hit
+
+    # Earliest event wins; argmin keeps SL > TP > time priority on ties
+    candidates = (sl_idx, tp_idx, time_idx)
+    exit_code = int(np.argmin(candidates))
+    if candidates[exit_code] == no_hit:
+        return -1, -1
+    return candidates[exit_code], exit_code
 
 
 class StrategyIsolatedTester:
@@ -109,6 +182,9 @@ class StrategyIsolatedTester:
 
         self.results["strategy"] = strategy_name
 
+        # Regime code per evaluated candle (-1 = not evaluated), counted once after the loop
+        regime_codes = np.full(max(len(historical_data) - 100, 0), -1, dtype=np.int8)
+
         # Iterate through historical data
         for i in range(100, len(historical_data)):
             # Get candle window
@@ -126,7 +202,7 @@ class StrategyIsolatedTester:
 
             # Detect regime
             regime = self.regime_detector.detect_regime(indicators, price)
-            self.results["regime_distribution"][regime["type"]] += 1
+            regime_codes[i - 100] = _REGIME_CODES.get(regime["type"], -1)
 
             # Evaluate strategy
             self.results["total_evaluations"] += 1
@@ -161,6 +237,10 @@ class StrategyIsolatedTester:
                 if trade:
                     self.results["trades"].append(trade)
 
+        counts = np.bincount(regime_codes[regime_codes >= 0], minlength=len(_REGIME_CODES))
+        for regime_type, code in _REGIME_CODES.items():
+            self.results["regime_distribution"][regime_type] += int(counts[code])
+
         # Calculate statistics
         stats = self._calculate_statistics()
 
@@ -185,23 +265,16 @@ class StrategyIsolatedTester:
         }
 
     def _create_strategy(self, strategy_name: str):
-        """Create strategy instance"""
-        strategy_map = {
-            "emaTrend": EmaTrendStrategy,
-            "macdTrend": MacdTrendStrategy,
-            "rsiMeanReversion": RsiMeanReversionStrategy,
-            "bollingerMeanReversion": BollingerMeanReversionStrategy,
-            "adxTrend": AdxTrendStrategy,
-            "volumeProfile": VolumeProfileStrategy,
-            "volatilityBreakout": VolatilityBreakoutStrategy,
-            "multiTimeframe": MultiTimeframeStrategy
-        }
-
-        strategy_class = strategy_map.get(strategy_name)
+        """Create strategy instance (shared across testers using the same config)"""
+        strategy_class = _STRATEGY_MAP.get(strategy_name)
         if not strategy_class:
             return None
 
-        return strategy_class(self.config)
+        key = (strategy_name, id(self.config))
+        if key not in _STRATEGY_CACHE:
+            # Config is stored alongside the instance so its id cannot be reused
+            _STRATEGY_CACHE[key] = (self.config, strategy_class(self.config))
+        return _STRATEGY_CACHE[key][1]
 
     def _simulate_trade(
         self,
@@ -215,103 +288,53 @@ class StrategyIsolatedTester:
         strategy: Any
     ) -> Optional[Dict[str, Any]]:
         """Simulate a trade execution and exit"""
-        # Calculate SL/TP
-        stop_loss = strategy.get_stop_loss(entry_price, signal["side"], atr, indicators)
-        take_profit = strategy.get_take_profit(entry_price, signal["side"], atr, indicators)
+        side = signal["side"]
+        is_buy = side == "Buy"
+        direction = 1.0 if is_buy else -1.0
+        entry_price = float(entry_price)
+
+        # Calculate SL/TP once as plain float64
+        stop_loss = float(strategy.get_stop_loss(entry_price, side, atr, indicators))
+        take_profit = float(strategy.get_take_profit(entry_price, side, atr, indicators))
 
-        # Simulate holding period (max 100 candles)
+        # Simulate holding period (max 100 candles) - candles after entry only
         max_hold = min(100, len(historical_data) - entry_index)
+        window = slice(entry_index + 1, entry_index + max_hold)
+        lows = historical_data["low"].to_numpy(dtype=np.float64)[window]
+        highs = historical_data["high"].to_numpy(dtype=np.float64)[window]
+        closes = historical_data["close"].to_numpy(dtype=np.float64)[window]
+        if len(closes) == 0:
+            return None
 
-        for j in range(1, max_hold):
-            candle_idx = entry_index + j
-            if candle_idx >= len(historical_data):
-                break
-
-            candle = historical_data.iloc[candle_idx]
-
-            # Check stop loss
-            if signal["side"] == "Buy":
-                if candle["low"] <= stop_loss:
-                    # Stop loss hit
-                    return {
-                        "entry_time": entry_time,
-                        "exit_time": candle.name,
-                        "entry_price": entry_price,
-                        "exit_price": stop_loss,
-                        "side": signal["side"],
-                        "pnl_pct": (stop_loss - entry_price) / entry_price,
-                        "exit_type": "stop_loss",
-                        "hold_candles": j,
-                        "success": False
-                    }
-
-                # Check take profit
-                if candle["high"] >= take_profit:
-                    # Take profit hit
-                    return {
-                        "entry_time": entry_time,
-                        "exit_time": candle.name,
-                        "entry_price": entry_price,
-                        "exit_price": take_profit,
-                        "side": signal["side"],
-                        "pnl_pct": (take_profit - entry_price) / entry_price,
-                        "exit_type": "take_profit",
-                        "hold_candles": j,
-                        "success": True
-                    }
-
-            else:  # Sell
-                if candle["high"] >= stop_loss:
-                    # Stop loss hit
-                    return {
-                        "entry_time": entry_time,
-                        "exit_time": candle.name,
-                        "entry_price": entry_price,
-                        "exit_price": stop_loss,
-                        "side": signal["side"],
-                        "pnl_pct": (entry_price - stop_loss) / entry_price,
-                        "exit_type": "stop_loss",
-                        "hold_candles": j,
-                        "success": False
-                    }
-
-                # Check take profit
-                if candle["low"] <= take_profit:
-                    # Take profit hit
-                    return {
-                        "entry_time": entry_time,
-                        "exit_time": candle.name,
-                        "entry_price": entry_price,
-                        "exit_price": take_profit,
-                        "side": signal["side"],
-                        "pnl_pct": (entry_price - take_profit) / entry_price,
-                        "exit_type": "take_profit",
-                        "hold_candles": j,
-                        "success": True
-                    }
-
-        # Time exit (if strategy has one)
-        time_exit_minutes = strategy.get_time_exit()
-        if time_exit_minutes and j >= time_exit_minutes:
-            exit_price = historical_data.iloc[entry_index + j]["close"]
-            if signal["side"] == "Buy":
-                pnl_pct = (exit_price - entry_price) / entry_price
-            else:
-                pnl_pct = (entry_price - exit_price) / entry_price
+        time_exit_candles = strategy.get_time_exit() or 0
+        find_exit = _exit_kernel if NUMBA_AVAILABLE else _find_exit_numpy
+        hit_idx, exit_code = find_exit(
+            lows, highs, is_buy, stop_loss, take_profit, time_exit_candles
+        )
+        if hit_idx < 0:
+            return None
 
-            return {
-                "entry_time": entry_time,
-                "exit_time": historical_data.iloc[entry_index + j].name,
-                "entry_price": entry_price,
-                "exit_price": exit_price,
-                "side": signal["side"],
-                "pnl_pct": pnl_pct,
-                "exit_type": "time_exit",
-                "hold_candles": j,
-                "success": pnl_pct > 0
-            }
+        exit_type = _EXIT_TYPES[exit_code]
+        if exit_type == "stop_loss":
+            exit_price = stop_loss
+        elif exit_type == "take_profit":
+            exit_price = take_profit
+        else:
+            exit_price = float(closes[hit_idx])
+
+        pnl_pct = direction * (exit_price - entry_price) / entry_price
 
-        return None
+        return {
+            "entry_time": entry_time,
+            "exit_time": historical_data.index[entry_index + 1 + hit_idx],
+            "entry_price": entry_price,
+            "exit_price": exit_price,
+            "side": side,
+            "pnl_pct": pnl_pct,
+            "exit_type": exit_type,
+            "hold_candles": hit_idx + 1,
+            "success": exit_type == "take_profit" or (exit_type == "time_exit" and pnl_pct > 0)
+        }
 
     def _calculate_statistics(self) -> Dict[str, Any]:
         """Calculate trade statistics"""
@@ -453,10 +476,16 @@ def load_historical_data(symbol: str, start_date: str, end_date: str) -> pd.Data
             ORDER BY timestamp ASC
         """
 
-        cursor = db.execute(query, (symbol, start_date, end_date))
-        rows = cursor.fetchall()
+        df = pd.read_sql_query(
+            query,
+            db.connection,
+            params=(symbol, start_date, end_date),
+            index_col="timestamp",
+            parse_dates=["timestamp"],
+            dtype={col: "float64" for col in ["open", "high", "low", "close", "volume"]}
+        )
 
-        if not rows:
+        if df.empty:
             print(f"⚠️ No data found for {symbol} between {start_date} and {end_date}")
             print(f"   Database has {db.execute('SELECT COUNT(*) FROM klines WHERE symbol = ?', (symbol,)).fetchone()[0]} klines for {symbol}")
             print(f"   Oldest: {db.execute('SELECT MIN(timestamp) FROM klines WHERE symbol = ?', (symbol,)).fetchone()[0]}")
@@ -493,15 +522,6 @@ def load_historical_data(symbol: str, start_date: str, end_date: str) -> pd.Data
             print(f"✅ Loaded {len(df)} candles from Bybit API")
             return df
 
-        # Convert to DataFrame
-        df = pd.DataFrame(rows, columns=["timestamp", "open", "high", "low", "close", "volume"])
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        df.set_index("timestamp", inplace=True)
-
-        # Convert to float
-        for col in ["open", "high", "low", "close", "volume"]:
-            df[col] = df[col].astype(float)
-
         print(f"✅ Loaded {len(df)} candles from database")
         return df
 
@@ -539,10 +559,7 @@ def main():
 
     # Determine which strategies to test
     if args.strategy == "all":
-        strategies = [
-            "emaTrend", "macdTrend", "rsiMeanReversion", "bollingerMeanReversion",
-            "adxTrend", "volumeProfile", "volatilityBreakout", "multiTimeframe"
-        ]
+        strategies = list(_STRATEGY_MAP)
     else:
         strategies = [args.strategy]
 
@@ -558,15 +575,14 @@ def main():
         print(f"\n{'='*60}")
         print(f"RESULTS: {strategy_name}")
         print(f"{'='*60}")
-        print(json.dumps(results, indent=2))
+        print(orjson.dumps(results, option=_JSON_OPTIONS).decode())
 
     # Save results
     output_dir = Path(args.output)
     output_dir.mkdir(exist_ok=True)
 
     output_file = output_dir / f"strategy_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(output_file, 'w') as f:
-        json.dump(all_results, f, indent=2)
+    output_file.write_bytes(orjson.dumps(all_results, option=_JSON_OPTIONS))
 
     print(f"\n✅ Results saved to: {output_file}")
 
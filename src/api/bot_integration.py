@@ -1,6 +1,9 @@
 """Bot-API Integration Helper"""
 
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
 import logging
 
@@ -17,6 +20,36 @@ class BotAPIClient:
             api_base_url: Base URL of the API server
         """
         self.base_url = api_base_url.rstrip('/')
+
+        # Pooled keep-alive session: no new TCP connection per signal
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Created lazily inside the running event loop by send_signal_async
+        self._async_client: Optional[httpx.AsyncClient] = None
+
+    @staticmethod
+    def _build_signal_data(trade_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the /api/v1/trade/signal payload from a bot trade result"""
+        signal = trade_result.get("signal", {})
+        execution = trade_result.get("execution", {})
+        position = trade_result.get("position", {})
+
+        return {
+            "symbol": trade_result.get("symbol"),
+            "side": signal.get("side"),
+            "price": trade_result.get("price"),
+            "confidence": signal.get("confidence"),
+            "strategies": signal.get("strategiesUsed", []),
+            "regime": trade_result.get("regime", {}).get("type", "unknown"),
+            "orderId": execution.get("orderId"),
+            "qty": position.get("qty"),
+            "stopLoss": position.get("stopLoss"),
+            "takeProfit": position.get("takeProfit")
+        }
     
     def send_signal(self, trade_result: Dict[str, Any]) -> bool:
         """
@@ -29,32 +62,56 @@ class BotAPIClient:
             True if successful, False otherwise
         """
         try:
-            signal = trade_result.get("signal", {})
-            execution = trade_result.get("execution", {})
-            position = trade_result.get("position", {})
-            
-            signal_data = {
-                "symbol": trade_result.get("symbol"),
-                "side": signal.get("side"),
-                "price": trade_result.get("price"),
-                "confidence": signal.get("confidence"),
-                "strategies": signal.get("strategiesUsed", []),
-                "regime": trade_result.get("regime", {}).get("type", "unknown"),
-                "orderId": execution.get("orderId"),
-                "qty": position.get("qty"),
-                "stopLoss": position.get("stopLoss"),
-                "takeProfit": position.get("takeProfit")
-            }
-            
-            response = requests.post(
+            signal_data = self._build_signal_data(trade_result)
+
+            response = self._session.post(
                 f"{self.base_url}/api/v1/trade/signal",
-                json=signal_data,
+                data=orjson.dumps(signal_data),
                 timeout=5
             )
             response.raise_for_status()
-            logger.info(f"Signal sent to API for {signal_data['symbol']}")
+            logger.info("Signal sent to API for %s", signal_data['symbol'])
+            return True
+        except Exception as e:
+            logger.error("Failed to send signal to API: %s", e)
+            return False
+
+    async def send_signal_async(self, trade_result: Dict[str, Any]) -> bool:
+        """
+        Send trade signal without blocking the event loop
+
+        Use from async code (e.g. asyncio.create_task(client.send_signal_async(result))).
+        Sync callers keep using send_signal().
+
+        Args:
+            trade_result: Trade result dictionary from bot
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            signal_data = self._build_signal_data(trade_result)
+
+            if self._async_client is None:
+                self._async_client = httpx.AsyncClient(
+                    base_url=self.base_url,
+                    headers={"Content-Type": "application/json"},
+                    timeout=5.0
+                )
+
+            response = await self._async_client.post(
+                "/api/v1/trade/signal",
+                content=orjson.dumps(signal_data)
+            )
+            response.raise_for_status()
+            logger.info("Signal sent to API for %s", signal_data['symbol'])
             return True
         except Exception as e:
-            logger.error(f"Failed to send signal to API: {e}")
+            logger.error("Failed to send signal to API: %s", e)
             return False
 
+    async def aclose(self) -> None:
+        """Close the async HTTP client (if one was created)"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
@@ -1,14 +1,54 @@
 """API Routes for n8n Integration"""
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
+import platform
+import time
+
+import psutil
+
+# Prime psutil's CPU counters so /api/v1/system can read a non-blocking delta
+psutil.cpu_percent(interval=None)
+
+try:
+    from dashboard.bot_state_manager import BotStateManager, BotStatus
+except ImportError:
+    # Dashboard package not deployed next to the API: bot routes answer 503
+    BotStateManager = None
+    BotStatus = None
 
 router = APIRouter()
 
+# Shared for all requests. BotStateManager serializes state changes with its
+# own lock, so handlers need no extra locking (also safe with threadpool routes).
+_state_manager = BotStateManager() if BotStateManager is not None else None
+
+# [monotonic time of last refresh, cached ISO string] - shared by polled endpoints
+_ts_cache = [0.0, ""]
+_TS_TTL_SECONDS = 0.1
+
+
+def iso_now() -> str:
+    """UTC ISO timestamp, rebuilt at most every 100ms"""
+    now = time.monotonic()
+    if now - _ts_cache[0] > _TS_TTL_SECONDS:
+        _ts_cache[:] = [now, datetime.now(timezone.utc).isoformat()]
+    return _ts_cache[1]
+
+
+def _require_state_manager() -> None:
+    """Raise 503 if the dashboard state manager could not be imported"""
+    if _state_manager is None:
+        raise HTTPException(status_code=503, detail="Bot state manager not available")
+
+
 class TradeSignal(BaseModel):
     """Trade signal model"""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     symbol: str
     side: str
     price: float
@@ -22,12 +62,14 @@ class TradeSignal(BaseModel):
 
 class TradeExecute(BaseModel):
     """Trade execution model"""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     symbol: str
     side: str
     qty: float
     price: Optional[float] = None
 
-@router.post("/api/v1/trade/signal")
+@router.post("/api/v1/trade/signal", response_class=ORJSONResponse)
 async def post_trade_signal(signal: TradeSignal) -> Dict[str, Any]:
     """
     Receive trade signal from bot for n8n Discord notification
@@ -38,8 +80,8 @@ async def post_trade_signal(signal: TradeSignal) -> Dict[str, Any]:
     return {
         "success": True,
         "received": True,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "signal": signal.dict()
+        "timestamp": iso_now(),
+        "signal": signal.model_dump()
     }
 
 @router.post("/api/v1/trade/execute")
@@ -65,7 +107,7 @@ async def health_check() -> Dict[str, Any]:
         # Simple, fast health check without blocking operations
         health_result = {
             "status": "healthy",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": iso_now(),
             "checks": {
                 "api_server": {
                     "status": "healthy",
@@ -78,39 +120,35 @@ async def health_check() -> Dict[str, Any]:
         # Ensure we always return something, even on error
         return {
             "status": "unhealthy",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": iso_now(),
             "error": str(e)
         }
 
 @router.get("/api/v1/status")
 async def get_status() -> Dict[str, Any]:
     """Get bot status"""
-    from dashboard.bot_state_manager import BotStateManager
+    _require_state_manager()
 
     try:
-        state_manager = BotStateManager()
         return {
-            "status": state_manager.status.value,
-            "bot_status": state_manager.status.name,
-            "last_execution": state_manager.last_execution.isoformat() if state_manager.last_execution else None,
-            "uptime": state_manager.get_status().get("uptime"),
-            "start_time": state_manager.start_time.isoformat() if state_manager.start_time else None,
-            "error": state_manager.error_message,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "status": _state_manager.status.value,
+            "bot_status": _state_manager.status.name,
+            "last_execution": _state_manager.last_execution.isoformat() if _state_manager.last_execution else None,
+            "uptime": _state_manager.get_status().get("uptime"),
+            "start_time": _state_manager.start_time.isoformat() if _state_manager.start_time else None,
+            "error": _state_manager.error_message,
+            "timestamp": iso_now()
         }
     except Exception as e:
         return {
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": iso_now()
         }
 
 @router.get("/api/v1/system")
 async def system_info() -> Dict[str, Any]:
     """Get system information"""
-    import platform
-    import psutil
-
     try:
         return {
             "system": {
@@ -119,152 +157,147 @@ async def system_info() -> Dict[str, Any]:
                 "processor": platform.processor()
             },
             "resources": {
-                "cpu_percent": psutil.cpu_percent(interval=0.1),
+                "cpu_percent": psutil.cpu_percent(interval=None),
                 "memory_percent": psutil.virtual_memory().percent,
                 "disk_percent": psutil.disk_usage('/').percent
             },
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": iso_now()
         }
     except Exception as e:
         return {
             "error": str(e),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": iso_now()
         }
 
 @router.post("/api/v1/bot/start")
 async def start_bot() -> Dict[str, Any]:
     """Start the trading bot"""
-    from dashboard.bot_state_manager import BotStateManager, BotStatus
+    _require_state_manager()
 
     try:
-        state_manager = BotStateManager()
-        if state_manager.status == BotStatus.RUNNING:
+        if _state_manager.status == BotStatus.RUNNING:
             return {
                 "success": False,
                 "message": "Bot is already running",
-                "status": state_manager.status.value,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "status": _state_manager.status.value,
+                "timestamp": iso_now()
             }
 
-        state_manager.set_status(BotStatus.RUNNING)
+        _state_manager.set_status(BotStatus.RUNNING)
         return {
             "success": True,
             "message": "Bot started successfully",
-            "status": state_manager.status.value,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "status": _state_manager.status.value,
+            "timestamp": iso_now()
         }
     except Exception as e:
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": iso_now()
         }
 
 @router.post("/api/v1/bot/stop")
 async def stop_bot() -> Dict[str, Any]:
     """Stop the trading bot"""
-    from dashboard.bot_state_manager import BotStateManager, BotStatus
+    _require_state_manager()
 
     try:
-        state_manager = BotStateManager()
-        if state_manager.status == BotStatus.STOPPED:
+        if _state_manager.status == BotStatus.STOPPED:
             return {
                 "success": False,
                 "message": "Bot is already stopped",
-                "status": state_manager.status.value,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "status": _state_manager.status.value,
+                "timestamp": iso_now()
             }
 
-        state_manager.set_status(BotStatus.STOPPED)
+        _state_manager.set_status(BotStatus.STOPPED)
         return {
             "success": True,
             "message": "Bot stopped successfully",
-            "status": state_manager.status.value,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "status": _state_manager.status.value,
+            "timestamp": iso_now()
         }
     except Exception as e:
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": iso_now()
         }
 
 @router.post("/api/v1/bot/pause")
 async def pause_bot() -> Dict[str, Any]:
     """Pause the trading bot"""
-    from dashboard.bot_state_manager import BotStateManager, BotStatus
+    _require_state_manager()
 
     try:
-        state_manager = BotStateManager()
-        if state_manager.status != BotStatus.RUNNING:
+        if _state_manager.status != BotStatus.RUNNING:
             return {
                 "success": False,
                 "message": "Bot must be running to pause",
-                "status": state_manager.status.value,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "status": _state_manager.status.value,
+                "timestamp": iso_now()
             }
 
-        state_manager.pause_bot()
+        _state_manager.pause_bot()
         return {
             "success": True,
             "message": "Bot paused successfully",
-            "status": state_manager.status.value,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "status": _state_manager.status.value,
+            "timestamp": iso_now()
         }
     except Exception as e:
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": iso_now()
         }
 
 @router.post("/api/v1/bot/resume")
 async def resume_bot() -> Dict[str, Any]:
     """Resume the trading bot"""
-    from dashboard.bot_state_manager import BotStateManager, BotStatus
+    _require_state_manager()
 
     try:
-        state_manager = BotStateManager()
-        if state_manager.status != BotStatus.PAUSED:
+        if _state_manager.status != BotStatus.PAUSED:
             return {
                 "success": False,
                 "message": "Bot must be paused to resume",
-                "status": state_manager.status.value,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "status": _state_manager.status.value,
+                "timestamp": iso_now()
             }
 
-        state_manager.resume_bot()
+        _state_manager.resume_bot()
         return {
             "success": True,
             "message": "Bot resumed successfully",
-            "status": state_manager.status.value,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "status": _state_manager.status.value,
+            "timestamp": iso_now()
         }
     except Exception as e:
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": iso_now()
         }
 
 @router.post("/api/v1/bot/emergency-stop")
 async def emergency_stop() -> Dict[str, Any]:
     """Emergency stop - immediately halt bot operations"""
-    from dashboard.bot_state_manager import BotStateManager, BotStatus
+    _require_state_manager()
 
     try:
-        state_manager = BotStateManager()
-        state_manager.emergency_stop()
+        _state_manager.emergency_stop()
         return {
             "success": True,
             "message": "Emergency stop executed",
-            "status": state_manager.status.value,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "status": _state_manager.status.value,
+            "timestamp": iso_now()
         }
     except Exception as e:
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": iso_now()
         }
 
@@ -3,16 +3,26 @@
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
-from api.routes import router
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from api.routes import router, iso_now
 from dashboard.routes import router as dashboard_router
 import uvicorn
 from pathlib import Path
 import logging
+import os
+import orjson
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Crypto Trading Bot API", version="1.0.0")
+app = FastAPI(
+    title="Crypto Trading Bot API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
+
+# Constant / slowly changing bodies, encoded once instead of per request
+_INFO_BODY = orjson.dumps({"message": "Crypto Trading Bot API", "version": "1.0.0"})
+_health_body_cache = ["", b""]  # [timestamp the body was built for, encoded body]
 
 # Global Exception Handlers
 @app.exception_handler(HTTPException)
@@ -30,9 +40,8 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions and return JSON response"""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     # Check if we're in debug mode (via environment variable or app config)
-    import os
     debug_mode = os.getenv("DEBUG", "false").lower() == "true"
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -86,7 +95,7 @@ try:
     app.include_router(strategies_router)
     logger.info("Strategy management routes registered")
 except ImportError as e:
-    logger.warning(f"Strategy management routes not available: {e}")
+    logger.warning("Strategy management routes not available: %s", e)
 
 # Include settings management routes
 from dashboard.routes_settings import router as settings_router
@@ -108,26 +117,28 @@ dashboard_static = Path(__file__).parent.parent / "dashboard" / "static"
 if dashboard_static.exists():
     try:
         app.mount("/static", StaticFiles(directory=str(dashboard_static)), name="static")
-        logger.info(f"Static files mounted from: {dashboard_static}")
+        logger.info("Static files mounted from: %s", dashboard_static)
     except Exception as e:
-        logger.warning(f"Could not mount static files: {e}")
+        logger.warning("Could not mount static files: %s", e)
 
 # Root endpoint removed - dashboard router handles "/" route
 # If you need the API info, use /api/info or similar
 @app.get("/api/info")
 async def api_info():
     """API information endpoint"""
-    return {"message": "Crypto Trading Bot API", "version": "1.0.0"}
+    return Response(_INFO_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint - lightweight and fast"""
-    from datetime import datetime, timezone
-    return {
-        "status": "operational",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "message": "Health check endpoint available - use /api/v1/health for detailed checks"
-    }
+    timestamp = iso_now()
+    if _health_body_cache[0] != timestamp:
+        _health_body_cache[:] = [timestamp, orjson.dumps({
+            "status": "operational",
+            "timestamp": timestamp,
+            "message": "Health check endpoint available - use /api/v1/health for detailed checks"
+        })]
+    return Response(_health_body_cache[1], media_type="application/json")
 
 # Backward-compatible status route for dashboards expecting /api/bot/status
 @app.get("/api/bot/status")
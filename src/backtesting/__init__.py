@@ -2,10 +2,12 @@
 
 from .backtest_engine import BacktestEngine, BacktestPosition
 from .walk_forward import WalkForwardAnalysis
+from .parallel import run_backtests_parallel
 
 __all__ = [
     "BacktestEngine",
     "BacktestPosition",
-    "WalkForwardAnalysis"
+    "WalkForwardAnalysis",
+    "run_backtests_parallel"
 ]
 
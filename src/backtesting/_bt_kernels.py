@@ -0,0 +1,232 @@
+"""Numeric kernels for the backtest engine
+
+Open positions are kept as Structure-of-Arrays with the side encoded as
++1 (Buy) / -1 (Sell), so the checks below are plain arithmetic.
+Compiled with numba when it is installed (see utils.jit). Every kernel has
+an explicit signature, so it is compiled (or loaded from the on-disk
+cache) at import instead of on the first backtest bar.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from utils.jit import njit, NUMBA_AVAILABLE
+
+# Explicit signatures: eager compile + no type inference on first call
+CHECK_EXITS_SIG = "UniTuple(b1[::1], 2)(i1[:], f8[:], f8[:], f8)"
+SLIPPAGE_PCT_SIG = "f8(f8, f8, f8, b1, f8, f8, f8)"
+SCAN_EXITS_SIG = "i8(f8[:], i1[:], f8[:], f8[:], i8, i8)"
+PROCESS_BAR_EXITS_SIG = (
+    "Tuple((f8, i1[::1], f8[::1]))"
+    "(f8, i1[:], f8[:], f8[:], f8[:], f8[:], f8, b1, f8, f8, f8, f8, f8, f8)"
+)
+
+EXIT_NONE = 0
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+
+
+@njit(CHECK_EXITS_SIG, cache=True)
+def check_exits(
+    side_sign: np.ndarray,
+    stop_loss: np.ndarray,
+    take_profit: np.ndarray,
+    price: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stop-loss / take-profit flags for every open position
+
+    Stop loss wins if both levels are crossed (same priority as
+    BacktestPosition.check_exit).
+
+    Returns:
+        (hit_stop_loss, hit_take_profit) boolean arrays
+    """
+    n = side_sign.shape[0]
+    hit_sl = np.zeros(n, dtype=np.bool_)
+    hit_tp = np.zeros(n, dtype=np.bool_)
+    for j in range(n):
+        sl = side_sign[j] * (price - stop_loss[j]) <= 0.0
+        hit_sl[j] = sl
+        hit_tp[j] = (not sl) and side_sign[j] * (price - take_profit[j]) >= 0.0
+    return hit_sl, hit_tp
+
+
+@njit(SCAN_EXITS_SIG, cache=True)
+def scan_exits(
+    close: np.ndarray,
+    side_sign: np.ndarray,
+    stop_loss: np.ndarray,
+    take_profit: np.ndarray,
+    start: int,
+    end: int
+) -> int:
+    """
+    First bar in [start, end) at which any open position hits its stop loss or take profit
+
+    Same conditions as check_exits, swept over bars instead of a single price.
+
+    Returns:
+        Bar index, or end if no position exits in the range
+    """
+    n = side_sign.shape[0]
+    for i in range(start, end):
+        price = close[i]
+        for j in range(n):
+            s = side_sign[j]
+            if s * (price - stop_loss[j]) <= 0.0 or s * (price - take_profit[j]) >= 0.0:
+                return i
+    return end
+
+
+def scan_exits_blocked(
+    close: np.ndarray,
+    side_sign: np.ndarray,
+    stop_loss: np.ndarray,
+    take_profit: np.ndarray,
+    start: int,
+    end: int
+) -> int:
+    """
+    NumPy version of scan_exits, used without numba
+
+    Checks blocks of bars at once; blocks start small (most exits come
+    soon after entry) and double up to 4096 bars for long holds.
+    """
+    side = side_sign[:, None]
+    lo, block = start, 16
+    while lo < end:
+        prices = close[lo:min(lo + block, end)]
+        hit = (
+            (side * (prices - stop_loss[:, None]) <= 0.0)
+            | (side * (prices - take_profit[:, None]) >= 0.0)
+        ).any(axis=0)
+        if hit.any():
+            return lo + int(np.argmax(hit))
+        lo += block
+        block = min(block * 2, 4096)
+    return end
+
+
+@njit(SLIPPAGE_PCT_SIG, cache=True)
+def slippage_pct(
+    order_size_usd: float,
+    volume_24h_usd: float,
+    volatility: float,
+    is_buy: bool,
+    base_slippage_buy: float,
+    base_slippage_sell: float,
+    asset_adjustment: float
+) -> float:
+    """
+    Scalar SlippageModel.calculate_slippage as a fraction of price
+
+    0/NaN volume means "unknown" (0.05% impact); NaN volatility means no
+    volatility adjustment.
+    """
+    base = base_slippage_buy if is_buy else base_slippage_sell
+
+    if volume_24h_usd != volume_24h_usd or volume_24h_usd == 0.0:
+        impact = 0.0005
+    elif volume_24h_usd < 0.0:
+        impact = 0.002
+    else:
+        volume_pct = (order_size_usd / volume_24h_usd) * 100
+        if volume_pct < 0.1:
+            impact = 0.0001
+        elif volume_pct < 1.0:
+            impact = 0.0005
+        elif volume_pct < 5.0:
+            impact = 0.001
+        elif volume_pct < 10.0:
+            impact = 0.002
+        else:
+            impact = min(0.002 + (volume_pct - 10.0) * 0.00005, 0.01)
+        if not is_buy:
+            impact *= 1.1
+
+    volatility_adjustment = 1.0
+    if volatility > 0.05:
+        volatility_adjustment = 1.5
+    elif volatility > 0.03:
+        volatility_adjustment = 1.3
+    elif volatility > 0.02:
+        volatility_adjustment = 1.1
+
+    return (base + impact) * volatility_adjustment * asset_adjustment
+
+
+@njit(PROCESS_BAR_EXITS_SIG, cache=True)
+def process_bar_exits(
+    price: float,
+    side_sign: np.ndarray,
+    stop_loss: np.ndarray,
+    take_profit: np.ndarray,
+    entry_price: np.ndarray,
+    quantity: np.ndarray,
+    commission_rate: float,
+    use_slippage_model: bool,
+    slippage_rate: float,
+    base_slippage_buy: float,
+    base_slippage_sell: float,
+    asset_adjustment: float,
+    volume_24h_usd: float,
+    volatility: float
+) -> Tuple[float, np.ndarray, np.ndarray]:
+    """
+    Exit check, exit slippage and net PnL for all open positions in one pass
+
+    Same arithmetic as check_exits + BacktestEngine.simulate_order +
+    BacktestPosition.close.
+
+    Returns:
+        (summed net PnL of closed positions,
+         exit code per position (EXIT_NONE / EXIT_STOP_LOSS / EXIT_TAKE_PROFIT),
+         exit price per position (0.0 where not closed))
+    """
+    n = side_sign.shape[0]
+    exit_code = np.zeros(n, dtype=np.int8)
+    exit_price = np.zeros(n, dtype=np.float64)
+    pnl_total = 0.0
+    for j in range(n):
+        s = side_sign[j]
+        if s * (price - stop_loss[j]) <= 0.0:
+            exit_code[j] = EXIT_STOP_LOSS
+        elif s * (price - take_profit[j]) >= 0.0:
+            exit_code[j] = EXIT_TAKE_PROFIT
+        else:
+            continue
+
+        # Closing order goes the other way
+        exit_is_buy = s < 0
+        if use_slippage_model:
+            slippage = price * slippage_pct(
+                quantity[j] * price, volume_24h_usd, volatility, exit_is_buy,
+                base_slippage_buy, base_slippage_sell, asset_adjustment
+            )
+            px = price + slippage if exit_is_buy else price - slippage
+        else:
+            px = price * (1 + slippage_rate) if exit_is_buy else price * (1 - slippage_rate)
+        exit_price[j] = px
+
+        gross_pnl = (s * (px - entry_price[j])) * quantity[j]
+        entry_commission = entry_price[j] * quantity[j] * commission_rate
+        exit_commission = px * quantity[j] * commission_rate
+        pnl_total += gross_pnl - (entry_commission + exit_commission)
+    return pnl_total, exit_code, exit_price
+
+
+def warmup() -> None:
+    """Run every kernel once on tiny inputs so dispatch and cache are ready"""
+    side = np.ones(1, dtype=np.int8)
+    level = np.zeros(1, dtype=np.float64)
+    check_exits(side, level, level, 1.0)
+    scan_exits(level, side, level, level, 0, 1)
+    slippage_pct(1.0, 1.0, 0.0, True, 0.0001, 0.0001, 1.0)
+    process_bar_exits(1.0, side, level, level, level, level, 0.001, True, 0.0002,
+                      0.0001, 0.0001, 1.0, 1.0, 0.0)
+
+
+if NUMBA_AVAILABLE:
+    warmup()
@@ -2,8 +2,11 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime, timedelta
+from collections import OrderedDict
+import hashlib
+import json
 import logging
 
 from data.database import Database
@@ -13,9 +16,83 @@ from trading.strategies import Strategies
 from trading.risk_manager import RiskManager
 from trading.slippage_model import SlippageModel
 from trading.bot import TradingBot
+from backtesting._bt_kernels import (
+    check_exits, process_bar_exits, scan_exits, scan_exits_blocked, EXIT_STOP_LOSS
+)
+from utils.jit import NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+OHLCV_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+WINDOW_24H = 1440  # Approximate last 24h on 1m data
+MAX_OPEN_POSITIONS = 16
+MIN_BAR_VOLUME = 0.0  # Bars at or below this volume are not traded
+
+# prepare_data results shared across runs (parameter sweeps, walk-forward),
+# keyed by (symbol, klines content hash, indicator config); LRU-bounded
+_IND_CACHE: "OrderedDict[Tuple[str, bytes, str], pd.DataFrame]" = OrderedDict()
+_IND_CACHE_SIZE = 16
+
+
+def _klines_digest(klines: pd.DataFrame) -> bytes:
+    """Content hash of a klines frame (values, index and column names)"""
+    row_hashes = pd.util.hash_pandas_object(klines, index=True).to_numpy()
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+    digest.update(repr(tuple(klines.columns)).encode())
+    return digest.digest()
+
+# Open-position record; side is +1 (Buy) / -1 (Sell), time is epoch ns
+OPEN_POSITION_DTYPE = np.dtype([
+    ('side', 'i1'),
+    ('sl', 'f8'),
+    ('tp', 'f8'),
+    ('entry', 'f8'),
+    ('qty', 'f8'),
+    ('id', 'i8'),
+    ('time', 'i8')
+])
+
+
+def rolling_market_stats(
+    close: np.ndarray,
+    volume: np.ndarray,
+    window: int = WINDOW_24H
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Trailing notional volume and return volatility for every bar
+    
+    Bar i covers bars [i - window, i], i.e. `window` returns.
+    
+    Args:
+        close: Close prices
+        volume: Volumes (base units)
+        window: Lookback in bars
+        
+    Returns:
+        (notional volume per bar, std of returns per bar - NaN until 2 returns exist)
+    """
+    n = len(close)
+    cum = np.concatenate(([0.0], np.cumsum(close * volume)))
+    idx = np.arange(n)
+    notional = cum[idx + 1] - cum[np.maximum(0, idx - window)]
+    
+    # Sample std (ddof=1) of returns[i - window : i] from running sums of r and r^2;
+    # centering on the global mean keeps the sums small (variance is shift-invariant)
+    volatility = np.full(n, np.nan)
+    if n > 2:
+        returns = np.diff(close) / close[:-1]
+        returns -= returns.mean()
+        cum1 = np.concatenate(([0.0], np.cumsum(returns)))
+        cum2 = np.concatenate(([0.0], np.cumsum(returns * returns)))
+        hi = idx[2:]
+        lo = np.maximum(0, hi - window)
+        count = hi - lo
+        s1 = cum1[hi] - cum1[lo]
+        s2 = cum2[hi] - cum2[lo]
+        variance = np.maximum((s2 - s1 * s1 / count) / (count - 1), 0.0)
+        volatility[2:] = np.sqrt(variance)
+    return notional, volatility
+
 
 class BacktestPosition:
     """Represents a position during backtesting"""
@@ -24,7 +101,7 @@ class BacktestPosition:
         self,
         trade_id: int,
         symbol: str,
-        side: str,
+        side: Union[str, int],
         entry_price: float,
         quantity: float,
         entry_time: datetime,
@@ -34,7 +111,11 @@ class BacktestPosition:
     ):
         self.trade_id = trade_id
         self.symbol = symbol
-        self.side = side
+        # "Buy"/"Sell" or +1/-1; stored as sign so PnL and exits are arithmetic
+        if isinstance(side, str):
+            self.side_sign = 1 if side == "Buy" else -1
+        else:
+            self.side_sign = 1 if side > 0 else -1
         self.entry_price = entry_price
         self.quantity = quantity
         self.entry_time = entry_time
@@ -45,6 +126,11 @@ class BacktestPosition:
         self.exit_time: Optional[datetime] = None
         self.exit_reason: Optional[str] = None
         self.realized_pnl: Optional[float] = None
+    
+    @property
+    def side(self) -> str:
+        """Order side ("Buy" or "Sell")"""
+        return "Buy" if self.side_sign > 0 else "Sell"
         
     def close(self, exit_price: float, exit_time: datetime, exit_reason: str) -> None:
         """Close the position and calculate PnL"""
@@ -53,10 +139,7 @@ class BacktestPosition:
         self.exit_reason = exit_reason
         
         # Calculate PnL
-        if self.side == "Buy":
-            price_diff = exit_price - self.entry_price
-        else:  # Sell
-            price_diff = self.entry_price - exit_price
+        price_diff = self.side_sign * (exit_price - self.entry_price)
         
         # Gross PnL
         gross_pnl = price_diff * self.quantity
@@ -71,16 +154,10 @@ class BacktestPosition:
     
     def check_exit(self, current_price: float, current_time: datetime) -> Optional[str]:
         """Check if exit conditions are met"""
-        if self.side == "Buy":
-            if current_price <= self.stop_loss:
-                return "Stop Loss"
-            elif current_price >= self.take_profit:
-                return "Take Profit"
-        else:  # Sell
-            if current_price >= self.stop_loss:
-                return "Stop Loss"
-            elif current_price <= self.take_profit:
-                return "Take Profit"
+        if self.side_sign * (current_price - self.stop_loss) <= 0:
+            return "Stop Loss"
+        if self.side_sign * (current_price - self.take_profit) >= 0:
+            return "Take Profit"
         return None
 
 
@@ -120,21 +197,163 @@ class BacktestEngine:
         
         # Backtest state
         self.equity = initial_equity
-        self.positions: Dict[int, BacktestPosition] = {}
+        self._open = np.zeros(MAX_OPEN_POSITIONS, dtype=OPEN_POSITION_DTYPE)
+        self._n_open = 0
+        self._symbol = ""
         self.closed_trades: List[BacktestPosition] = []
         self.trade_id_counter = 1
-        self.equity_history: List[Tuple[datetime, float]] = []
+        # Equity at the start of every bar, aligned with _equity_times (epoch ns)
+        self._equity_arr = np.empty(0, dtype=np.float64)
+        self._equity_times = np.empty(0, dtype=np.int64)
+    
+    def _add_open_position(
+        self,
+        trade_id: int,
+        side_sign: int,
+        entry_price: float,
+        quantity: float,
+        entry_time: int,
+        stop_loss: float,
+        take_profit: float
+    ) -> None:
+        """Append a position to the fixed-capacity open-position records"""
+        j = self._n_open
+        if j >= MAX_OPEN_POSITIONS:
+            raise RuntimeError(f"More than {MAX_OPEN_POSITIONS} open backtest positions")
+        self._open[j] = (side_sign, stop_loss, take_profit, entry_price, quantity, trade_id, entry_time)
+        self._n_open = j + 1
     
-    def prepare_data(self, klines: pd.DataFrame) -> pd.DataFrame:
+    def _materialize_position(self, j: int) -> BacktestPosition:
+        """Build a BacktestPosition object from open slot j"""
+        record = self._open[j]
+        return BacktestPosition(
+            trade_id=int(record['id']),
+            symbol=self._symbol,
+            side=int(record['side']),
+            entry_price=float(record['entry']),
+            quantity=float(record['qty']),
+            entry_time=pd.Timestamp(record['time']),
+            stop_loss=float(record['sl']),
+            take_profit=float(record['tp']),
+            commission_rate=self.commission_rate
+        )
+    
+    def _close_open_position(
+        self,
+        j: int,
+        exit_price: float,
+        exit_time: datetime,
+        exit_reason: str
+    ) -> BacktestPosition:
+        """Close slot j, move the last open slot into its place and return the closed position"""
+        position = self._materialize_position(j)
+        position.close(exit_price, exit_time, exit_reason)
+        
+        last = self._n_open - 1
+        if j != last:
+            self._open[j] = self._open[last]
+        self._n_open = last
+        return position
+    
+    def _process_bar_exits(
+        self,
+        price: float,
+        time_ns: int,
+        volume_24h_usd: float,
+        volatility: float
+    ) -> None:
+        """Close every open position whose stop loss / take profit is hit at this bar"""
+        open_positions = self._open[:self._n_open]
+        exit_time = pd.Timestamp(time_ns)
+        
+        # Fused kernel whenever slippage is the fixed rate or the stock model;
+        # a custom slippage model keeps going through simulate_order_batch
+        use_model = bool(self.use_dynamic_slippage and self.slippage_model)
+        if not use_model or type(self.slippage_model) is SlippageModel:
+            model = self.slippage_model if use_model else None
+            pnl_total, exit_code, exit_prices = process_bar_exits(
+                float(price),
+                open_positions['side'],
+                open_positions['sl'],
+                open_positions['tp'],
+                open_positions['entry'],
+                open_positions['qty'],
+                self.commission_rate,
+                use_model,
+                self.slippage_rate,
+                model.base_slippage_buy if model else 0.0,
+                model.base_slippage_sell if model else 0.0,
+                1.0,  # linear contracts
+                float(volume_24h_usd),
+                float(volatility)
+            )
+            # Descending, so moving the last slot into a closed one never skips a hit
+            for j in np.flatnonzero(exit_code)[::-1]:
+                exit_reason = "Stop Loss" if exit_code[j] == EXIT_STOP_LOSS else "Take Profit"
+                self.closed_trades.append(
+                    self._close_open_position(j, float(exit_prices[j]), exit_time, exit_reason)
+                )
+            self.equity += pnl_total
+            return
+        
+        hit_sl, hit_tp = check_exits(
+            open_positions['side'],
+            open_positions['sl'],
+            open_positions['tp'],
+            price
+        )
+        exit_idx = np.flatnonzero(hit_sl | hit_tp)[::-1]
+        if not len(exit_idx):
+            return
+        exit_prices = self.simulate_order_batch(
+            np.full(len(exit_idx), price),
+            -open_positions['side'][exit_idx],
+            open_positions['qty'][exit_idx],
+            volume_24h_usd=volume_24h_usd,
+            volatility=volatility
+        )
+        for j, exit_price in zip(exit_idx, exit_prices):
+            exit_reason = "Stop Loss" if hit_sl[j] else "Take Profit"
+            position = self._close_open_position(j, float(exit_price), exit_time, exit_reason)
+            self.closed_trades.append(position)
+            if position.realized_pnl:
+                self.equity += position.realized_pnl
+    
+    @property
+    def equity_history(self) -> List[Tuple[Any, float]]:
+        """(timestamp, equity) pairs of the last run"""
+        return list(zip(pd.to_datetime(self._equity_times), self._equity_arr.tolist()))
+    
+    @property
+    def positions(self) -> Dict[int, BacktestPosition]:
+        """Currently open positions (built on demand from the open arrays)"""
+        return {int(self._open['id'][j]): self._materialize_position(j) for j in range(self._n_open)}
+    
+    def prepare_data(self, klines: pd.DataFrame, symbol: str = "") -> pd.DataFrame:
         """
         Prepare historical data for backtesting
         
+        Identical klines (same symbol and indicator config) are served from
+        a module-level LRU cache instead of recomputing the indicators.
+        
         Args:
             klines: DataFrame with OHLCV data (columns: timestamp, open, high, low, close, volume)
+            symbol: Trading symbol (part of the cache key)
             
         Returns:
             DataFrame with indicators added
         """
+        cache_key = (
+            symbol,
+            _klines_digest(klines),
+            json.dumps(self.config.get('indicators', {}), sort_keys=True, default=str)
+        )
+        cached = _IND_CACHE.get(cache_key)
+        if cached is not None:
+            _IND_CACHE.move_to_end(cache_key)
+            # Shallow copy: callers may add/drop columns without touching the cache
+            return cached.copy(deep=False)
+        
         df = klines.copy()
         
         # Ensure proper column names
@@ -147,14 +366,34 @@ class BacktestEngine:
         # Calculate indicators
         indicators_dict = self.indicators_calc.calculate_all(df)
         
-        # Add indicators to dataframe
+        # Add indicators to dataframe in one concat (per-column assignment
+        # re-consolidates the frame every time). Indicators (RSI/ATR/EMA levels)
+        # only need float32, which halves the bytes the loop and kernels stream;
+        # OHLCV stays float64 for PnL precision.
+        n = len(df)
+        indicator_columns: Dict[str, np.ndarray] = {}
         for key, value in indicators_dict.items():
             if isinstance(value, (int, float)):
-                df[key] = value
+                indicator_columns[key] = np.full(n, value, dtype=np.float32)
             elif isinstance(value, pd.Series):
-                df[key] = value.values if len(value) == len(df) else value.iloc[-1]
+                if len(value) == n:
+                    indicator_columns[key] = value.to_numpy(dtype=np.float32)
+                else:
+                    indicator_columns[key] = np.full(n, value.iloc[-1], dtype=np.float32)
+        
+        if indicator_columns:
+            df = pd.concat(
+                [
+                    df.drop(columns=[c for c in indicator_columns if c in df.columns]),
+                    pd.DataFrame(indicator_columns, index=df.index)
+                ],
+                axis=1
+            )
         
-        return df
+        _IND_CACHE[cache_key] = df
+        if len(_IND_CACHE) > _IND_CACHE_SIZE:
+            _IND_CACHE.popitem(last=False)
+        return df.copy(deep=False)
     
     def simulate_order(
         self,
@@ -197,6 +436,46 @@ class BacktestEngine:
             return price * (1 + self.slippage_rate)
         return price * (1 - self.slippage_rate)
     
+    def simulate_order_batch(
+        self,
+        prices: np.ndarray,
+        side_signs: np.ndarray,
+        quantities: np.ndarray,
+        volume_24h_usd: Optional[float] = None,
+        volatility: Optional[float] = None,
+        asset_type: str = "linear"
+    ) -> np.ndarray:
+        """
+        Vectorized simulate_order for several orders of the same bar
+        
+        Args:
+            prices: Target prices
+            side_signs: +1 for Buy, -1 for Sell
+            quantities: Order quantities
+            volume_24h_usd: Estimated 24h notional volume (scalar or per order)
+            volatility: Estimated volatility (scalar or per order)
+            asset_type: Instrument type (default linear)
+            
+        Returns:
+            Executed prices (with slippage)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        side_signs = np.asarray(side_signs, dtype=np.float64)
+        
+        if self.use_dynamic_slippage and self.slippage_model:
+            slippage = self.slippage_model.calculate_slippage_vec(
+                price=prices,
+                order_size_usd=np.asarray(quantities, dtype=np.float64) * prices,
+                side_sign=side_signs,
+                volatility=volatility,
+                volume_24h_usd=volume_24h_usd,
+                asset_type=asset_type
+            )
+            return prices + side_signs * slippage
+        
+        # Fallback fixed slippage
+        return prices * (1 + side_signs * self.slippage_rate)
+    
     def calculate_position_size(
         self,
         equity: float,
@@ -248,103 +527,94 @@ class BacktestEngine:
             Backtest results dictionary
         """
         # Prepare data
-        df = self.prepare_data(klines)
+        df = self.prepare_data(klines, symbol)
         
-        # Filter by date range if provided
-        if start_date:
-            df = df[df['timestamp'] >= start_date]
-        if end_date:
-            df = df[df['timestamp'] <= end_date]
+        # Filter by date range if provided (df is sorted: binary search + one slice)
+        if start_date or end_date:
+            ts = df['timestamp'].to_numpy(dtype='datetime64[ns]')
+            lo = np.searchsorted(ts, pd.Timestamp(start_date).to_datetime64(), side='left') if start_date else 0
+            hi = np.searchsorted(ts, pd.Timestamp(end_date).to_datetime64(), side='right') if end_date else len(ts)
+            df = df.iloc[lo:hi].reset_index(drop=True)
         
         # Reset state
         self.equity = self.initial_equity
-        self.positions = {}
+        self._n_open = 0
+        self._symbol = symbol
         self.closed_trades = []
         self.trade_id_counter = 1
-        self.equity_history = [(df.iloc[0]['timestamp'], self.initial_equity)]
+        
+        # Pull every column the loop needs out of pandas once
+        close_arr = df['close'].to_numpy(np.float64)
+        volume_arr = df['volume'].to_numpy(np.float64)
+        # Epoch-ns int64; Timestamps are only built for entries/exits
+        ts_arr = df['timestamp'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+        atr_arr = df['atr'].to_numpy(np.float64) if 'atr' in df.columns else None
+        
+        vol24_arr, volat_arr = rolling_market_stats(close_arr, volume_arr, WINDOW_24H)
+        
+        # Cheap per-bar precheck: no entries on empty or broken bars
+        tradable = (volume_arr > MIN_BAR_VOLUME) & (close_arr > 0)
+        
+        # Regime + strategy signals depend only on history, not on positions:
+        # evaluate them for all tradable bars up front, the loop just looks them up
+        sig_side, sig_conf = self.strategies.precompute_signals(
+            df, min_confidence=0.6, start=50, mask=tradable
+        )
+        
+        n = len(df)
+        self._equity_arr = np.full(n, self.initial_equity, dtype=np.float64)
+        self._equity_times = ts_arr
+        
+        # Multi-bar exit sweep: compiled loop with numba, blocked NumPy otherwise
+        find_exit_bar = scan_exits if NUMBA_AVAILABLE else scan_exits_blocked
+        next_bar = 50
         
         # Iterate through data
-        for i in range(50, len(df)):  # Start at 50 to have enough data for indicators
-            current_row = df.iloc[i]
-            current_time = current_row['timestamp']
-            current_price = current_row['close']
-            window_start = max(0, i - 1440)  # Approximate last 24h on 1m data
-            window_df = df.iloc[window_start:i+1]
-            volume_24h_usd = float((window_df['volume'] * window_df['close']).sum()) if not window_df.empty else None
-            volatility = float(window_df['close'].pct_change().std()) if len(window_df) > 1 else None
+        for i in range(50, n):  # Start at 50 to have enough data for indicators
+            # Bars already covered by the exit sweep below
+            if i < next_bar:
+                continue
+            
+            current_time_ns = ts_arr[i]
+            current_price = close_arr[i]
+            volume_24h_usd = float(vol24_arr[i])
+            volatility = float(volat_arr[i])
             
             # Update equity history
-            self.equity_history.append((current_time, self.equity))
+            self._equity_arr[i] = self.equity
             
             # Check existing positions for exits
-            positions_to_close = []
-            for trade_id, position in list(self.positions.items()):
-                exit_reason = position.check_exit(current_price, current_time)
-                if exit_reason:
-                    # Execute exit with slippage
-                    exit_price = self.simulate_order(
-                        position.symbol,
-                        "Sell" if position.side == "Buy" else "Buy",
-                        current_price,
-                        position.quantity,
-                        volume_24h_usd=volume_24h_usd,
-                        volatility=volatility
-                    )
-                    position.close(exit_price, current_time, exit_reason)
-                    positions_to_close.append(trade_id)
-            
-            # Close positions
-            for trade_id in positions_to_close:
-                position = self.positions.pop(trade_id)
-                self.closed_trades.append(position)
-                # Update equity
-                if position.realized_pnl:
-                    self.equity += position.realized_pnl
+            if self._n_open:
+                self._process_bar_exits(current_price, current_time_ns, volume_24h_usd, volatility)
             
             # Skip if we already have open position (simple strategy: one position at a time)
-            if self.positions:
+            if self._n_open:
+                # Nothing changes until one of them exits: jump to that bar
+                open_positions = self._open[:self._n_open]
+                exit_bar = find_exit_bar(
+                    close_arr, open_positions['side'], open_positions['sl'], open_positions['tp'], i + 1, n
+                )
+                self._equity_arr[i + 1:exit_bar] = self.equity
+                next_bar = exit_bar
                 continue
             
-            # Get indicators for current row
-            indicators = {}
-            for col in df.columns:
-                if col not in ['timestamp', 'open', 'high', 'low', 'close', 'volume']:
-                    indicators[col] = current_row.get(col, 0)
-            
-            # Detect regime
-            regime = self.regime_detector.detect_regime(indicators, current_price)
-            
-            # Run strategies
-            candles_m1 = df.iloc[:i+1]
-            candles_m5 = candles_m1  # For simplified backtest reuse same data
-            candles_m15 = candles_m1
-            strategy_signals = self.strategies.run_all_strategies(
-                indicators=indicators,
-                regime=regime,
-                price=current_price,
-                candles_m1=candles_m1,
-                candles_m5=candles_m5,
-                candles_m15=candles_m15
-            )
-            
-            # Simple ensemble decision (take first signal with confidence > 0.6)
-            signal = None
-            for strat_signal in strategy_signals:
-                if strat_signal and strat_signal.get('confidence', 0) > 0.6:
-                    signal = strat_signal
-                    break
+            # Nothing left to risk, or bar not tradable
+            if self.equity <= 0 or not tradable[i]:
+                continue
             
-            if not signal:
+            # Simple ensemble decision (first signal with confidence > 0.6, precomputed)
+            if not sig_side[i]:
                 continue
+            side = "Buy" if sig_side[i] > 0 else "Sell"
             
             # Calculate position size
-            atr = indicators.get('atr', current_price * 0.02)  # Fallback ATR
+            atr = atr_arr[i] if atr_arr is not None else current_price * 0.02  # Fallback ATR
             position_data = self.calculate_position_size(
                 equity=self.equity,
                 price=current_price,
                 atr=atr,
-                side=signal['side'],
-                confidence=signal.get('confidence', 0.7)
+                side=side,
+                confidence=float(sig_conf[i])
             )
             
             if not position_data:
@@ -353,7 +623,7 @@ class BacktestEngine:
             # Simulate entry order
             entry_price = self.simulate_order(
                 symbol,
-                signal['side'],
+                side,
                 current_price,
                 position_data['qty'],
                 volume_24h_usd=volume_24h_usd,
@@ -361,19 +631,15 @@ class BacktestEngine:
             )
             
             # Create position
-            position = BacktestPosition(
+            self._add_open_position(
                 trade_id=self.trade_id_counter,
-                symbol=symbol,
-                side=signal['side'],
+                side_sign=int(sig_side[i]),
                 entry_price=entry_price,
                 quantity=position_data['qty'],
-                entry_time=current_time,
+                entry_time=current_time_ns,
                 stop_loss=position_data['stopLoss'],
-                take_profit=position_data['takeProfit'],
-                commission_rate=self.commission_rate
+                take_profit=position_data['takeProfit']
             )
-            
-            self.positions[self.trade_id_counter] = position
             self.trade_id_counter += 1
             
             # Deduct commission from equity
@@ -381,21 +647,20 @@ class BacktestEngine:
             self.equity -= entry_commission
         
         # Close any remaining positions at end
-        final_price = df.iloc[-1]['close']
-        final_time = df.iloc[-1]['timestamp']
-        final_window = df.iloc[max(0, len(df) - 1440):]
-        final_volume_24h_usd = float((final_window['volume'] * final_window['close']).sum()) if not final_window.empty else None
-        final_volatility = float(final_window['close'].pct_change().std()) if len(final_window) > 1 else None
-        for trade_id, position in list(self.positions.items()):
-            exit_price = self.simulate_order(
-                position.symbol,
-                "Sell" if position.side == "Buy" else "Buy",
-                final_price,
-                position.quantity,
-                volume_24h_usd=final_volume_24h_usd,
-                volatility=final_volatility
-            )
-            position.close(exit_price, final_time, "End of Backtest")
+        final_price = float(close_arr[-1])
+        final_time = pd.Timestamp(ts_arr[-1])
+        final_volume_24h_usd = float(vol24_arr[-1])
+        final_volatility = float(volat_arr[-1])
+        open_positions = self._open[:self._n_open]
+        exit_prices = self.simulate_order_batch(
+            np.full(self._n_open, final_price),
+            -open_positions['side'],
+            open_positions['qty'],
+            volume_24h_usd=final_volume_24h_usd,
+            volatility=final_volatility
+        )
+        for j in range(self._n_open - 1, -1, -1):
+            position = self._close_open_position(j, float(exit_prices[j]), final_time, "End of Backtest")
             self.closed_trades.append(position)
             if position.realized_pnl:
                 self.equity += position.realized_pnl
@@ -403,6 +668,45 @@ class BacktestEngine:
         # Calculate metrics
         return self.calculate_metrics()
     
+    def run_backtests(
+        self,
+        klines_map: Dict[str, pd.DataFrame],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run independent backtests for several symbols in parallel processes
+        
+        Each worker builds its own engine with this engine's settings;
+        this instance's state is not touched.
+        
+        Args:
+            klines_map: Symbol -> historical kline data
+            start_date: Start date (optional)
+            end_date: End date (optional)
+            max_workers: Worker processes (default: CPU count)
+            timeout: Seconds to wait for all symbols (optional)
+            
+        Returns:
+            Symbol -> backtest results dictionary
+        """
+        from backtesting.parallel import run_backtests_parallel
+        
+        return run_backtests_parallel(
+            self.config,
+            klines_map,
+            start_date=start_date,
+            end_date=end_date,
+            max_workers=max_workers,
+            timeout=timeout,
+            initial_equity=self.initial_equity,
+            commission_rate=self.commission_rate,
+            slippage_rate=self.slippage_rate,
+            use_dynamic_slippage=self.use_dynamic_slippage
+        )
+    
     def calculate_metrics(self) -> Dict[str, Any]:
         """Calculate performance metrics from backtest results"""
         if not self.closed_trades:
@@ -415,59 +719,58 @@ class BacktestEngine:
                 "profit_factor": 0.0
             }
         
-        # Basic stats
+        # Basic stats (one PnL array, None counted as 0 like before)
         total_trades = len(self.closed_trades)
-        winning_trades = [t for t in self.closed_trades if t.realized_pnl and t.realized_pnl > 0]
-        losing_trades = [t for t in self.closed_trades if t.realized_pnl and t.realized_pnl <= 0]
+        pnl = np.fromiter(
+            (t.realized_pnl or 0.0 for t in self.closed_trades),
+            dtype=np.float64,
+            count=total_trades
+        )
+        wins = pnl[pnl > 0]
+        losses = pnl[pnl < 0]
         
-        win_rate = len(winning_trades) / total_trades if total_trades > 0 else 0.0
+        win_rate = len(wins) / total_trades if total_trades > 0 else 0.0
         
-        total_pnl = sum(t.realized_pnl for t in self.closed_trades if t.realized_pnl)
-        gross_profit = sum(t.realized_pnl for t in winning_trades if t.realized_pnl)
-        gross_loss = abs(sum(t.realized_pnl for t in losing_trades if t.realized_pnl))
+        total_pnl = float(pnl.sum())
+        gross_profit = float(wins.sum())
+        gross_loss = float(-losses.sum())
         
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else (gross_profit if gross_profit > 0 else 0.0)
         
         # Calculate Sharpe Ratio (simplified)
-        if len(self.closed_trades) > 1:
-            returns = [t.realized_pnl / self.initial_equity for t in self.closed_trades if t.realized_pnl]
-            if returns:
-                mean_return = np.mean(returns)
-                std_return = np.std(returns)
-                sharpe_ratio = (mean_return / std_return * np.sqrt(252)) if std_return > 0 else 0.0
-            else:
-                sharpe_ratio = 0.0
-        else:
-            sharpe_ratio = 0.0
+        sharpe_ratio = 0.0
+        if total_trades > 1:
+            returns = pnl[pnl != 0] / self.initial_equity
+            if len(returns):
+                std_return = returns.std()
+                if std_return > 0:
+                    sharpe_ratio = float(returns.mean() / std_return * np.sqrt(252))
         
         # Calculate Max Drawdown
-        equity_values = [eq for _, eq in self.equity_history]
-        if equity_values:
-            peak = equity_values[0]
-            max_drawdown = 0.0
-            for equity in equity_values:
-                if equity > peak:
-                    peak = equity
-                drawdown = (peak - equity) / peak if peak > 0 else 0.0
-                if drawdown > max_drawdown:
-                    max_drawdown = drawdown
-        else:
-            max_drawdown = 0.0
+        max_drawdown = 0.0
+        if len(self._equity_arr):
+            equity_values = self._equity_arr
+            peaks = np.maximum.accumulate(equity_values)
+            drawdowns = np.divide(
+                peaks - equity_values, peaks,
+                out=np.zeros_like(equity_values), where=peaks > 0
+            )
+            max_drawdown = float(drawdowns.max())
         
         return {
             "total_trades": total_trades,
-            "winning_trades": len(winning_trades),
-            "losing_trades": len(losing_trades),
+            "winning_trades": len(wins),
+            "losing_trades": len(losses),
             "win_rate": round(win_rate * 100, 2),
             "total_pnl": round(total_pnl, 2),
-            "final_equity": round(self.equity, 2),
-            "return_pct": round((self.equity - self.initial_equity) / self.initial_equity * 100, 2),
+            "final_equity": round(float(self.equity), 2),
+            "return_pct": round(float(self.equity - self.initial_equity) / self.initial_equity * 100, 2),
             "sharpe_ratio": round(sharpe_ratio, 2),
             "max_drawdown": round(max_drawdown * 100, 2),
             "profit_factor": round(profit_factor, 2),
-            "average_win": round(np.mean([t.realized_pnl for t in winning_trades if t.realized_pnl]), 2) if winning_trades else 0.0,
-            "average_loss": round(np.mean([t.realized_pnl for t in losing_trades if t.realized_pnl]), 2) if losing_trades else 0.0,
-            "largest_win": round(max([t.realized_pnl for t in winning_trades if t.realized_pnl]), 2) if winning_trades else 0.0,
-            "largest_loss": round(min([t.realized_pnl for t in losing_trades if t.realized_pnl]), 2) if losing_trades else 0.0
+            "average_win": round(float(wins.mean()), 2) if len(wins) else 0.0,
+            "average_loss": round(float(losses.mean()), 2) if len(losses) else 0.0,
+            "largest_win": round(float(wins.max()), 2) if len(wins) else 0.0,
+            "largest_loss": round(float(losses.min()), 2) if len(losses) else 0.0
         }
 
@@ -1,9 +1,10 @@
 """Event-Based Backtesting Engine"""
 
 import logging
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from decimal import Decimal
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 
 from events.event import BaseEvent
@@ -13,13 +14,14 @@ from events.risk_approval_event import RiskApprovalEvent
 from events.order_intent_event import OrderIntentEvent
 from events.fill_event import FillEvent
 from events.position_update_event import PositionUpdateEvent
-from core.trading_state import TradingState
+from core.trading_state import Position, TradingState
 from core.risk_engine import RiskEngine
 from core.strategy_allocator import StrategyAllocator
 from core.order_executor import OrderExecutor
 from strategies.base import BaseStrategy
 from trading.indicators import Indicators
 from trading.slippage_model import SlippageModel
+from backtesting._bt_kernels import check_exits
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +67,8 @@ class EventBacktest:
         # Backtest settings
         self.maker_fee = Decimal(str(self.config.get("makerFee", 0.001)))  # 0.1%
         self.taker_fee = Decimal(str(self.config.get("takerFee", 0.001)))  # 0.1%
+        # The bar loop works in float; Decimal is only used at the TradingState boundary
+        self._taker_fee_f = float(self.taker_fee)
         self.slippage_model = SlippageModel()
         self.latency_ms = self.config.get("latencyMs", 50)  # 50ms latency
         self.order_rejection_rate = self.config.get("orderRejectionRate", 0.01)  # 1%
@@ -107,7 +111,7 @@ class EventBacktest:
             Backtest results dictionary
         """
         # Initialize components
-        self.trading_state = TradingState(initial_cash=self.initial_equity)
+        self.trading_state = TradingState(initial_cash=Decimal(str(self.initial_equity)))
         self.trading_state.enable_trading()
         
         risk_config_full = {"risk": risk_config, "circuitBreaker": {}, "trading": {"leverage": 10}}
@@ -116,12 +120,30 @@ class EventBacktest:
         self.order_executor = OrderExecutor(self.trading_state, None, "PAPER", risk_config_full)
         self.strategies = strategies
         
+        # Parse timestamps once; date filter, sort and bar loop all reuse the datetime column
+        historical_data = historical_data.assign(timestamp=pd.to_datetime(historical_data["timestamp"]))
+        
         # Filter data by date range
         if start_date or end_date:
             historical_data = self._filter_data_by_date(historical_data, start_date, end_date)
         
-        # Sort by timestamp
-        historical_data = historical_data.sort_values("timestamp").reset_index(drop=True)
+        # Sort by timestamp (skipped for already sorted input, e.g. straight from the DB)
+        if not historical_data["timestamp"].is_monotonic_increasing:
+            historical_data = historical_data.sort_values("timestamp")
+        if not historical_data.index.equals(pd.RangeIndex(len(historical_data))):
+            historical_data = historical_data.reset_index(drop=True)
+        historical_data = self._fill_missing_columns(historical_data)
+        
+        # Column arrays for the bar loop (no per-row Series)
+        ts_series = historical_data["timestamp"]
+        ts_list = ts_series.tolist()
+        open_arr = historical_data["open"].to_numpy(dtype=float)
+        high_arr = historical_data["high"].to_numpy(dtype=float)
+        low_arr = historical_data["low"].to_numpy(dtype=float)
+        close_arr = historical_data["close"].to_numpy(dtype=float)
+        volume_arr = historical_data["volume"].to_numpy(dtype=float)
+        symbol_list = historical_data["symbol"].tolist()
+        klines_all = self._build_klines(historical_data, ts_series)
         
         total_rows = len(historical_data)
         last_progress_update = {"value": 0}
@@ -139,56 +161,78 @@ class EventBacktest:
         if self.progress_callback:
             self.progress_callback(0, "Backtest wird initialisiert...")
         
+        # Stateless strategies can compute their signals for the whole history at once;
+        # without strategies there is nothing to generate, so skip market events entirely
+        precomputed_signals = None
+        if not self.strategies:
+            precomputed_signals = {}
+        elif all(strategy.supports_vectorized for strategy in self.strategies):
+            bars = {
+                "timestamp": ts_series.to_numpy(),
+                "symbol": np.asarray(symbol_list, dtype=object),
+                "open": open_arr,
+                "high": high_arr,
+                "low": low_arr,
+                "close": close_arr,
+                "volume": volume_arr,
+            }
+            precomputed_signals = self._precompute_signals(bars)
+        else:
+            # Per-bar market events read plain Python floats (no NumPy scalar per field)
+            open_px, high_px, low_px, close_px, volume_px = (
+                arr.tolist() for arr in (open_arr, high_arr, low_arr, close_arr, volume_arr)
+            )
+            # One MarketEvent for all bars, overwritten in place: strategies consume it
+            # synchronously and must not keep a reference to it
+            bar_data: Dict[str, Any] = {}
+            market_event = MarketEvent(source="EventBacktest", additional_data=bar_data)
+        
         # Process events
         trades = []
-        equity_curve = []
-        peak_equity = self.initial_equity
+        peak_equity = float(self.initial_equity)
+        
+        # Equity curve as columns (bar index, equity, drawdown), filled per processed bar
+        eq_idx = np.empty(total_rows, dtype=np.int64)
+        eq_val = np.empty(total_rows, dtype=np.float64)
+        eq_dd = np.empty(total_rows, dtype=np.float64)
+        n_points = 0
         
-        for idx, row in historical_data.iterrows():
+        for idx in range(total_rows):
             # Update progress every 100 rows or at key milestones
             if idx % 100 == 0 or idx == total_rows - 1:
                 update_progress(idx, f"Verarbeite Daten: {idx + 1}/{total_rows}")
-            timestamp = pd.to_datetime(row["timestamp"])
+            timestamp = ts_list[idx]
             
-            # Skip if not enough historical data (strategies need at least 30 bars)
+            # Skip if not enough historical data (strategies need at least 30 bars);
+            # from here on the klines window always holds 30-50 bars
             if idx < 30:
                 continue
             
-            # Create market event
-            # Convert to float for consistency with strategies
-            klines_window = self._get_klines_window(historical_data, idx, window=50)
-            
-            # Log if klines window is too small
-            if len(klines_window) < 30:
-                logger.debug(f"[Backtest] Skipping event at idx {idx}: only {len(klines_window)} klines available (need 30+)")
-                continue
-            
-            market_event = MarketEvent(
-                symbol=row.get("symbol", "UNKNOWN"),
-                price=float(row["close"]),
-                volume=float(row.get("volume", 0)),
-                timestamp=timestamp.isoformat(),
-                additional_data={
-                    "open": float(row.get("open", row["close"])),
-                    "high": float(row.get("high", row["close"])),
-                    "low": float(row.get("low", row["close"])),
-                    "klines_m1": klines_window,
-                },
-                source="EventBacktest",
-            )
-            
-            # Generate signals from strategies
-            all_signals: List[SignalEvent] = []
-            for strategy in self.strategies:
-                try:
-                    signals = strategy.generate_signals(market_event)
-                    if signals:
-                        logger.info(f"[Backtest] {strategy.name} generated {len(signals)} signal(s) for {market_event.symbol} at idx {idx}")
-                        all_signals.extend(signals)
-                    elif idx % 100 == 0:  # Log every 100th event if no signals (for debugging)
-                        logger.debug(f"[Backtest] {strategy.name} generated 0 signals for {market_event.symbol} at idx {idx}")
-                except Exception as e:
-                    logger.warning(f"Error generating signals from {strategy.name} at idx {idx}: {e}", exc_info=True)
+            if precomputed_signals is not None:
+                all_signals = precomputed_signals.get(idx, [])
+            else:
+                # Update market event for this bar
+                market_event.symbol = symbol_list[idx]
+                market_event.price = close_px[idx]
+                market_event.volume = volume_px[idx]
+                market_event.timestamp = timestamp.isoformat()
+                bar_data["open"] = open_px[idx]
+                bar_data["high"] = high_px[idx]
+                bar_data["low"] = low_px[idx]
+                bar_data["klines_m1"] = self._get_klines_window(klines_all, idx, window=50)
+                
+                # Generate signals from strategies
+                all_signals: List[SignalEvent] = []
+                for strategy in self.strategies:
+                    try:
+                        signals = strategy.generate_signals(market_event)
+                        if signals:
+                            logger.info(f"[Backtest] {strategy.name} generated {len(signals)} signal(s) for {market_event.symbol} at idx {idx}")
+                            all_signals.extend(signals)
+                        elif idx % 100 == 0:  # Log every 100th event if no signals (for debugging)
+                            logger.debug(f"[Backtest] {strategy.name} generated 0 signals for {market_event.symbol} at idx {idx}")
+                    except Exception as e:
+                        logger.warning(f"Error generating signals from {strategy.name} at idx {idx}: {e}", exc_info=True)
             
             # Process signals through allocator
             if all_signals:
@@ -221,15 +265,15 @@ class EventBacktest:
                         logger.debug(f"[Backtest] Risk engine rejected order for {order_intent.symbol}: {risk_approval.reason if hasattr(risk_approval, 'reason') else 'Unknown'}")
             
             # Update equity curve
-            current_equity = self.trading_state.equity
+            equity, drawdown = self.trading_state.update_mark()
+            current_equity = float(equity)
             if current_equity > peak_equity:
                 peak_equity = current_equity
             
-            equity_curve.append({
-                "timestamp": timestamp,
-                "equity": float(current_equity),
-                "drawdown": float(self.trading_state.drawdown),
-            })
+            eq_idx[n_points] = idx
+            eq_val[n_points] = current_equity
+            eq_dd[n_points] = float(drawdown)
+            n_points += 1
         
         # Progress: Closing positions
         if self.progress_callback:
@@ -242,12 +286,22 @@ class EventBacktest:
         if self.progress_callback:
             self.progress_callback(98, "Berechne Metriken...")
         
+        # Public equity curve format: one dict per processed bar
+        eq_val = eq_val[:n_points]
+        equity_curve = [
+            {"timestamp": ts_list[i], "equity": equity, "drawdown": drawdown}
+            for i, equity, drawdown in zip(
+                eq_idx[:n_points].tolist(), eq_val.tolist(), eq_dd[:n_points].tolist()
+            )
+        ]
+        
         # Calculate metrics
         results = self._calculate_metrics(
             trades,
             equity_curve,
             peak_equity,
-            historical_data
+            historical_data,
+            equity=eq_val
         )
         
         # Progress: Complete
@@ -257,6 +311,42 @@ class EventBacktest:
         self.results = results
         return results
     
+    def _precompute_signals(self, bars: Dict[str, np.ndarray]) -> Dict[int, List[SignalEvent]]:
+        """
+        Collect the signals of all (vectorized) strategies, keyed by bar index.
+        
+        Signals of one bar keep the strategy order of the per-bar path.
+        """
+        signals_by_bar: Dict[int, List[SignalEvent]] = {}
+        for strategy in self.strategies:
+            try:
+                strategy_signals = strategy.generate_signals_vectorized(bars)
+            except Exception as e:
+                logger.warning(f"Error generating vectorized signals from {strategy.name}: {e}", exc_info=True)
+                continue
+            
+            logger.info(f"[Backtest] {strategy.name} generated signals on {len(strategy_signals)} bar(s) (vectorized)")
+            for idx, signals in strategy_signals.items():
+                signals_by_bar.setdefault(idx, []).extend(signals)
+        return signals_by_bar
+    
+    @staticmethod
+    def _fill_missing_columns(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add optional kline columns once, so the bar loop needs no per-row fallbacks.
+        
+        Missing open/high/low default to close, volume to 0, symbol to "UNKNOWN".
+        """
+        defaults = {}
+        for col in ("open", "high", "low"):
+            if col not in data.columns:
+                defaults[col] = data["close"]
+        if "volume" not in data.columns:
+            defaults["volume"] = 0.0
+        if "symbol" not in data.columns:
+            defaults["symbol"] = "UNKNOWN"
+        return data.assign(**defaults) if defaults else data
+    
     def _filter_data_by_date(
         self,
         data: pd.DataFrame,
@@ -267,29 +357,37 @@ class EventBacktest:
         if "timestamp" not in data.columns:
             return data
         
-        # Convert timestamp column to datetime
-        data["timestamp_dt"] = pd.to_datetime(data["timestamp"])
-        
+        # One boolean mask over the datetime values, one copy of the frame
+        timestamps = pd.to_datetime(data["timestamp"]).values
+        mask = np.ones(len(data), dtype=bool)
         if start_date:
-            # Convert both to numpy datetime64 for comparison
-            start_ts = pd.Timestamp(start_date).to_numpy()
-            mask = data["timestamp_dt"].values >= start_ts
-            data = data[mask]
+            mask &= timestamps >= pd.Timestamp(start_date).to_numpy()
         if end_date:
-            # Convert both to numpy datetime64 for comparison
-            end_ts = pd.Timestamp(end_date).to_numpy()
-            mask = data["timestamp_dt"].values <= end_ts
-            data = data[mask]
+            mask &= timestamps <= pd.Timestamp(end_date).to_numpy()
+        
+        return data[mask]
+    
+    @staticmethod
+    def _build_klines(data: pd.DataFrame, timestamps: pd.Series) -> List[Tuple]:
+        """
+        Convert all bars to kline format once: (timestamp_ms, open, high, low, close, volume)
         
-        data = data.drop("timestamp_dt", axis=1)
-        return data
+        Prices are stringified like the exchange API returns them. Rows are
+        tuples: strategies only index into them, and zip already builds them.
+        """
+        ts_ms = timestamps.to_numpy(dtype="datetime64[ms]").astype("int64").tolist()
+        columns = [
+            data[col].astype(str).tolist()
+            for col in ("open", "high", "low", "close", "volume")
+        ]
+        return list(zip(ts_ms, *columns))
     
     def _get_klines_window(
         self,
-        data: pd.DataFrame,
+        klines_all: List[Tuple],
         current_idx: int,
         window: int = 50
-    ) -> List[List]:
+    ) -> List[Tuple]:
         """
         Get klines window UP TO (but not including) current index.
         
@@ -298,23 +396,7 @@ class EventBacktest:
         """
         start_idx = max(0, current_idx - window)
         end_idx = current_idx  # EXCLUDE current candle (no lookahead!)
-        
-        window_data = data.iloc[start_idx:end_idx]
-        
-        # Convert to kline format: [timestamp_ms, open, high, low, close, volume]
-        klines = []
-        for _, row in window_data.iterrows():
-            timestamp_ms = int(pd.to_datetime(row["timestamp"]).timestamp() * 1000)
-            klines.append([
-                timestamp_ms,
-                str(row.get("open", row["close"])),
-                str(row.get("high", row["close"])),
-                str(row.get("low", row["close"])),
-                str(row["close"]),
-                str(row.get("volume", 0)),
-            ])
-        
-        return klines
+        return klines_all[start_idx:end_idx]
     
     def _check_position_exits(
         self,
@@ -327,36 +409,35 @@ class EventBacktest:
             return
         
         open_positions = self.trading_state.get_open_positions()
-        current_price = Decimal(str(current_bar["close"]))
+        if not open_positions:
+            return
         
-        for symbol, position in open_positions.items():
-            # Check stop loss
-            if position.side == "Buy" and current_price <= position.stop_loss:
-                exit_price = position.stop_loss
-                exit_reason = "Stop Loss"
-            elif position.side == "Sell" and current_price >= position.stop_loss:
-                exit_price = position.stop_loss
+        # Structure-of-Arrays view of the open positions for the exit kernel
+        # (missing levels become NaN, which never triggers)
+        symbols = list(open_positions)
+        positions = list(open_positions.values())
+        side_sign = np.fromiter(
+            (1 if p.side == "Buy" else -1 for p in positions), dtype=np.int8, count=len(positions)
+        )
+        stop_loss = np.array(
+            [float(p.stop_loss) if p.stop_loss is not None else np.nan for p in positions]
+        )
+        take_profit = np.array(
+            [float(p.take_profit) if p.take_profit is not None else np.nan for p in positions]
+        )
+        hit_sl, hit_tp = check_exits(side_sign, stop_loss, take_profit, float(current_bar["close"]))
+        
+        for j in np.flatnonzero(hit_sl | hit_tp):
+            symbol = symbols[j]
+            position = positions[j]
+            if hit_sl[j]:
+                exit_price = float(stop_loss[j])
                 exit_reason = "Stop Loss"
-            # Check take profit
-            elif position.side == "Buy" and current_price >= position.take_profit:
-                exit_price = position.take_profit
-                exit_reason = "Take Profit"
-            elif position.side == "Sell" and current_price <= position.take_profit:
-                exit_price = position.take_profit
-                exit_reason = "Take Profit"
             else:
-                continue
-            
-            # Calculate realized PnL
-            if position.side == "Buy":
-                realized_pnl = (exit_price - position.entry_price) * position.quantity
-            else:
-                realized_pnl = (position.entry_price - exit_price) * position.quantity
+                exit_price = float(take_profit[j])
+                exit_reason = "Take Profit"
             
-            # Apply fees
-            notional = exit_price * position.quantity
-            fees = notional * self.taker_fee
-            realized_pnl -= fees
+            realized_pnl = self._close_position(symbol, position, exit_price)
             
             # Record exit trade
             trades.append({
@@ -364,128 +445,127 @@ class EventBacktest:
                 "symbol": symbol,
                 "side": "Sell" if position.side == "Buy" else "Buy",  # Opposite side for exit
                 "quantity": float(position.quantity),
-                "price": float(exit_price),
+                "price": exit_price,
                 "exit_reason": exit_reason,
-                "realized_pnl": float(realized_pnl),
+                "realized_pnl": realized_pnl,
             })
-            
-            # Close position
-            self.trading_state.remove_position(symbol, realized_pnl)
-            self.trading_state.credit_cash(position.quantity * exit_price - fees)
     
     def _close_all_positions(self, last_bar: pd.Series) -> None:
         """Close all open positions at end of backtest"""
         if not self.trading_state:
             return
         
-        open_positions = self.trading_state.get_open_positions()
-        for symbol, position in open_positions.items():
-            exit_price = Decimal(str(last_bar["close"]))
-            
-            # Calculate realized PnL
-            if position.side == "Buy":
-                realized_pnl = (exit_price - position.entry_price) * position.quantity
-            else:
-                realized_pnl = (position.entry_price - exit_price) * position.quantity
-            
-            # Apply fees
-            notional = exit_price * position.quantity
-            fees = notional * self.taker_fee
-            realized_pnl -= fees
-            
-            # Close position
-            self.trading_state.remove_position(symbol, realized_pnl)
-            self.trading_state.credit_cash(position.quantity * exit_price - fees)
+        exit_price = float(last_bar["close"])
+        for symbol, position in self.trading_state.get_open_positions().items():
+            self._close_position(symbol, position, exit_price)
+    
+    def _close_position(self, symbol: str, position: Position, exit_price: float) -> float:
+        """
+        Close a position at exit_price, paying the taker fee on the exit notional.
+        
+        PnL is computed in float; values are converted to Decimal only when
+        they are booked into TradingState.
+        
+        Returns:
+            Realized PnL after exit fees
+        """
+        quantity = float(position.quantity)
+        direction = 1.0 if position.side == "Buy" else -1.0
+        fees = exit_price * quantity * self._taker_fee_f
+        realized_pnl = direction * (exit_price - float(position.entry_price)) * quantity - fees
+        
+        self.trading_state.remove_position(symbol, Decimal(repr(realized_pnl)))
+        self.trading_state.credit_cash(Decimal(repr(exit_price * quantity - fees)))
+        return realized_pnl
     
     def _calculate_metrics(
         self,
         trades: List[Dict],
         equity_curve: List[Dict],
-        peak_equity: Decimal,
-        historical_data: pd.DataFrame
+        peak_equity: float,
+        historical_data: pd.DataFrame,
+        equity: Optional[np.ndarray] = None
     ) -> Dict[str, Any]:
-        """Calculate backtest performance metrics"""
+        """
+        Calculate backtest performance metrics
+        
+        Args:
+            equity: Equity values of equity_curve as an array (built from the curve if omitted)
+        """
         if not equity_curve:
             return {"error": "No equity curve data"}
         
         final_equity = equity_curve[-1]["equity"]
-        total_return = (final_equity - self.initial_equity) / self.initial_equity
+        initial_equity = float(self.initial_equity)
+        total_return = (final_equity - initial_equity) / initial_equity
+        
+        # Individual trade PnLs, materialized once for all trade metrics below
+        pnl_arr = np.fromiter(
+            (trade["realized_pnl"] for trade in trades if trade.get("realized_pnl") is not None),
+            dtype=np.float64
+        )
+        has_pnls = pnl_arr.size > 0
         
-        # Calculate individual trade PnL from trades list
-        trade_pnls: List[float] = []
-        for trade in trades:
-            if "realized_pnl" in trade and trade["realized_pnl"] is not None:
-                trade_pnls.append(trade["realized_pnl"])
+        # Max drawdown (running peak starts at initial equity)
+        if equity is None:
+            equity = np.fromiter(
+                (point["equity"] for point in equity_curve), dtype=np.float64, count=len(equity_curve)
+            )
+        peaks = np.maximum.accumulate(np.concatenate(([initial_equity], equity)))
+        prev_peaks, peaks = peaks[:-1], peaks[1:]
+        drawdowns = (peaks - equity) / peaks
+        
+        # Bars where equity made a new high (strictly above the previous peak)
+        new_peak_idx = np.flatnonzero(equity > prev_peaks)
         
-        # Max drawdown
         max_drawdown = 0.0
         max_drawdown_duration = 0
-        current_drawdown_duration = 0
-        peak = float(self.initial_equity)
-        drawdown_start_idx = 0
-        
-        for i, point in enumerate(equity_curve):
-            equity_val = point["equity"]
-            if equity_val > peak:
-                peak = equity_val
-                drawdown_start_idx = i
-                current_drawdown_duration = 0
-            else:
-                current_drawdown_duration += 1
-                drawdown = (peak - equity_val) / peak
-                if drawdown > max_drawdown:
-                    max_drawdown = drawdown
-                    max_drawdown_duration = current_drawdown_duration
-        
-        # Time to Recovery (from max drawdown to new peak)
+        if drawdowns.max() > 0:
+            trough_idx = int(np.argmax(drawdowns))
+            max_drawdown = float(drawdowns[trough_idx])
+            # Bars since the last new high before the trough (or since the start)
+            k = np.searchsorted(new_peak_idx, trough_idx)
+            max_drawdown_duration = trough_idx - int(new_peak_idx[k - 1]) if k else trough_idx + 1
+            drawdown_start_idx = int(new_peak_idx[k - 1]) if k else 0
+        
+        # Time to Recovery (from the peak before max drawdown to the first new high after it)
         time_to_recovery = None
         if max_drawdown > 0:
-            recovery_idx = drawdown_start_idx + max_drawdown_duration
-            recovery_time = None
-            peak_after_dd = peak
-            
-            for i in range(recovery_idx, len(equity_curve)):
-                if equity_curve[i]["equity"] > peak_after_dd:
-                    recovery_time = equity_curve[i]["timestamp"]
-                    time_to_recovery_dt = pd.to_datetime(equity_curve[drawdown_start_idx]["timestamp"])
-                    recovery_time_dt = pd.to_datetime(recovery_time)
-                    time_to_recovery = (recovery_time_dt - time_to_recovery_dt).total_seconds() / 3600  # hours
-                    break
-            
-            if time_to_recovery is None:
+            recovered = equity[trough_idx + 1:] > peaks[trough_idx]
+            first = int(np.argmax(recovered)) if recovered.size else 0
+            if recovered.size and recovered[first]:
+                drawdown_start_dt = pd.to_datetime(equity_curve[drawdown_start_idx]["timestamp"])
+                recovery_time_dt = pd.to_datetime(equity_curve[trough_idx + 1 + first]["timestamp"])
+                time_to_recovery = (recovery_time_dt - drawdown_start_dt).total_seconds() / 3600  # hours
+            else:
                 time_to_recovery = -1  # Never recovered
         
         # Calculate Profit Factor from trade PnLs
-        if trade_pnls:
-            gross_profit = sum([pnl for pnl in trade_pnls if pnl > 0])
-            gross_loss = abs(sum([pnl for pnl in trade_pnls if pnl < 0]))
+        if has_pnls:
+            gross_profit = float(pnl_arr[pnl_arr > 0].sum())
+            gross_loss = float(-pnl_arr[pnl_arr < 0].sum())
             profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf') if gross_profit > 0 else 0.0
         else:
             # Fallback: calculate from equity changes
-            total_profit = sum([max(0, equity_curve[i]["equity"] - equity_curve[i-1]["equity"]) 
-                               for i in range(1, len(equity_curve))])
-            total_loss = abs(sum([min(0, equity_curve[i]["equity"] - equity_curve[i-1]["equity"]) 
-                                for i in range(1, len(equity_curve))]))
+            equity_changes = np.diff(equity)
+            total_profit = float(equity_changes[equity_changes > 0].sum())
+            total_loss = float(-equity_changes[equity_changes < 0].sum())
             profit_factor = total_profit / total_loss if total_loss > 0 else float('inf') if total_profit > 0 else 0.0
         
         # Expectancy (average PnL per trade)
-        if trade_pnls:
-            expectancy = sum(trade_pnls) / len(trade_pnls)
+        if has_pnls:
+            expectancy = float(pnl_arr.mean())
         else:
-            expectancy = (final_equity - self.initial_equity) / max(len(trades), 1)
+            expectancy = (final_equity - initial_equity) / max(len(trades), 1)
         
         # Win Rate calculation (percentage of profitable trades)
         win_rate = None
-        if trade_pnls:
-            winning_trades = [pnl for pnl in trade_pnls if pnl > 0]
-            win_rate = len(winning_trades) / len(trade_pnls) if len(trade_pnls) > 0 else 0.0
+        if has_pnls:
+            win_rate = int(np.count_nonzero(pnl_arr > 0)) / pnl_arr.size
         elif len(trades) > 0:
-            # Fallback: calculate from equity changes if trade_pnls not available
+            # Fallback: calculate from equity changes if trade PnLs not available
             # Count trades that increased equity
-            winning_count = 0
-            for i in range(1, len(equity_curve)):
-                if equity_curve[i]["equity"] > equity_curve[i-1]["equity"]:
-                    winning_count += 1
+            winning_count = int(np.count_nonzero(np.diff(equity) > 0))
             win_rate = winning_count / max(len(trades), 1) if len(trades) > 0 else 0.0
         else:
             win_rate = 0.0
@@ -493,33 +573,21 @@ class EventBacktest:
         # Tail Loss (95th and 99th percentile of losses)
         tail_loss_95 = None
         tail_loss_99 = None
-        if trade_pnls:
-            losses = sorted([pnl for pnl in trade_pnls if pnl < 0])
-            if losses:
-                tail_loss_95 = abs(losses[int(len(losses) * 0.95)]) if len(losses) > 0 else None
-                tail_loss_99 = abs(losses[int(len(losses) * 0.99)]) if len(losses) > 1 else tail_loss_95
+        if has_pnls:
+            losses = -pnl_arr[pnl_arr < 0]  # loss sizes, positive
+            if losses.size:
+                tail_loss_95, tail_loss_99 = np.percentile(losses, [95, 99])
         
         # Ulcer Index (proper calculation)
-        # Sum of squared percentage drawdowns / number of periods
-        drawdowns_squared_sum = 0.0
-        period_peak = float(self.initial_equity)
-        
-        for point in equity_curve:
-            equity_val = point["equity"]
-            if equity_val > period_peak:
-                period_peak = equity_val
-            else:
-                drawdown_pct = (period_peak - equity_val) / period_peak
-                drawdowns_squared_sum += drawdown_pct ** 2
-        
-        ulcer_index = (drawdowns_squared_sum / len(equity_curve)) ** 0.5 if equity_curve else 0.0
+        # Root mean square of percentage drawdowns from the running peak
+        ulcer_index = float(np.sqrt(np.mean(drawdowns ** 2)))
         
         num_trades = len(trades)
         days = (pd.to_datetime(equity_curve[-1]["timestamp"]) - pd.to_datetime(equity_curve[0]["timestamp"])).days
         trades_per_day = num_trades / max(days, 1) if days > 0 else num_trades
         
         return {
-            "initial_equity": float(self.initial_equity),
+            "initial_equity": initial_equity,
             "final_equity": float(final_equity),
             "total_return": float(total_return),
             "total_return_pct": float(total_return * 100),
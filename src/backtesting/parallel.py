@@ -0,0 +1,104 @@
+"""Parallel Backtesting - one process per symbol"""
+
+import concurrent.futures
+import multiprocessing
+import os
+from datetime import datetime
+from typing import Dict, Any, Optional
+import logging
+
+import pandas as pd
+
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _run_one(
+    config: Dict[str, Any],
+    engine_kwargs: Dict[str, Any],
+    symbol: str,
+    klines: pd.DataFrame,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime]
+) -> Dict[str, Any]:
+    """Worker entry point: fresh engine per symbol (must stay module-level for pickling)"""
+    from backtesting.backtest_engine import BacktestEngine
+
+    engine = BacktestEngine(config, **engine_kwargs)
+    return engine.run_backtest(symbol, klines, start_date=start_date, end_date=end_date)
+
+
+def run_backtests_parallel(
+    config: Dict[str, Any],
+    klines_map: Dict[str, pd.DataFrame],
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    show_progress: bool = False,
+    **engine_kwargs
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Backtest several symbols in separate processes
+
+    Symbols are independent, so each one runs in its own worker process
+    (spawn context, so it behaves the same on Linux, macOS and Windows).
+
+    Args:
+        config: Trading bot configuration (must be picklable)
+        klines_map: Symbol -> historical kline DataFrame
+        start_date: Start date (optional)
+        end_date: End date (optional)
+        max_workers: Worker processes (default: CPU count, capped at symbol count)
+        timeout: Seconds to wait for all results (None = no limit)
+        show_progress: Show a tqdm progress bar if tqdm is installed
+        **engine_kwargs: Passed to BacktestEngine (initial_equity, commission_rate, ...)
+
+    Returns:
+        Symbol -> backtest metrics, or {"error": ...} for symbols that failed
+    """
+    if not klines_map:
+        return {}
+
+    workers = min(max_workers or os.cpu_count() or 1, len(klines_map))
+    results: Dict[str, Dict[str, Any]] = {}
+
+    executor = concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+    timed_out = False
+    try:
+        futures = {
+            executor.submit(_run_one, config, engine_kwargs, symbol, klines, start_date, end_date): symbol
+            for symbol, klines in klines_map.items()
+        }
+
+        completed = concurrent.futures.as_completed(futures, timeout=timeout)
+        if show_progress and TQDM_AVAILABLE:
+            completed = tqdm(completed, total=len(futures), desc="Backtests")
+
+        try:
+            for future in completed:
+                symbol = futures[future]
+                try:
+                    results[symbol] = future.result()
+                except Exception as e:
+                    logger.error("Backtest failed for %s: %s", symbol, e, exc_info=True)
+                    results[symbol] = {"error": str(e)}
+                logger.debug("Backtest %d/%d done: %s", len(results), len(futures), symbol)
+        except concurrent.futures.TimeoutError:
+            timed_out = True
+            logger.warning("Parallel backtest timed out after %ss", timeout)
+            for symbol in futures.values():
+                results.setdefault(symbol, {"error": f"Timed out after {timeout}s"})
+    finally:
+        # Don't block on stragglers after a timeout
+        executor.shutdown(wait=not timed_out, cancel_futures=True)
+
+    return results
@@ -1,14 +1,36 @@
 """Walk-Forward Analysis for Backtesting"""
 
+import concurrent.futures
+import multiprocessing
+import os
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import logging
 
+import pandas as pd
+
 from backtesting.backtest_engine import BacktestEngine
 
 logger = logging.getLogger(__name__)
 
 
+def _run_window(
+    config: Dict[str, Any],
+    symbol: str,
+    klines,
+    test_start: datetime,
+    test_end: datetime
+) -> Dict[str, Any]:
+    """Backtest one test window on a fresh engine (must stay module-level for pickling)"""
+    engine = BacktestEngine(config)
+    return engine.run_backtest(
+        symbol=symbol,
+        klines=klines,
+        start_date=test_start,
+        end_date=test_end
+    )
+
+
 class WalkForwardAnalysis:
     """Walk-Forward Analysis for robust backtesting"""
     
@@ -38,21 +60,27 @@ class WalkForwardAnalysis:
         symbol: str,
         klines,
         start_date: datetime,
-        end_date: datetime
+        end_date: datetime,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Run walk-forward analysis
         
+        Test windows are independent, so they are backtested in separate
+        worker processes (spawn context, like run_backtests_parallel).
+        
         Args:
             symbol: Trading symbol
             klines: Historical kline data
             start_date: Analysis start date
             end_date: Analysis end date
+            max_workers: Worker processes (default: CPU count, capped at window count;
+                1 runs all windows in this process)
             
         Returns:
             Walk-forward analysis results
         """
-        results = []
+        windows = []
         current_start = start_date
         
         while current_start + timedelta(days=self.train_period_days + self.test_period_days) <= end_date:
@@ -65,45 +93,59 @@ class WalkForwardAnalysis:
                 f"Walk-forward window: Train {train_start.date()} to {train_end.date()}, "
                 f"Test {test_start.date()} to {test_end.date()}"
             )
+            windows.append((train_start, train_end, test_start, test_end))
             
-            # Run backtest on test period
-            engine = BacktestEngine(self.config)
-            test_results = engine.run_backtest(
-                symbol=symbol,
-                klines=klines,
-                start_date=test_start,
-                end_date=test_end
-            )
-            
-            results.append({
+            # Step forward
+            current_start += timedelta(days=self.step_days)
+        
+        # Run backtest on each test period
+        workers = min(max_workers or os.cpu_count() or 1, len(windows))
+        if workers <= 1:
+            window_metrics = [
+                _run_window(self.config, symbol, klines, test_start, test_end)
+                for _, _, test_start, test_end in windows
+            ]
+        else:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                n = len(windows)
+                window_metrics = list(executor.map(
+                    _run_window,
+                    [self.config] * n,
+                    [symbol] * n,
+                    [klines] * n,
+                    [w[2] for w in windows],
+                    [w[3] for w in windows]
+                ))
+        
+        results = [
+            {
                 "train_start": train_start,
                 "train_end": train_end,
                 "test_start": test_start,
                 "test_end": test_end,
-                "metrics": test_results
-            })
-            
-            # Step forward
-            current_start += timedelta(days=self.step_days)
+                "metrics": metrics
+            }
+            for (train_start, train_end, test_start, test_end), metrics in zip(windows, window_metrics)
+        ]
         
         # Aggregate results
         if not results:
             return {"error": "No results generated"}
         
-        # Calculate average metrics
-        total_trades = sum(r["metrics"]["total_trades"] for r in results)
-        avg_win_rate = sum(r["metrics"]["win_rate"] for r in results) / len(results) if results else 0.0
-        avg_sharpe = sum(r["metrics"]["sharpe_ratio"] for r in results) / len(results) if results else 0.0
-        avg_max_dd = sum(r["metrics"]["max_drawdown"] for r in results) / len(results) if results else 0.0
-        avg_profit_factor = sum(r["metrics"]["profit_factor"] for r in results) / len(results) if results else 0.0
+        # Calculate average metrics (one row per window)
+        metrics_df = pd.DataFrame(window_metrics)
+        means = metrics_df[["win_rate", "sharpe_ratio", "max_drawdown", "profit_factor"]].mean()
         
         return {
             "windows": len(results),
-            "total_trades": total_trades,
-            "average_win_rate": round(avg_win_rate, 2),
-            "average_sharpe_ratio": round(avg_sharpe, 2),
-            "average_max_drawdown": round(avg_max_dd, 2),
-            "average_profit_factor": round(avg_profit_factor, 2),
+            "total_trades": int(metrics_df["total_trades"].sum()),
+            "average_win_rate": round(float(means["win_rate"]), 2),
+            "average_sharpe_ratio": round(float(means["sharpe_ratio"]), 2),
+            "average_max_drawdown": round(float(means["max_drawdown"]), 2),
+            "average_profit_factor": round(float(means["profit_factor"]), 2),
             "window_results": results
         }
 
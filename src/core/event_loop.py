@@ -3,7 +3,8 @@
 import logging
 import threading
 import time
-from typing import List, Optional
+from decimal import Decimal
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from events.event import BaseEvent
@@ -27,6 +28,17 @@ from strategies.base import BaseStrategy
 
 logger = logging.getLogger(__name__)
 
+# Back off only after this many consecutive loop errors (capped at MAX_ERROR_BACKOFF seconds)
+ERRORS_BEFORE_BACKOFF = 5
+MAX_ERROR_BACKOFF = 1.0
+# Full tracebacks for loop errors at most once per this many seconds
+ERROR_TRACEBACK_INTERVAL = 1.0
+
+_ZERO = Decimal("0")
+
+# Events drained from the queue per wakeup
+EVENT_BATCH_SIZE = 64
+
 
 class EventLoop:
     """
@@ -54,7 +66,8 @@ class EventLoop:
             strategy_allocator: StrategyAllocator instance
             order_executor: OrderExecutor instance
             strategies: List of strategies
-            config: Configuration dictionary
+            config: Configuration dictionary ("eventLoop": {"syncDispatch": false} keeps
+                PAPER-mode cascades on the queue)
         """
         self.trading_state = trading_state
         self.risk_engine = risk_engine
@@ -64,14 +77,38 @@ class EventLoop:
         self.config = config
         self.trading_mode = trading_mode
         
+        # Fee/leverage settings as Decimal once, not on every fill
+        risk_config = config.get("risk", {})
+        self._taker_fee_rate = Decimal(str(risk_config.get("takerFee", 0.001)))
+        self._leverage_max = Decimal(str(risk_config.get("leverageMax", 10)))
+        
+        # Enabled strategies, rebuilt only when one is enabled/disabled
+        self._enabled_strategies: Tuple[BaseStrategy, ...] = ()
+        for strategy in strategies:
+            strategy.on_enable_change(self._refresh_enabled_strategies)
+        self._refresh_enabled_strategies()
+        
+        # Signals of the current MarketEvent, allocated as one batch (reused across ticks)
+        self._pending_signals: List[SignalEvent] = []
+        
+        # Lock-free mirror of trading_state.trading_enabled; while trading is
+        # disabled MarketEvents are dropped before dispatch
+        self._trading_enabled = trading_state.trading_enabled
+        trading_state.register_trading_listener(self._set_trading_enabled)
+        
         # Event infrastructure
-        self.event_queue = EventQueue(maxsize=1000)
+        self.event_queue = EventQueue(maxsize=1024)
         self.dispatcher = EventDispatcher()
         
         # Control
         self.running = False
+        self._last_error_t = float("-inf")
         self.thread: Optional[threading.Thread] = None
         
+        # PAPER: events published on the loop thread itself (handler cascades) are
+        # dispatched inline instead of round-tripping through the queue
+        self._sync_dispatch = trading_mode == "PAPER" and config.get("eventLoop", {}).get("syncDispatch", True)
+        
         # Register event handlers
         self._register_handlers()
         
@@ -91,30 +128,49 @@ class EventLoop:
     def stop(self) -> None:
         """Stop event loop"""
         self.running = False
+        # Wake the loop thread blocked in get(); if the queue is full it is busy and sees running=False anyway
+        self.event_queue.put(None, block=False)
         if self.thread:
             self.thread.join(timeout=5.0)
         logger.info("Event loop stopped")
     
     def publish_event(self, event: BaseEvent) -> bool:
-        """Publish event to queue"""
+        """Publish event to queue (dispatched inline on the loop thread in PAPER mode)"""
+        if self._sync_dispatch and (self.thread is None or threading.get_ident() == self.thread.ident):
+            self.dispatcher.dispatch(event)
+            return True
         return self.event_queue.put(event)
     
     def _run_loop(self) -> None:
         """Main event processing loop"""
         logger.info("Event loop thread started")
+        consecutive_errors = 0
+        # Bound once per thread run; the loop only re-reads the flags stop() and the kill switch flip
+        get_many = self.event_queue.get_many
+        dispatch_many = self.dispatcher.dispatch_many
         
         while self.running:
             try:
-                # Get event from queue (non-blocking)
-                event = self.event_queue.get(block=True, timeout=0.1)
+                # Block until events arrive, then drain a batch; stop() wakes us with a None sentinel
+                events = get_many(EVENT_BATCH_SIZE)
+                if not self._trading_enabled:
+                    events = [event for event in events if type(event) is not MarketEvent]
                 
-                if event:
-                    # Dispatch to handlers
-                    self.dispatcher.dispatch(event)
+                # Dispatch to handlers (None sentinels are skipped)
+                dispatch_many(events)
+                consecutive_errors = 0
                 
             except Exception as e:
-                logger.error(f"Error in event loop: {e}", exc_info=True)
-                time.sleep(0.1)
+                consecutive_errors += 1
+                # Formatting a traceback is expensive; a burst of errors logs one, then one line each
+                now = time.monotonic()
+                if now - self._last_error_t > ERROR_TRACEBACK_INTERVAL:
+                    self._last_error_t = now
+                    logger.error(f"Error in event loop: {e}", exc_info=True)
+                else:
+                    logger.error(f"Error in event loop: {e}")
+                if consecutive_errors >= ERRORS_BEFORE_BACKOFF:
+                    time.sleep(min(0.01 * 2 ** (consecutive_errors - ERRORS_BEFORE_BACKOFF), MAX_ERROR_BACKOFF))
         
         logger.info("Event loop thread stopped")
     
@@ -124,6 +180,7 @@ class EventLoop:
         self.dispatcher.register_handler(MarketEvent, self._handle_market_event, priority=100)
         
         # SignalEvent -> StrategyAllocator -> OrderIntentEvent
+        # (strategy signals skip this: _handle_market_event allocates them per tick)
         self.dispatcher.register_handler(SignalEvent, self._handle_signal_event, priority=90)
         
         # OrderIntentEvent -> RiskEngine -> RiskApprovalEvent
@@ -143,33 +200,48 @@ class EventLoop:
     
     def _handle_market_event(self, event: MarketEvent) -> None:
         """Handle market event - generate signals from strategies"""
-        if not self.trading_state.trading_enabled:
+        if not self._trading_enabled:
             return
         
-        all_signals: List[SignalEvent] = []
+        pending = self._pending_signals
         
-        for strategy in self.strategies:
-            if not strategy.is_enabled():
-                continue
-            
+        for strategy in self._enabled_strategies:
             try:
-                signals = strategy.generate_signals(event)
-                for signal in signals:
-                    # Publish signal event
-                    self.publish_event(signal)
+                pending.extend(strategy.generate_signals(event))
             except Exception as e:
                 logger.error(f"Error in strategy {strategy.name}: {e}", exc_info=True)
+        
+        if not pending:
+            return
+        
+        # One allocator pass over all strategies' signals, so it can pick the best per symbol
+        try:
+            self._allocate_signals(pending)
+        finally:
+            pending.clear()
+    
+    def _set_trading_enabled(self, enabled: bool) -> None:
+        """TradingState listener: mirror enable_trading()/disable_trading()"""
+        self._trading_enabled = enabled
+    
+    def _refresh_enabled_strategies(self, strategy: Optional[BaseStrategy] = None) -> None:
+        """Rebuild the enabled-strategies snapshot (on_enable_change listener)"""
+        self._enabled_strategies = tuple(s for s in self.strategies if s.is_enabled())
     
     def _handle_signal_event(self, event: SignalEvent) -> None:
-        """Handle signal event - process through allocator"""
+        """Handle signal event published from outside the loop - process through allocator"""
+        self._allocate_signals([event])
+    
+    def _allocate_signals(self, signals: List[SignalEvent]) -> None:
+        """Process signals through the allocator in one call and publish the order intents"""
         try:
-            order_intents = self.strategy_allocator.process_signals([event])
+            order_intents = self.strategy_allocator.process_signals(signals)
             
             for order_intent in order_intents:
                 # Publish order intent event
                 self.publish_event(order_intent)
         except Exception as e:
-            logger.error(f"Error processing signal: {e}", exc_info=True)
+            logger.error(f"Error processing signals: {e}", exc_info=True)
     
     def _handle_order_intent(self, event: OrderIntentEvent) -> None:
         """Handle order intent - evaluate through risk engine"""
@@ -204,8 +276,6 @@ class EventLoop:
     def _handle_fill_event(self, event: FillEvent) -> None:
         """Handle fill event - create/update position"""
         try:
-            from decimal import Decimal
-            
             # Get order from state
             order = self.trading_state.get_order(event.client_order_id)
             if not order:
@@ -244,7 +314,7 @@ class EventLoop:
                         # Calculate fees (approximate - commission may already be in event.commission)
                         entry_notional = existing_position.entry_price * existing_position.quantity
                         exit_notional = event.filled_price * existing_position.quantity
-                        taker_fee_rate = Decimal(str(self.config.get("risk", {}).get("takerFee", 0.001)))
+                        taker_fee_rate = self._taker_fee_rate
                         entry_fee = entry_notional * taker_fee_rate
                         exit_fee = exit_notional * taker_fee_rate
                         total_fees = entry_fee + exit_fee
@@ -255,7 +325,7 @@ class EventLoop:
                         
                         # For live trading: Credit cash (margin + realized PnL) BEFORE removing position
                         if self.trading_mode in ["LIVE", "TESTNET"]:
-                            leverage = Decimal(str(self.config.get("risk", {}).get("leverageMax", 10)))
+                            leverage = self._leverage_max
                             margin_returned = entry_notional / leverage if leverage > 0 else entry_notional
                             cash_to_credit = margin_returned + realized_pnl
                             self.trading_state.credit_cash(cash_to_credit)
@@ -270,7 +340,7 @@ class EventLoop:
                         if self.trading_mode in ["LIVE", "TESTNET"]:
                             reduce_ratio = event.filled_quantity / existing_position.quantity
                             notional_reduced = existing_position.entry_price * event.filled_quantity
-                            leverage = Decimal(str(self.config.get("risk", {}).get("leverageMax", 10)))
+                            leverage = self._leverage_max
                             margin_returned = notional_reduced / leverage if leverage > 0 else notional_reduced
                             
                             # Calculate PnL for reduced portion
@@ -280,7 +350,7 @@ class EventLoop:
                                 pnl_before_fees = (existing_position.entry_price - event.filled_price) * event.filled_quantity
                             
                             exit_notional = event.filled_price * event.filled_quantity
-                            taker_fee_rate = Decimal(str(self.config.get("risk", {}).get("takerFee", 0.001)))
+                            taker_fee_rate = self._taker_fee_rate
                             commission = event.commission if event.commission is not None else (exit_notional * taker_fee_rate)
                             realized_pnl = pnl_before_fees - commission
                             
@@ -294,33 +364,28 @@ class EventLoop:
                         )
             else:
                 # Create new position
-                from core.trading_state import Position
-                from datetime import datetime
-                
-                # Get stop loss and take profit from order metadata
+                # Get stop loss and take profit from order metadata (Decimal, set by OrderExecutor)
                 stop_loss = order.metadata.get("stop_loss") if order.metadata else None
                 take_profit = order.metadata.get("take_profit") if order.metadata else None
                 
-                position = Position(
+                self.trading_state.add_position(
                     symbol=event.symbol,
                     side=event.side,
                     quantity=event.filled_quantity,
                     entry_price=event.filled_price,
-                    entry_time=event.fill_time,
-                    stop_loss=Decimal(str(stop_loss)) if stop_loss else None,
-                    take_profit=Decimal(str(take_profit)) if take_profit else None
+                    stop_loss=stop_loss or None,
+                    take_profit=take_profit or None,
+                    entry_time=event.fill_time
                 )
                 
-                self.trading_state.add_position(event.symbol, position)
-                
                 # For live trading: Update cash (margin + fees) on entry
                 if self.trading_mode in ["LIVE", "TESTNET"]:
                     notional_value = event.filled_price * event.filled_quantity
-                    leverage = Decimal(str(self.config.get("risk", {}).get("leverageMax", 10)))
+                    leverage = self._leverage_max
                     margin_required = notional_value / leverage if leverage > 0 else notional_value
                     
                     # Get commission from event or calculate fee
-                    taker_fee_rate = Decimal(str(self.config.get("risk", {}).get("takerFee", 0.001)))
+                    taker_fee_rate = self._taker_fee_rate
                     commission = event.commission if event.commission is not None else (notional_value * taker_fee_rate)
                     
                     # Debit cash for margin + commission
@@ -337,28 +402,35 @@ class EventLoop:
         """Handle position update from exchange"""
         try:
             # Check position status (using position_status field)
-            if event.position_status == "closed" or event.quantity == Decimal("0"):
+            if event.position_status == "closed" or event.quantity == _ZERO:
                 # Position closed by exchange (e.g., via SL/TP)
                 existing_position = self.trading_state.get_position(event.symbol)
                 if existing_position:
-                    realized_pnl = event.realized_pnl if event.realized_pnl else Decimal("0")
+                    realized_pnl = event.realized_pnl or _ZERO
                     self.trading_state.remove_position(event.symbol, realized_pnl=realized_pnl)
                     logger.info(f"Position closed by exchange: {event.symbol}, realized_pnl={realized_pnl}")
             else:
-                # Update position - remove and recreate with new values
                 existing_position = self.trading_state.get_position(event.symbol)
                 if existing_position:
-                    # Remove existing
-                    self.trading_state.remove_position(event.symbol, realized_pnl=Decimal("0"))
-                    # Recreate with updated values
-                    self.trading_state.add_position(
-                        symbol=event.symbol,
-                        side=event.side,
-                        quantity=event.quantity,
-                        entry_price=event.entry_price if event.entry_price > 0 else existing_position.entry_price,
-                        stop_loss=existing_position.stop_loss,
-                        take_profit=existing_position.take_profit
-                    )
+                    entry_price = event.entry_price if event.entry_price > 0 else existing_position.entry_price
+                    if event.side == existing_position.side:
+                        # Same side - update size/entry in place
+                        self.trading_state.update_position(
+                            event.symbol,
+                            quantity=event.quantity,
+                            entry_price=entry_price
+                        )
+                    else:
+                        # Side flipped - remove and recreate with new values
+                        self.trading_state.remove_position(event.symbol, realized_pnl=_ZERO)
+                        self.trading_state.add_position(
+                            symbol=event.symbol,
+                            side=event.side,
+                            quantity=event.quantity,
+                            entry_price=entry_price,
+                            stop_loss=existing_position.stop_loss,
+                            take_profit=existing_position.take_profit
+                        )
                     logger.debug(f"Position updated: {event.symbol}")
         
         except Exception as e:
@@ -367,5 +439,6 @@ class EventLoop:
     def _handle_kill_switch(self, event: KillSwitchEvent) -> None:
         """Handle kill switch - disable trading"""
         logger.critical(f"Kill switch activated: {event.reason}")
+        self._trading_enabled = False
         self.trading_state.disable_trading()
 
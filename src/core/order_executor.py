@@ -1,8 +1,11 @@
 """Order Executor with Idempotency and Reconciliation"""
 
+import hashlib
 import logging
+import threading
 import uuid
-from typing import Dict, Optional, Any
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Any, Tuple
 from decimal import Decimal
 from datetime import datetime
 
@@ -15,6 +18,9 @@ from integrations.bybit import BybitClient
 
 logger = logging.getLogger(__name__)
 
+# Orders remembered for retries without a TradingState lookup (least recently used evicted)
+RECENT_ORDERS_MAX = 4096
+
 
 class OrderExecutor:
     """
@@ -43,10 +49,12 @@ class OrderExecutor:
             bybit_client: BybitClient instance (None for paper trading)
             trading_mode: Trading mode (PAPER, LIVE, TESTNET)
             config: Configuration dictionary (for leverage setting)
+            event_queue: Queue for FillEvents found during reconciliation
         """
         self.trading_state = trading_state
         self.bybit_client = bybit_client
         self.trading_mode = trading_mode
+        self.event_queue = event_queue
         
         # Get leverage from config (default 10x)
         if config:
@@ -56,6 +64,11 @@ class OrderExecutor:
             self.leverage = Decimal("10")  # Default 10x leverage
             self.taker_fee_rate = Decimal("0.001")  # Default 0.1% taker fee
         
+        # client_order_id -> the Order object held in TradingState, most recently used last.
+        # update_order() mutates that same object, so its status is always current.
+        self._recent_orders: "OrderedDict[str, Order]" = OrderedDict()
+        self._recent_lock = threading.Lock()
+        
         logger.info(f"OrderExecutor initialized (mode: {trading_mode}, leverage: {self.leverage}x, taker_fee: {self.taker_fee_rate})")
     
     def execute_approved_order(self, approval_event: RiskApprovalEvent) -> Optional[OrderSubmissionEvent]:
@@ -77,21 +90,29 @@ class OrderExecutor:
         # Generate deterministic client order ID for idempotency
         # Use signal_event_id from intent (which comes from original signal)
         # This ensures same signal always gets same client_order_id
-        import hashlib
         if intent.signal_event_id:
             # Use signal event ID as base (deterministic)
             base_id = intent.signal_event_id
         else:
             # Fallback: create deterministic ID from intent properties
             # Use symbol, side, strategy_name, and entry_price (but NOT quantity which may vary)
-            # Entry price is part of the signal, so it's deterministic
-            intent_str = f"{intent.symbol}_{intent.side}_{intent.strategy_name}_{float(intent.entry_price):.8f}"
-            base_id = hashlib.md5(intent_str.encode()).hexdigest()[:16]
+            # Entry price is part of the signal, so it's deterministic; normalized exact Decimal,
+            # so 50000 and 50000.00 hash the same without rounding through float
+            entry_price = Decimal(intent.entry_price).normalize()
+            intent_str = f"{intent.symbol}|{intent.side}|{intent.strategy_name}|{entry_price:f}"
+            base_id = hashlib.blake2b(intent_str.encode(), digest_size=8).hexdigest()
         
         client_order_id = f"ORDER_{base_id}"
         
+        # Retries of a recent submission are answered from the LRU
+        with self._recent_lock:
+            existing_order = self._recent_orders.get(client_order_id)
+            if existing_order is not None:
+                self._recent_orders.move_to_end(client_order_id)
+        
         # Check if order already exists (idempotency check)
-        existing_order = self.trading_state.get_order(client_order_id)
+        if existing_order is None:
+            existing_order = self.trading_state.get_order(client_order_id)
         if existing_order:
             logger.info(f"Order {client_order_id} already exists, returning existing")
             return OrderSubmissionEvent(
@@ -122,6 +143,8 @@ class OrderExecutor:
             order_type=intent.order_type,
             time_in_force=intent.time_in_force,
             status="pending",
+            # Decimal already, so fill handling can attach them to the position as-is
+            metadata={"stop_loss": stop_loss, "take_profit": take_profit},
         )
         
         # Add to state
@@ -131,9 +154,20 @@ class OrderExecutor:
         
         # Execute order (paper or live)
         if self.trading_mode == "PAPER":
-            return self._execute_paper_order(order, stop_loss, take_profit)
+            submission = self._execute_paper_order(order, stop_loss, take_profit)
         else:
-            return self._execute_live_order(order, stop_loss, take_profit)
+            submission = self._execute_live_order(order, stop_loss, take_profit)
+        
+        if submission is not None:
+            self._remember_order(order)
+        return submission
+    
+    def _remember_order(self, order: Order) -> None:
+        """Cache an order added to TradingState for idempotent retries, evicting the least recently used"""
+        with self._recent_lock:
+            self._recent_orders[order.client_order_id] = order
+            if len(self._recent_orders) > RECENT_ORDERS_MAX:
+                self._recent_orders.popitem(last=False)
     
     def _execute_paper_order(
         self,
@@ -359,7 +393,9 @@ class OrderExecutor:
         """
         Reconcile orders with exchange state.
         
-        Periodically called to sync TradingState with exchange.
+        Periodically called to sync TradingState with exchange. Pending
+        orders are grouped by symbol, so there is one open-orders request
+        per symbol rather than per order.
         """
         if self.trading_mode == "PAPER":
             return  # No reconciliation needed for paper trading
@@ -368,9 +404,9 @@ class OrderExecutor:
             return
         
         try:
-            # Get all open orders from state
+            # Get all open orders from state, grouped by symbol
             open_orders = self.trading_state.get_open_orders()
-            
+            orders_by_symbol: Dict[str, List[Tuple[str, Order]]] = defaultdict(list)
             for client_order_id, order in open_orders.items():
                 if order.status in ["filled", "cancelled", "rejected"]:
                     continue
@@ -378,66 +414,87 @@ class OrderExecutor:
                 if not order.exchange_order_id:
                     continue
                 
-                # Query exchange for order status
+                orders_by_symbol[order.symbol].append((client_order_id, order))
+            
+            for symbol, orders in orders_by_symbol.items():
+                # Query exchange for the symbol's open orders
                 try:
-                    # Use open orders endpoint to find order
                     # Bybit API: GET /v5/order/realtime
                     endpoint = "/v5/order/realtime"
                     params = {
                         "category": "linear",
-                        "symbol": order.symbol
+                        "symbol": symbol
                     }
                     open_orders_response = self.bybit_client._authenticated_request("GET", endpoint, params=params)
                     open_orders_response = open_orders_response.get("result", {})
-                    
-                    exchange_order = None
-                    if open_orders_response and "list" in open_orders_response:
-                        for o in open_orders_response["list"]:
-                            if o.get("orderId") == order.exchange_order_id or o.get("orderLinkId") == order.client_order_id:
-                                exchange_order = o
-                                break
-                    
-                    # If not in open orders, order might be filled or cancelled
-                    if not exchange_order and order.status == "submitted":
-                        # Order not found in open orders - might be filled
-                        # In a real implementation, we would query order history
-                        exchange_order = {"orderStatus": "Filled"}
-                    
-                    if exchange_order:
-                        # Update order status
-                        exchange_status = exchange_order.get("orderStatus", order.status)
-                        if exchange_status != order.status:
-                            self.trading_state.update_order(
-                                client_order_id,
-                                status=exchange_status,
-                            )
-                            
-                            # If filled, create FillEvent
-                            if exchange_status == "Filled":
-                                fill_event = FillEvent(
-                                    client_order_id=client_order_id,
-                                    exchange_order_id=order.exchange_order_id,
-                                    symbol=order.symbol,
-                                    side=order.side,
-                                    filled_quantity=Decimal(str(exchange_order.get("cumExecQty", order.quantity))),
-                                    filled_price=Decimal(str(exchange_order.get("avgPrice", order.price))),
-                                    fill_time=datetime.utcnow(),
-                                    is_partial=exchange_order.get("cumExecQty", order.quantity) < order.quantity,
-                                    remaining_quantity=order.quantity - Decimal(str(exchange_order.get("cumExecQty", 0))),
-                                    source="OrderExecutor",
-                                )
-                                # Publish FillEvent to event queue
-                                if self.event_queue:
-                                    try:
-                                        self.event_queue.put(fill_event)
-                                        logger.info(f"FillEvent published for order: {client_order_id}")
-                                    except Exception as e:
-                                        logger.error(f"Error publishing FillEvent: {e}", exc_info=True)
-                                else:
-                                    logger.warning(f"FillEvent created but no event_queue available: {client_order_id}")
-                                logger.info(f"Order filled: {client_order_id}")
                 except Exception as e:
-                    logger.error(f"Error reconciling order {client_order_id}: {e}", exc_info=True)
+                    logger.error(f"Error fetching open orders for {symbol}: {e}", exc_info=True)
+                    continue
+                
+                # Index the response once instead of scanning it per order
+                by_order_id: Dict[str, Dict] = {}
+                by_order_link_id: Dict[str, Dict] = {}
+                if open_orders_response and "list" in open_orders_response:
+                    for o in open_orders_response["list"]:
+                        by_order_id.setdefault(o.get("orderId"), o)
+                        by_order_link_id.setdefault(o.get("orderLinkId"), o)
+                
+                for client_order_id, order in orders:
+                    exchange_order = (
+                        by_order_id.get(order.exchange_order_id)
+                        or by_order_link_id.get(client_order_id)
+                    )
+                    try:
+                        self._reconcile_order(client_order_id, order, exchange_order)
+                    except Exception as e:
+                        logger.error(f"Error reconciling order {client_order_id}: {e}", exc_info=True)
         
         except Exception as e:
             logger.error(f"Error reconciling orders: {e}", exc_info=True)
+    
+    def _reconcile_order(self, client_order_id: str, order: Order, exchange_order: Optional[Dict]) -> None:
+        """Apply the exchange's view of one order (None if it is no longer open there)"""
+        # If not in open orders, order might be filled or cancelled
+        if not exchange_order and order.status == "submitted":
+            # Order not found in open orders - might be filled
+            # In a real implementation, we would query order history
+            exchange_order = {"orderStatus": "Filled"}
+        
+        if not exchange_order:
+            return
+        
+        # Update order status
+        exchange_status = exchange_order.get("orderStatus", order.status)
+        if exchange_status == order.status:
+            return
+        
+        self.trading_state.update_order(
+            client_order_id,
+            status=exchange_status,
+        )
+        
+        # If filled, create FillEvent
+        if exchange_status == "Filled":
+            filled_quantity = Decimal(str(exchange_order.get("cumExecQty", order.quantity)))
+            fill_event = FillEvent(
+                client_order_id=client_order_id,
+                exchange_order_id=order.exchange_order_id,
+                symbol=order.symbol,
+                side=order.side,
+                filled_quantity=filled_quantity,
+                filled_price=Decimal(str(exchange_order.get("avgPrice", order.price))),
+                fill_time=datetime.utcnow(),
+                is_partial=filled_quantity < order.quantity,
+                remaining_quantity=order.quantity - filled_quantity,
+                source="OrderExecutor",
+            )
+            # Publish FillEvent to event queue
+            if self.event_queue:
+                try:
+                    self.event_queue.put(fill_event)
+                    logger.info(f"FillEvent published for order: {client_order_id}")
+                except Exception as e:
+                    logger.error(f"Error publishing FillEvent: {e}", exc_info=True)
+            else:
+                logger.warning(f"FillEvent created but no event_queue available: {client_order_id}")
+            logger.info(f"Order filled: {client_order_id}")
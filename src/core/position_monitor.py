@@ -40,6 +40,8 @@ class PositionMonitor:
         
         # Fee settings
         self.taker_fee = Decimal(str(self.config.get("risk", {}).get("takerFee", 0.001)))  # 0.1% - use risk config
+        # Margin returned on close uses leverageMax from risk config (not trading.leverage)
+        self.leverage = Decimal(str(self.config.get("risk", {}).get("leverageMax", 10)))
         
         logger.info("PositionMonitor initialized")
     
@@ -55,6 +57,8 @@ class PositionMonitor:
         """
         exits = []
         open_positions = self.trading_state.get_open_positions()
+        # Prices of positions that stay open, marked in one TradingState update after the loop
+        marks: Dict[str, Decimal] = {}
         
         for symbol, position in open_positions.items():
             if symbol not in current_prices:
@@ -89,12 +93,15 @@ class PositionMonitor:
                 
                 # Update unrealized PnL if position still open
                 else:
-                    self.trading_state.update_position_pnl(symbol, current_price)
+                    marks[symbol] = current_price
                     
             except Exception as e:
                 logger.error(f"Error checking position {symbol}: {e}", exc_info=True)
                 # Continue with other positions even if one fails
         
+        if marks:
+            self.trading_state.update_mark(marks)
+        
         return exits
     
     def _check_stop_loss(self, position: Position, current_price: Decimal) -> bool:
@@ -157,9 +164,8 @@ class PositionMonitor:
             
             if removed_position:
                 # Return margin + PnL to cash
-                # Use leverageMax from risk config (not trading.leverage)
-                leverage = Decimal(str(self.config.get("risk", {}).get("leverageMax", 10)))
-                margin_used = (position.entry_price * position.quantity) / leverage if leverage > 0 else (position.entry_price * position.quantity)
+                leverage = self.leverage
+                margin_used = entry_notional / leverage if leverage > 0 else entry_notional
                 cash_to_return = margin_used + realized_pnl
                 
                 # Only credit if positive (realized loss reduces cash)
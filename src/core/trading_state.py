@@ -4,13 +4,18 @@ import threading
 import logging
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict, Optional, List, Callable
+from typing import Dict, Optional, List, Callable, Tuple
 from datetime import datetime
 from copy import deepcopy
 
 logger = logging.getLogger(__name__)
 
 
+def _as_decimal(value) -> Decimal:
+    """Decimal as-is, anything else via str() (exact for floats' shortest repr)"""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
 @dataclass
 class Position:
     """Represents an open trading position"""
@@ -92,12 +97,17 @@ class TradingState:
         self._drawdown: Decimal = Decimal("0")
         
         self._state_listeners: List[callable] = []  # Callbacks for state changes
+        self._trading_listeners: List[Callable[[bool], None]] = []  # Callbacks for enable/disable_trading
         logger.info(f"TradingState initialized with cash={initial_cash}")
     
     def register_state_listener(self, listener: callable) -> None:
         """Register a callback to be called on state changes"""
         self._state_listeners.append(listener)
     
+    def register_trading_listener(self, listener: Callable[[bool], None]) -> None:
+        """Register a callback called with the new flag on enable_trading()/disable_trading()"""
+        self._trading_listeners.append(listener)
+    
     def _notify_listeners(self) -> None:
         """Notify all registered listeners of state change"""
         for listener in self._state_listeners:
@@ -204,12 +214,16 @@ class TradingState:
         """Enable trading"""
         with self._lock:
             self._trading_enabled = True
+            for listener in self._trading_listeners:
+                listener(True)
             logger.info("Trading enabled")
     
     def disable_trading(self) -> None:
         """Disable trading"""
         with self._lock:
             self._trading_enabled = False
+            for listener in self._trading_listeners:
+                listener(False)
             logger.info("Trading disabled")
     
     def add_position(
@@ -220,11 +234,15 @@ class TradingState:
         entry_price: Decimal,
         stop_loss: Decimal,
         take_profit: Decimal,
-        position_id: Optional[str] = None
+        position_id: Optional[str] = None,
+        entry_time: Optional[datetime] = None
     ) -> bool:
         """
         Add new position (atomic).
         
+        Args:
+            entry_time: Fill time of the entry (defaults to now)
+        
         Returns:
             True if position was added, False if position already exists
         """
@@ -238,7 +256,7 @@ class TradingState:
                 side=side,
                 quantity=quantity,
                 entry_price=entry_price,
-                entry_time=datetime.utcnow(),
+                entry_time=entry_time or datetime.utcnow(),
                 stop_loss=stop_loss,
                 take_profit=take_profit,
                 position_id=position_id
@@ -298,30 +316,30 @@ class TradingState:
             
             # Update fields
             if "quantity" in updates:
-                new_quantity = Decimal(str(updates["quantity"]))
+                new_quantity = _as_decimal(updates["quantity"])
                 if new_quantity <= 0:
                     logger.warning(f"Invalid quantity {new_quantity} for position {symbol}")
                     return False
                 position.quantity = new_quantity
-                # Update exposure
-                self._update_exposure(symbol, new_quantity * position.entry_price)
             
             if "entry_price" in updates:
-                new_entry_price = Decimal(str(updates["entry_price"]))
+                new_entry_price = _as_decimal(updates["entry_price"])
                 if new_entry_price <= 0:
                     logger.warning(f"Invalid entry_price {new_entry_price} for position {symbol}")
                     return False
                 position.entry_price = new_entry_price
-                # Update exposure
-                self._update_exposure(symbol, position.quantity * new_entry_price)
+            
+            if "quantity" in updates or "entry_price" in updates:
+                # Update exposure (once, after both fields)
+                self._update_exposure(symbol, position.quantity * position.entry_price)
             
             if "stop_loss" in updates:
                 stop_loss = updates["stop_loss"]
-                position.stop_loss = Decimal(str(stop_loss)) if stop_loss is not None else None
+                position.stop_loss = _as_decimal(stop_loss) if stop_loss is not None else None
             
             if "take_profit" in updates:
                 take_profit = updates["take_profit"]
-                position.take_profit = Decimal(str(take_profit)) if take_profit is not None else None
+                position.take_profit = _as_decimal(take_profit) if take_profit is not None else None
             
             self._update_equity()  # Update equity after position change
             self._notify_listeners()
@@ -335,6 +353,29 @@ class TradingState:
                 self._open_positions[symbol].update_pnl(current_price)
                 self._update_equity()
     
+    def update_mark(self, prices: Optional[Dict[str, Decimal]] = None) -> Tuple[Decimal, Decimal]:
+        """
+        Mark positions to market and refresh equity and drawdown in one step (atomic).
+        
+        Cheaper than reading `equity` and `drawdown` separately when both are
+        needed for the same tick: one lock acquisition, one pass over positions.
+        
+        Args:
+            prices: Optional symbol -> current price; positions without a price keep their PnL
+            
+        Returns:
+            (equity, drawdown)
+        """
+        with self._lock:
+            if prices:
+                for symbol, price in prices.items():
+                    position = self._open_positions.get(symbol)
+                    if position is not None:
+                        position.update_pnl(price)
+            self._update_equity()
+            self._update_drawdown()
+            return self._equity, self._drawdown
+    
     def add_order(self, order: Order) -> bool:
         """
         Add new order (atomic).
@@ -478,6 +519,8 @@ class TradingState:
             self._peak_equity = Decimal(str(snapshot["peak_equity"]))
             self._drawdown = Decimal(str(snapshot["drawdown"]))
             self._trading_enabled = snapshot.get("trading_enabled", False)
+            for listener in self._trading_listeners:
+                listener(self._trading_enabled)
             self._daily_pnl = Decimal(str(snapshot.get("daily_pnl", 0)))
             self._trades_today = snapshot.get("trades_today", 0)
             
@@ -199,24 +199,25 @@ class DataCollector:
             True if successful
         """
         try:
-            for kline in klines:
-                try:
-                    self.db.execute("""
-                        INSERT OR IGNORE INTO klines_archive (
-                            symbol, timestamp, open, high, low, close, volume
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        symbol,
-                        kline.get("timestamp"),
-                        kline.get("open"),
-                        kline.get("high"),
-                        kline.get("low"),
-                        kline.get("close"),
-                        kline.get("volume")
-                    ))
-                except Exception as e:
-                    logger.debug(f"Duplicate kline for {symbol}: {e}")
-                    continue
+            rows = [
+                (
+                    symbol,
+                    kline.get("timestamp"),
+                    kline.get("open"),
+                    kline.get("high"),
+                    kline.get("low"),
+                    kline.get("close"),
+                    kline.get("volume")
+                )
+                for kline in klines
+            ]
+            # One transaction for the whole batch instead of a commit per kline
+            with self.db.transaction() as cursor:
+                cursor.executemany("""
+                    INSERT OR IGNORE INTO klines_archive (
+                        symbol, timestamp, open, high, low, close, volume
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, rows)
 
             logger.debug(f"Saved {len(klines)} klines for {symbol}")
             return True
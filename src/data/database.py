@@ -1,6 +1,7 @@
 """SQLite Database Module - Schema and Connection Management with Thread-Safe Writer Queue"""
 
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import json
@@ -52,6 +53,9 @@ class Database:
                     timeout=10.0  # allow time for concurrent access/locks
                 )
                 self.connection.row_factory = sqlite3.Row
+                # WAL + NORMAL sync: readers don't block the writer and commits skip the per-statement fsync
+                self.connection.execute("PRAGMA journal_mode=WAL")
+                self.connection.execute("PRAGMA synchronous=NORMAL")
                 logger.info(f"Connected to database: {self.db_path}")
                 return
             except sqlite3.Error as e:
@@ -332,6 +336,31 @@ class Database:
                 logger.error(f"Query execution error: {e}")
                 raise
 
+    @contextmanager
+    def transaction(self):
+        """
+        Run a batch of writes inside a single BEGIN IMMEDIATE / COMMIT block
+
+        Pending queued writes are flushed first so ordering is preserved.
+        Rolls back on any exception.
+
+        Yields:
+            Cursor bound to the open transaction
+        """
+        self.flush_writes()
+        with self._write_lock:
+            if self.connection.in_transaction:
+                self.connection.commit()
+            cursor = self.connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except Exception:
+                self.connection.rollback()
+                raise
+            else:
+                self.connection.commit()
+
     def fetch_one(self, query: str, params: tuple = None) -> Optional[Dict[str, Any]]:
         """
         Fetch single row (read operation)
@@ -2,7 +2,7 @@
 
 import logging
 import threading
-from typing import Callable, Dict, List, Optional, Type
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type
 from events.event import BaseEvent
 
 logger = logging.getLogger(__name__)
@@ -17,11 +17,18 @@ class EventDispatcher:
     
     Handlers are called in priority order (higher priority first).
     Errors in handlers do not block the queue.
+    
+    Handlers registered for a base class also receive its subclasses' events.
+    dispatch() looks up the concrete event type in a cache of priority-sorted
+    handler tuples, so it takes no lock and copies no handler lists. Entries
+    are resolved from the registry (walking the type's MRO) on first use; the
+    cache is replaced on every (un)registration, which only happens at startup.
     """
     
     def __init__(self) -> None:
         """Initialize event dispatcher"""
         self._handlers: Dict[Type[BaseEvent], List[tuple[int, HandlerFunction]]] = {}
+        self._dispatch_table: Dict[Type[BaseEvent], Tuple[tuple[int, HandlerFunction], ...]] = {}
         self._lock = threading.Lock()
         self._stats = {
             "total_dispatched": 0,
@@ -53,6 +60,7 @@ class EventDispatcher:
             
             # Sort by priority (descending)
             self._handlers[event_type].sort(key=lambda x: x[0], reverse=True)
+            self._freeze()
         
         logger.info(f"Handler registered for {event_type.__name__} with priority {priority}")
     
@@ -82,11 +90,29 @@ class EventDispatcher:
                     handlers.pop(i)
                     if not handlers:
                         del self._handlers[event_type]
+                    self._freeze()
                     logger.info(f"Handler unregistered for {event_type.__name__}")
                     return True
         
         return False
     
+    def _freeze(self) -> None:
+        """Drop the resolved dispatch table after a registry change (caller holds the lock)"""
+        # Replaced, not cleared: dispatch() may still be reading the old one
+        self._dispatch_table = {}
+    
+    def _resolve(self, event_type: Type[BaseEvent]) -> Tuple[tuple[int, HandlerFunction], ...]:
+        """Handlers for event_type and its base classes, by priority; cached per type"""
+        with self._lock:
+            handlers: List[tuple[int, HandlerFunction]] = []
+            for cls in event_type.__mro__:
+                handlers.extend(self._handlers.get(cls, ()))
+            # Stable sort: on equal priority the most specific type's handlers run first
+            handlers.sort(key=lambda x: x[0], reverse=True)
+            resolved = tuple(handlers)
+            self._dispatch_table[event_type] = resolved
+        return resolved
+    
     def dispatch(self, event: BaseEvent) -> int:
         """
         Dispatch event to all registered handlers.
@@ -98,28 +124,23 @@ class EventDispatcher:
             Number of handlers that processed the event
         """
         event_type = type(event)
-        handlers_to_call: List[tuple[int, HandlerFunction]] = []
-        
-        # Get handlers (copy to avoid lock contention during execution)
-        with self._lock:
-            if event_type in self._handlers:
-                handlers_to_call = self._handlers[event_type].copy()
+        handlers_to_call = self._dispatch_table.get(event_type)
+        if handlers_to_call is None:
+            handlers_to_call = self._resolve(event_type)
         
         if not handlers_to_call:
-            logger.debug(f"No handlers registered for {event_type.__name__}")
+            logger.debug("No handlers registered for %s", event_type.__name__)
             return 0
         
         # Call handlers in priority order
         handled_count = 0
+        error_count = 0
         for priority, handler in handlers_to_call:
             try:
                 handler(event)
                 handled_count += 1
-                with self._lock:
-                    self._stats["total_handled"] += 1
             except Exception as e:
-                with self._lock:
-                    self._stats["total_errors"] += 1
+                error_count += 1
                 logger.error(
                     f"Error in handler for {event_type.__name__} (priority {priority}): {e}",
                     exc_info=True
@@ -128,13 +149,65 @@ class EventDispatcher:
         
         with self._lock:
             self._stats["total_dispatched"] += 1
+            self._stats["total_handled"] += handled_count
+            self._stats["total_errors"] += error_count
+        
+        return handled_count
+    
+    def dispatch_many(self, events: Iterable[Optional[BaseEvent]]) -> int:
+        """
+        Dispatch a batch of events in order.
+        
+        Same as calling dispatch() for each event, but the handler calls
+        run in one loop and the stats lock is taken once per batch.
+        None entries are skipped.
+        
+        Args:
+            events: Events to dispatch
+        
+        Returns:
+            Total number of handler calls that succeeded
+        """
+        dispatched_count = 0
+        handled_count = 0
+        error_count = 0
+        for event in events:
+            if event is None:
+                continue
+            event_type = type(event)
+            handlers_to_call = self._dispatch_table.get(event_type)
+            if handlers_to_call is None:
+                handlers_to_call = self._resolve(event_type)
+            if not handlers_to_call:
+                logger.debug("No handlers registered for %s", event_type.__name__)
+                continue
+            
+            dispatched_count += 1
+            for priority, handler in handlers_to_call:
+                try:
+                    handler(event)
+                    handled_count += 1
+                except Exception as e:
+                    error_count += 1
+                    logger.error(
+                        f"Error in handler for {event_type.__name__} (priority {priority}): {e}",
+                        exc_info=True
+                    )
+        
+        if dispatched_count:
+            with self._lock:
+                self._stats["total_dispatched"] += dispatched_count
+                self._stats["total_handled"] += handled_count
+                self._stats["total_errors"] += error_count
         
         return handled_count
     
     def has_handlers(self, event_type: Type[BaseEvent]) -> bool:
         """Check if any handlers are registered for event type"""
-        with self._lock:
-            return event_type in self._handlers and len(self._handlers[event_type]) > 0
+        handlers = self._dispatch_table.get(event_type)
+        if handlers is None:
+            handlers = self._resolve(event_type)
+        return bool(handlers)
     
     def get_stats(self) -> dict:
         """Get dispatcher statistics"""
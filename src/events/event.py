@@ -1,19 +1,22 @@
 """Base Event Class for Event-Driven Architecture"""
 
 from abc import ABC
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Any, Dict, Optional
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseEvent(ABC):
     """
     Base class for all events in the trading system.
     
     All events must inherit from this class and implement the required fields.
     Events are immutable after creation.
+    
+    Events are slotted dataclasses (no per-instance __dict__); subclasses
+    should use @dataclass(slots=True) as well.
     """
     
     event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -35,14 +38,16 @@ class BaseEvent(ABC):
             "event_type": self.event_type,
         }
         
-        # Add all non-private fields
-        for key, value in self.__dict__.items():
+        # Add all non-private fields (events use __slots__, so walk the dataclass fields)
+        for f in fields(self):
+            key = f.name
+            value = getattr(self, key)
             if not key.startswith('_') and key not in result:
                 if isinstance(value, datetime):
                     result[key] = value.isoformat()
                 elif isinstance(value, (int, float, str, bool, type(None))):
                     result[key] = value
-                elif hasattr(value, '__dict__'):
+                elif hasattr(value, '__dict__') or isinstance(value, BaseEvent):
                     result[key] = str(value)
                 else:
                     result[key] = value
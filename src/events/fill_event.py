@@ -7,7 +7,7 @@ from datetime import datetime
 from events.event import BaseEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class FillEvent(BaseEvent):
     """
     Order fill/execution event.
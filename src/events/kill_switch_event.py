@@ -5,7 +5,7 @@ from typing import Dict, Optional
 from events.event import BaseEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class KillSwitchEvent(BaseEvent):
     """
     Kill switch event for emergency stop.
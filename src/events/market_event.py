@@ -6,7 +6,7 @@ from typing import Dict, Optional
 from events.event import BaseEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketEvent(BaseEvent):
     """
     Market data event containing price, volume, and tick information.
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from events.signal_event import SignalEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderIntentEvent(BaseEvent):
     """
     Order intent before risk check.
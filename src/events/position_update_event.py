@@ -6,7 +6,7 @@ from typing import Dict, Optional
 from events.event import BaseEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionUpdateEvent(BaseEvent):
     """
     Position update event.
@@ -1,9 +1,10 @@
 """Thread-safe Event Queue"""
 
-import queue
+import collections
 import threading
 import logging
-from typing import Optional
+import time
+from typing import Deque, List, Optional
 from datetime import datetime
 from events.event import BaseEvent
 
@@ -14,49 +15,65 @@ class EventQueue:
     """
     Thread-safe event queue for event-driven architecture.
     
-    Uses queue.Queue for thread-safety and simplicity.
+    Many producers (WebSocket callbacks, market data collector, order
+    executor), one consumer (the event loop thread). Events live in a
+    collections.deque, whose append/popleft are atomic, so put/get take no
+    mutex; threading.Event objects only wake up a waiting consumer (or a
+    producer waiting for space) and are left alone while nobody waits.
+    Statistics are lock-free too: only the consumer counts dequeued events
+    and the enqueued total is derived from it.
     Supports both blocking and non-blocking operations.
     """
     
-    def __init__(self, maxsize: int = 1000) -> None:
+    def __init__(self, maxsize: int = 1024) -> None:
         """
         Initialize event queue.
         
         Args:
             maxsize: Maximum queue size (0 = unlimited)
         """
-        self._queue: queue.Queue[BaseEvent] = queue.Queue(maxsize=maxsize)
+        self._maxsize = maxsize
+        self._queue: Deque[Optional[BaseEvent]] = collections.deque()
+        self._not_empty = threading.Event()
+        self._not_full = threading.Event()
+        self._not_full.set()
+        # Dropped events and clear() are rare; the lock only guards their counters
         self._lock = threading.Lock()
-        self._stats = {
-            "total_enqueued": 0,
-            "total_dequeued": 0,
-            "total_dropped": 0,
-        }
+        self._dequeued = 0
+        self._cleared = 0
+        self._dropped = 0
         logger.info(f"EventQueue initialized with maxsize={maxsize}")
     
-    def put(self, event: BaseEvent, block: bool = True, timeout: Optional[float] = None) -> bool:
+    def put(self, event: Optional[BaseEvent], block: bool = True, timeout: Optional[float] = None) -> bool:
         """
         Put event into queue.
         
+        None is accepted as a wakeup sentinel for a consumer blocked in get().
+        
+        The size limit is checked without a lock, so concurrent producers
+        can overshoot maxsize by a few events.
+        
         Args:
             event: Event to enqueue
             block: If True, block until space is available
             timeout: Timeout in seconds (only if block=True)
-            
+        
         Returns:
             True if event was enqueued, False if dropped
         """
-        try:
-            self._queue.put(event, block=block, timeout=timeout)
-            with self._lock:
-                self._stats["total_enqueued"] += 1
-            logger.debug(f"Event enqueued: {event}")
-            return True
-        except queue.Full:
-            with self._lock:
-                self._stats["total_dropped"] += 1
-            logger.warning(f"Event queue full, dropping event: {event}")
-            return False
+        if self._maxsize > 0 and len(self._queue) >= self._maxsize:
+            if not (block and self._wait_for_space(timeout)):
+                with self._lock:
+                    self._dropped += 1
+                logger.warning("Event queue full, dropping event: %s", event)
+                return False
+        
+        # Append before checking the flag: a consumer that clears it re-checks the deque afterwards
+        self._queue.append(event)
+        if not self._not_empty.is_set():
+            self._not_empty.set()
+        logger.debug("Event enqueued: %s", event)
+        return True
     
     def get(self, block: bool = True, timeout: Optional[float] = None) -> Optional[BaseEvent]:
         """
@@ -65,38 +82,116 @@ class EventQueue:
         Args:
             block: If True, block until event is available
             timeout: Timeout in seconds (only if block=True)
+        
+        Returns:
+            Event or None if queue is empty (block=False or timeout)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                event = self._queue.popleft()
+                break
+            except IndexError:
+                if not block or not self._wait(self._not_empty, deadline):
+                    return None
+        
+        if not self._not_full.is_set():
+            self._not_full.set()
+        self._dequeued += 1
+        logger.debug("Event dequeued: %s", event)
+        return event
+    
+    def get_many(
+        self,
+        max_n: int,
+        block: bool = True,
+        timeout: Optional[float] = None
+    ) -> List[Optional[BaseEvent]]:
+        """
+        Get up to max_n events at once.
+        
+        Only waits for the first event, then drains whatever else is queued.
+        
+        Args:
+            max_n: Maximum number of events to return
+            block: If True, block until an event is available
+            timeout: Timeout in seconds (only if block=True)
             
         Returns:
-            Event or None if queue is empty and block=False
+            Events in FIFO order (empty if none arrived)
         """
+        queue = self._queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        events: List[Optional[BaseEvent]] = []
+        while not events:
+            try:
+                events.append(queue.popleft())
+            except IndexError:
+                if not block or not self._wait(self._not_empty, deadline):
+                    return events
+        
+        popleft = queue.popleft
         try:
-            event = self._queue.get(block=block, timeout=timeout)
-            with self._lock:
-                self._stats["total_dequeued"] += 1
-            logger.debug(f"Event dequeued: {event}")
-            return event
-        except queue.Empty:
-            return None
+            while len(events) < max_n:
+                events.append(popleft())
+        except IndexError:
+            pass
+        
+        if not self._not_full.is_set():
+            self._not_full.set()
+        self._dequeued += len(events)
+        return events
+    
+    def _wait_for_space(self, timeout: Optional[float]) -> bool:
+        """Block until the queue is below maxsize; False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(self._queue) >= self._maxsize:
+            if not self._wait(self._not_full, deadline):
+                return False
+        return True
+    
+    def _wait(self, flag: threading.Event, deadline: Optional[float]) -> bool:
+        """
+        Wait for a wakeup flag, then clear it; False once the deadline has passed.
+        
+        Callers re-check the deque after this returns, so a wakeup between
+        the wait and the clear is never lost.
+        """
+        if deadline is None:
+            flag.wait()
+        else:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not flag.wait(remaining):
+                return False
+        flag.clear()
+        return True
     
     def empty(self) -> bool:
         """Check if queue is empty"""
-        return self._queue.empty()
+        return not self._queue
     
     def qsize(self) -> int:
         """Get current queue size"""
-        return self._queue.qsize()
+        return len(self._queue)
     
     def get_stats(self) -> dict:
-        """Get queue statistics"""
-        with self._lock:
-            return self._stats.copy()
+        """
+        Get queue statistics
+        
+        Read without locking, so totals taken while events are in flight
+        can be off by the few events being moved at that moment.
+        """
+        dequeued = self._dequeued
+        return {
+            "total_enqueued": dequeued + len(self._queue) + self._cleared,
+            "total_dequeued": dequeued,
+            "total_dropped": self._dropped,
+        }
     
     def clear(self) -> None:
         """Clear all events from queue (use with caution)"""
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                break
+        with self._lock:
+            self._cleared += len(self._queue)
+            self._queue.clear()
+        self._not_full.set()
         logger.warning("Event queue cleared")
-
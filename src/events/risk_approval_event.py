@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from events.order_intent_event import OrderIntentEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskApprovalEvent(BaseEvent):
     """
     Risk engine approval or rejection of an order intent.
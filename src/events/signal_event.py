@@ -6,7 +6,7 @@ from typing import Dict, Optional
 from events.event import BaseEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalEvent(BaseEvent):
     """
     Trading signal generated by a strategy.
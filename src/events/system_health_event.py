@@ -5,7 +5,7 @@ from typing import Dict, Optional
 from events.event import BaseEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemHealthEvent(BaseEvent):
     """
     System health event.
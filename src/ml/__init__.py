@@ -11,7 +11,7 @@ Includes:
 """
 
 try:
-    from ml.features import FeatureEngineer, MLDataset
+    from ml.features import FeatureEngineer, MLDataset, FastScaler
     from ml.signal_predictor import SignalPredictor
     from ml.regime_classifier import RegimeClassifier
     from ml.genetic_optimizer import GeneticAlgorithmOptimizer
@@ -23,6 +23,7 @@ except ImportError:
     # Graceful fallback if ML dependencies not available
     FeatureEngineer = None
     MLDataset = None
+    FastScaler = None
     SignalPredictor = None
     RegimeClassifier = None
     GeneticAlgorithmOptimizer = None
@@ -36,6 +37,7 @@ except ImportError:
 __all__ = [
     'FeatureEngineer',
     'MLDataset',
+    'FastScaler',
     'SignalPredictor',
     'RegimeClassifier',
     'GeneticAlgorithmOptimizer',
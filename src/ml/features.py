@@ -49,6 +49,32 @@ class FeatureEngineer:
 
         return features
 
+    @staticmethod
+    def engineer_features_into(
+        indicators: Dict,
+        price: float,
+        klines: pd.DataFrame,
+        feature_names: List[str],
+        out: np.ndarray
+    ) -> np.ndarray:
+        """
+        Wie engineer_features, schreibt aber direkt in einen vorallokierten Buffer
+
+        Args:
+            indicators: Technische Indikatoren
+            price: Aktueller Preis
+            klines: Historical klines DataFrame
+            feature_names: Feature-Reihenfolge (Spalten von out)
+            out: 1D Buffer der Länge len(feature_names), z.B. X[i]
+
+        Returns:
+            out (fehlende Features = 0.0)
+        """
+        features = FeatureEngineer.engineer_features(indicators, price, klines)
+        for j, name in enumerate(feature_names):
+            out[j] = features.get(name, 0.0)
+        return out
+
     @staticmethod
     def _extract_raw_features(indicators: Dict) -> Dict:
         """Extrahiere direkte Indikatoren"""
@@ -381,3 +407,59 @@ class MLDataset:
         y_test = y[test_idx:]
 
         return (X_train, y_train), (X_val, y_val), (X_test, y_test)
+
+
+class FastScaler:
+    """
+    Standardisierung (z-score) ohne sklearn-Objekt
+
+    Drop-in für StandardScaler.transform(); mean/std werden als .npz
+    gespeichert statt den ganzen Scaler zu picklen.
+    """
+
+    def __init__(self, mean: Optional[np.ndarray] = None, std: Optional[np.ndarray] = None):
+        self.mean_ = mean
+        self.scale_ = std
+
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Fit on X and standardize it IN PLACE (X must be a float array)
+
+        Args:
+            X: Training features
+
+        Returns:
+            X (same buffer), standardized
+        """
+        self.mean_ = X.mean(axis=0)
+        self.scale_ = X.std(axis=0)
+        self.scale_[self.scale_ == 0] = 1.0
+        np.subtract(X, self.mean_, out=X)
+        np.divide(X, self.scale_, out=X)
+        return X
+
+    def transform(self, X: np.ndarray, copy: bool = True) -> np.ndarray:
+        """
+        Standardize X with the fitted mean/std
+
+        Args:
+            X: Features
+            copy: False to standardize a float array in place
+
+        Returns:
+            Standardized features
+        """
+        out = np.array(X, dtype=np.result_type(X, self.mean_)) if copy else X
+        np.subtract(out, self.mean_, out=out)
+        np.divide(out, self.scale_, out=out)
+        return out
+
+    def save(self, path: str) -> None:
+        """Save mean/std as .npz"""
+        np.savez(path, mean=self.mean_, std=self.scale_)
+
+    @classmethod
+    def load(cls, path: str) -> 'FastScaler':
+        """Load mean/std from .npz"""
+        with np.load(path) as data:
+            return cls(data["mean"], data["std"])
@@ -14,7 +14,7 @@ import numpy as np
 import pandas as pd
 import joblib
 
-from ml.features import FeatureEngineer
+from ml.features import FeatureEngineer, FastScaler
 
 
 class SignalPredictor:
@@ -29,7 +29,9 @@ class SignalPredictor:
         """
         self.logger = logging.getLogger(__name__)
         self.model_path = Path(model_path)
-        self.scaler_path = self.model_path.parent / "scaler.pkl"
+        self.native_model_path = self.model_path.with_suffix(".ubj")
+        self.scaler_path = self.model_path.parent / "scaler.npz"
+        self.legacy_scaler_path = self.model_path.parent / "scaler.pkl"
         self.feature_names_path = self.model_path.parent / "feature_names.json"
 
         self.model = None
@@ -46,16 +48,25 @@ class SignalPredictor:
             True if successful, False otherwise
         """
         try:
-            if not self.model_path.exists():
+            if self.native_model_path.exists():
+                import xgboost as xgb
+
+                self.model = xgb.XGBClassifier()
+                self.model.load_model(self.native_model_path)
+                self.logger.info(f"✅ Loaded model: {self.native_model_path}")
+            elif self.model_path.exists():
+                self.model = joblib.load(self.model_path)
+                self.logger.info(f"✅ Loaded model: {self.model_path}")
+            else:
                 self.logger.warning(f"Model not found: {self.model_path}")
                 return False
 
-            self.model = joblib.load(self.model_path)
-            self.logger.info(f"✅ Loaded model: {self.model_path}")
-
             if self.scaler_path.exists():
-                self.scaler = joblib.load(self.scaler_path)
+                self.scaler = FastScaler.load(self.scaler_path)
                 self.logger.info(f"✅ Loaded scaler: {self.scaler_path}")
+            elif self.legacy_scaler_path.exists():
+                self.scaler = joblib.load(self.legacy_scaler_path)
+                self.logger.info(f"✅ Loaded scaler: {self.legacy_scaler_path}")
 
             if self.feature_names_path.exists():
                 with open(self.feature_names_path, 'r') as f:
@@ -98,19 +109,17 @@ class SignalPredictor:
                     'model_enhanced': False
                 }
 
-            # Engineer features
-            features_dict = FeatureEngineer.engineer_features(
-                indicators, price, klines
-            )
-
-            # Convert to array in correct order
+            # Engineer features straight into a (1, n_features) row in correct order
             if self.feature_names:
-                features = np.array([
-                    features_dict.get(name, 0.0)
-                    for name in self.feature_names
-                ]).reshape(1, -1)
+                features = np.empty((1, len(self.feature_names)), dtype=np.float32)
+                FeatureEngineer.engineer_features_into(
+                    indicators, price, klines, self.feature_names, features[0]
+                )
             else:
                 # Fallback: convert dict to array
+                features_dict = FeatureEngineer.engineer_features(
+                    indicators, price, klines
+                )
                 features = np.array(list(features_dict.values())).reshape(1, -1)
 
             # Normalize
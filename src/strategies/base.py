@@ -1,9 +1,11 @@
 """Base Strategy Class"""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 import logging
 
+import numpy as np
+
 from events.market_event import MarketEvent
 from events.signal_event import SignalEvent
 from events.fill_event import FillEvent
@@ -20,6 +22,10 @@ class BaseStrategy(ABC):
     They must not maintain their own trading state.
     """
     
+    # Stateless strategies can set this and implement generate_signals_vectorized()
+    # so backtests compute all signals in one call instead of once per bar
+    supports_vectorized: bool = False
+    
     def __init__(self, name: str, config: dict) -> None:
         """
         Initialize strategy.
@@ -30,6 +36,8 @@ class BaseStrategy(ABC):
         """
         self.name = name
         self.config = config
+        self._enabled: Optional[bool] = None  # set_enabled() override of config["enabled"]
+        self._enable_listeners: List[Callable[["BaseStrategy"], None]] = []
         self.logger = logging.getLogger(f"{__name__}.{name}")
         self.logger.info(f"Strategy {name} initialized")
     
@@ -46,6 +54,22 @@ class BaseStrategy(ABC):
         """
         pass
     
+    def generate_signals_vectorized(self, bars: Dict[str, np.ndarray]) -> Dict[int, List[SignalEvent]]:
+        """
+        Generate signals for a whole price history at once (backtesting only).
+        
+        Only called when supports_vectorized is True. Signals for bar i must
+        only depend on bars up to and including i (no lookahead), the same
+        information generate_signals() gets for that bar.
+        
+        Args:
+            bars: Column arrays "timestamp", "symbol", "open", "high", "low", "close", "volume"
+            
+        Returns:
+            Bar index -> signals generated at that bar (bars without signals omitted)
+        """
+        raise NotImplementedError(f"{self.name} does not support vectorized signal generation")
+    
     def on_fill(self, fill_event: FillEvent) -> None:
         """
         Called when a fill event occurs.
@@ -70,5 +94,20 @@ class BaseStrategy(ABC):
     
     def is_enabled(self) -> bool:
         """Check if strategy is enabled"""
+        if self._enabled is not None:
+            return self._enabled
         return self.config.get("enabled", True)
+    
+    def set_enabled(self, enabled: bool) -> None:
+        """Enable or disable the strategy and notify on_enable_change() listeners"""
+        if enabled == self.is_enabled():
+            return
+        self._enabled = enabled
+        self.logger.info(f"Strategy {self.name} {'enabled' if enabled else 'disabled'}")
+        for listener in self._enable_listeners:
+            listener(self)
+    
+    def on_enable_change(self, listener: Callable[["BaseStrategy"], None]) -> None:
+        """Register a callback (called with the strategy) for set_enabled() changes"""
+        self._enable_listeners.append(listener)
 
@@ -3,6 +3,8 @@
 from typing import Optional, Dict, Any
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -144,6 +146,75 @@ class SlippageModel:
         
         return slippage_amount
     
+    def calculate_slippage_vec(
+        self,
+        price: np.ndarray,
+        order_size_usd: np.ndarray,
+        side_sign: np.ndarray,
+        volatility: Optional[np.ndarray] = None,
+        volume_24h_usd: Optional[np.ndarray] = None,
+        asset_type: str = "linear"
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_slippage for a batch of orders
+        
+        Same model as calculate_slippage, element-wise; missing (0/NaN)
+        volume or volatility entries fall back exactly like None does there.
+        
+        Args:
+            price: Market prices
+            order_size_usd: Order sizes in USD
+            side_sign: +1 for Buy, -1 for Sell
+            volatility: Asset volatility per order (optional)
+            volume_24h_usd: 24-hour trading volume in USD per order (optional)
+            asset_type: Asset type ("linear", "inverse", "spot")
+            
+        Returns:
+            Slippage amounts in price units
+        """
+        price = np.asarray(price, dtype=np.float64)
+        order_size_usd = np.asarray(order_size_usd, dtype=np.float64)
+        is_buy = np.asarray(side_sign) > 0
+        
+        base_slippage_pct = np.where(is_buy, self.base_slippage_buy, self.base_slippage_sell)
+        
+        # Market impact (see calculate_market_impact for the tiers)
+        if volume_24h_usd is None:
+            market_impact_pct = np.full(price.shape, 0.0005)
+        else:
+            volume = np.broadcast_to(np.asarray(volume_24h_usd, dtype=np.float64), price.shape)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                volume_pct = (order_size_usd / volume) * 100
+            tiered = np.select(
+                [volume_pct < 0.1, volume_pct < 1.0, volume_pct < 5.0, volume_pct < 10.0],
+                [0.0001, 0.0005, 0.001, 0.002],
+                default=np.minimum(0.002 + (volume_pct - 10.0) * 0.00005, 0.01)
+            )
+            tiered = np.where(is_buy, tiered, tiered * 1.1)
+            no_volume = (volume == 0) | np.isnan(volume)
+            market_impact_pct = np.where(no_volume, 0.0005, np.where(volume <= 0, 0.002, tiered))
+        
+        # Volatility adjustment (NaN compares False -> 1.0, like None)
+        if volatility is None:
+            volatility_adjustment = 1.0
+        else:
+            volatility = np.asarray(volatility, dtype=np.float64)
+            volatility_adjustment = np.select(
+                [volatility > 0.05, volatility > 0.03, volatility > 0.02],
+                [1.5, 1.3, 1.1],
+                default=1.0
+            )
+        
+        # Asset type adjustment
+        asset_adjustment = 1.0
+        if asset_type == "inverse":
+            asset_adjustment = 1.2
+        elif asset_type == "spot":
+            asset_adjustment = 0.9
+        
+        total_slippage_pct = (base_slippage_pct + market_impact_pct) * volatility_adjustment * asset_adjustment
+        return price * total_slippage_pct
+    
     def estimate_fill_price(
         self,
         target_price: float,
@@ -1,8 +1,15 @@
 """Trading Strategies Module - 8 Core Strategies"""
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Mapping, Tuple, Union
+import numpy as np
 import pandas as pd
 
+# Candles are either a DataFrame (live) or a mapping of full-history column
+# arrays addressed with an explicit end_idx (backtesting)
+Candles = Union[pd.DataFrame, Mapping[str, np.ndarray]]
+
+CANDLE_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
 class Strategies:
     """8 Core Trading Strategies"""
     
@@ -15,6 +22,41 @@ class Strategies:
         """
         self.config = config
         self.strategy_configs = config.get("strategies", {})
+        # Full-history EMAs for end_idx calls, keyed by (id(candles), period)
+        self._ema_cache: Dict[Tuple[int, int], Tuple[Any, np.ndarray]] = {}
+    
+    @staticmethod
+    def _candle_count(candles: Optional[Candles], end_idx: Optional[int] = None) -> int:
+        """Number of candles up to and including the current bar"""
+        if candles is None or len(candles) == 0:
+            return 0
+        if end_idx is not None:
+            return end_idx + 1
+        return len(candles["close"])
+    
+    @staticmethod
+    def _column(candles: Candles, name: str) -> np.ndarray:
+        """Column as ndarray (no copy for DataFrame columns or arrays)"""
+        return np.asarray(candles[name])
+    
+    def _ema_at(self, candles: Candles, period: int, end_idx: Optional[int] = None) -> float:
+        """EMA of close at the current bar"""
+        from trading.indicators import Indicators
+        
+        if end_idx is None:
+            return Indicators.ema(pd.Series(self._column(candles, "close")), period).iloc[-1]
+        
+        # EMA is causal, so the value at end_idx of the full-history EMA equals
+        # the last value of the EMA over candles[:end_idx+1] - compute it once
+        key = (id(candles), period)
+        cached = self._ema_cache.get(key)
+        if cached is None or cached[0] is not candles:
+            if len(self._ema_cache) >= 16:
+                self._ema_cache.clear()
+            ema = Indicators.ema(pd.Series(self._column(candles, "close")), period).to_numpy()
+            cached = (candles, ema)
+            self._ema_cache[key] = cached
+        return cached[1][end_idx]
     
     def ema_trend(self, indicators: Dict[str, float], regime: Dict[str, Any], price: float) -> Optional[Dict[str, Any]]:
         """Strategy 1: EMA Trend (trending markets)"""
@@ -143,18 +185,20 @@ class Strategies:
     
     def volume_profile(
         self,
-        candles_m1: pd.DataFrame,
+        candles_m1: Candles,
         regime: Dict[str, Any],
-        indicators: Dict[str, float]
+        indicators: Dict[str, float],
+        end_idx: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
         """Strategy 6: Volume Profile with VWAP Integration (all markets)"""
-        if candles_m1.empty or len(candles_m1) < 20:
+        n = self._candle_count(candles_m1, end_idx)
+        if n < 20:
             return None
         
-        recent_candles = candles_m1.tail(20)
-        avg_volume = recent_candles["volume"].mean()
-        recent_vol = recent_candles.tail(3)["volume"].mean()
-        current_price = candles_m1.iloc[-1]["close"]
+        recent_volume = self._column(candles_m1, "volume")[n - 20:n]
+        avg_volume = recent_volume.mean()
+        recent_vol = recent_volume[-3:].mean()
+        current_price = self._column(candles_m1, "close")[n - 1]
         
         # Check for volume spike
         volume_spike = recent_vol > avg_volume * 1.5
@@ -191,13 +235,15 @@ class Strategies:
         indicators: Dict[str, float],
         regime: Dict[str, Any],
         price: float,
-        candles_m1: pd.DataFrame
+        candles_m1: Candles,
+        end_idx: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
         """Strategy 7: Volatility Breakout with Confirmation (volatile markets)"""
         if regime["type"] != "volatile":
             return None
         
-        if candles_m1.empty or len(candles_m1) < 20:
+        n = self._candle_count(candles_m1, end_idx)
+        if n < 20:
             return None
         
         atr = indicators.get("atr", 0)
@@ -209,16 +255,18 @@ class Strategies:
             return None
         
         # Volume confirmation: check for volume spike
-        recent_candles = candles_m1.tail(20)
-        avg_volume = recent_candles["volume"].mean()
-        current_volume = candles_m1.iloc[-1]["volume"]
+        recent_volume = self._column(candles_m1, "volume")[n - 20:n]
+        avg_volume = recent_volume.mean()
+        current_volume = recent_volume[-1]
         volume_spike = current_volume > avg_volume * 1.3
         
         # Breakout confirmation: price should be making new highs/lows
-        recent_high = recent_candles["high"].max()
-        recent_low = recent_candles["low"].min()
-        current_high = candles_m1.iloc[-1]["high"]
-        current_low = candles_m1.iloc[-1]["low"]
+        recent_highs = self._column(candles_m1, "high")[n - 20:n]
+        recent_lows = self._column(candles_m1, "low")[n - 20:n]
+        recent_high = recent_highs.max()
+        recent_low = recent_lows.min()
+        current_high = recent_highs[-1]
+        current_low = recent_lows[-1]
         
         # Bullish breakout: new high with volume
         if regime.get("isBullish") and current_high >= recent_high * 0.998:  # Near or above recent high
@@ -250,38 +298,30 @@ class Strategies:
     
     def multi_timeframe(
         self,
-        candles_m1: pd.DataFrame,
-        candles_m5: pd.DataFrame,
-        candles_m15: pd.DataFrame,
+        candles_m1: Candles,
+        candles_m5: Candles,
+        candles_m15: Candles,
         regime: Dict[str, Any],
-        indicators: Dict[str, float]
+        indicators: Dict[str, float],
+        end_idx: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
         """Strategy 8: Multi-Timeframe Analysis with EMA Alignment (all markets)"""
-        if (candles_m1.empty or candles_m5.empty or candles_m15.empty or
-            len(candles_m5) < 50 or len(candles_m15) < 50):
+        n_m1 = self._candle_count(candles_m1, end_idx)
+        n_m5 = self._candle_count(candles_m5, end_idx)
+        n_m15 = self._candle_count(candles_m15, end_idx)
+        if n_m1 == 0 or n_m5 < 50 or n_m15 < 50:
             return None
         
-        # Calculate EMAs for each timeframe
-        from trading.indicators import Indicators
-        ind_calc = Indicators()
-        
-        ema21_m1 = ind_calc.ema(candles_m1["close"], 21)
-        ema21_m5 = ind_calc.ema(candles_m5["close"], 21)
-        ema21_m15 = ind_calc.ema(candles_m15["close"], 21)
-        
-        ema50_m5 = ind_calc.ema(candles_m5["close"], 50)
-        ema50_m15 = ind_calc.ema(candles_m15["close"], 50)
+        # Get current prices and EMAs for each timeframe
+        price_m1 = self._column(candles_m1, "close")[n_m1 - 1]
+        price_m5 = self._column(candles_m5, "close")[n_m5 - 1]
+        price_m15 = self._column(candles_m15, "close")[n_m15 - 1]
         
-        # Get current prices and EMAs
-        price_m1 = candles_m1.iloc[-1]["close"]
-        price_m5 = candles_m5.iloc[-1]["close"]
-        price_m15 = candles_m15.iloc[-1]["close"]
-        
-        ema21_m1_val = ema21_m1.iloc[-1] if len(ema21_m1) > 0 else price_m1
-        ema21_m5_val = ema21_m5.iloc[-1] if len(ema21_m5) > 0 else price_m5
-        ema21_m15_val = ema21_m15.iloc[-1] if len(ema21_m15) > 0 else price_m15
-        ema50_m5_val = ema50_m5.iloc[-1] if len(ema50_m5) > 0 else price_m5
-        ema50_m15_val = ema50_m15.iloc[-1] if len(ema50_m15) > 0 else price_m15
+        ema21_m1_val = self._ema_at(candles_m1, 21, end_idx)
+        ema21_m5_val = self._ema_at(candles_m5, 21, end_idx)
+        ema21_m15_val = self._ema_at(candles_m15, 21, end_idx)
+        ema50_m5_val = self._ema_at(candles_m5, 50, end_idx)
+        ema50_m15_val = self._ema_at(candles_m15, 50, end_idx)
         
         # Check EMA alignment (bullish: price > EMA21 > EMA50 across timeframes)
         m1_bullish = price_m1 > ema21_m1_val
@@ -329,9 +369,10 @@ class Strategies:
         indicators: Dict[str, float],
         regime: Dict[str, Any],
         price: float,
-        candles_m1: Optional[pd.DataFrame] = None,
-        candles_m5: Optional[pd.DataFrame] = None,
-        candles_m15: Optional[pd.DataFrame] = None,
+        candles_m1: Optional[Candles] = None,
+        candles_m5: Optional[Candles] = None,
+        candles_m15: Optional[Candles] = None,
+        end_idx: Optional[int] = None,
         **kwargs
     ) -> List[Dict[str, Any]]:
         """
@@ -344,6 +385,9 @@ class Strategies:
             candles_m1: M1 candles DataFrame
             candles_m5: M5 candles DataFrame
             candles_m15: M15 candles DataFrame
+            end_idx: Current bar when the candles are full-history arrays
+                (dict of column ndarrays or DataFrame); strategies only look at
+                candles[:end_idx+1], so callers need not slice per bar
             
         Returns:
             List of strategy signals
@@ -378,9 +422,9 @@ class Strategies:
             self.rsi_mean_reversion(indicators, regime),
             self.bollinger_mean_reversion(indicators, regime, price),
             self.adx_trend(indicators, regime),
-            self.volume_profile(cm1, regime, indicators),
-            self.volatility_breakout(indicators, regime, price, cm1),
-            self.multi_timeframe(cm1, cm5, cm15, regime, indicators)
+            self.volume_profile(cm1, regime, indicators, end_idx),
+            self.volatility_breakout(indicators, regime, price, cm1, end_idx),
+            self.multi_timeframe(cm1, cm5, cm15, regime, indicators, end_idx)
         ]
         
         # Filter by regime and collect valid signals
@@ -396,4 +440,63 @@ class Strategies:
                 signals.append(signal)
         
         return signals
-
+    
+    def precompute_signals(
+        self,
+        df: pd.DataFrame,
+        min_confidence: float = 0.6,
+        start: int = 0,
+        mask: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ensemble signal for every bar of a full history (backtesting pre-pass)
+        
+        Bar i sees candles[:i+1] and the indicator columns of row i, exactly
+        like a per-bar run_all_strategies call, and takes the first signal
+        with confidence > min_confidence. Signals do not depend on open
+        positions or equity, so a backtest loop only needs to look them up.
+        
+        Args:
+            df: Candles plus indicator columns (one row per bar)
+            min_confidence: Minimum confidence for a signal to count
+            start: First bar to evaluate (earlier bars get no signal)
+            mask: Optional boolean array; bars where it is False are skipped
+            
+        Returns:
+            (side per bar: +1 Buy / -1 Sell / 0 none, confidence per bar)
+        """
+        from trading.regime_detector import RegimeDetector
+        
+        n = len(df)
+        sig_side = np.zeros(n, dtype=np.int8)
+        sig_conf = np.zeros(n, dtype=np.float64)
+        
+        candles = {c: df[c].to_numpy(np.float64) for c in CANDLE_COLUMNS[1:]}
+        close = candles["close"]
+        indicator_items = tuple((c, df[c].to_numpy()) for c in df.columns if c not in CANDLE_COLUMNS)
+        # One dict reused for every bar; regime detection and strategies only read it
+        indicators: Dict[str, Any] = dict.fromkeys((c for c, _ in indicator_items), 0.0)
+        
+        bars = range(start, n) if mask is None else np.flatnonzero(mask[start:]) + start
+        for i in bars:
+            for col, values in indicator_items:
+                indicators[col] = values[i]
+            price = close[i]
+            regime = RegimeDetector.detect_regime(indicators, price)
+            
+            # M5/M15 reuse the same data in backtests
+            for signal in self.run_all_strategies(
+                indicators=indicators,
+                regime=regime,
+                price=price,
+                candles_m1=candles,
+                candles_m5=candles,
+                candles_m15=candles,
+                end_idx=i
+            ):
+                if signal and signal.get("confidence", 0) > min_confidence:
+                    sig_side[i] = 1 if signal["side"] == "Buy" else -1
+                    sig_conf[i] = signal.get("confidence", 0.7)
+                    break
+        
+        return sig_side, sig_conf
@@ -0,0 +1,33 @@
+"""Optional Numba JIT Support
+
+numba is an optional dependency. When it is installed, `njit` compiles
+numeric kernels to native code; otherwise it is a no-op decorator and
+callers should prefer their NumPy path (check NUMBA_AVAILABLE).
+"""
+
+from typing import Any, Callable
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args: Any, **kwargs: Any) -> Callable:
+    """
+    numba.njit when available, identity decorator otherwise
+
+    Supports both `@njit` and `@njit(cache=True, ...)` forms.
+    """
+    if NUMBA_AVAILABLE:
+        return numba.njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable) -> Callable:
+        return func
+
+    return decorator
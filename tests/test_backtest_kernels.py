@@ -0,0 +1,99 @@
+"""Backtest kernels agree with the per-position reference logic."""
+
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from backtesting._bt_kernels import (
+    check_exits, process_bar_exits, scan_exits, scan_exits_blocked, EXIT_NONE, EXIT_STOP_LOSS
+)
+from backtesting.backtest_engine import BacktestEngine, BacktestPosition
+
+
+def test_check_exits_matches_backtest_position():
+    sides = ["Buy", "Buy", "Buy", "Sell", "Sell", "Sell"]
+    stop_loss = np.array([95.0, 95.0, 95.0, 105.0, 105.0, 105.0])
+    take_profit = np.array([110.0, 110.0, 110.0, 90.0, 90.0, 90.0])
+    side_sign = np.array([1 if s == "Buy" else -1 for s in sides], dtype=np.int8)
+
+    for price in (80.0, 90.0, 95.0, 100.0, 105.0, 110.0, 120.0):
+        hit_sl, hit_tp = check_exits(side_sign, stop_loss, take_profit, price)
+        for j, side in enumerate(sides):
+            position = BacktestPosition(
+                trade_id=j, symbol="BTCUSDT", side=side, entry_price=100.0,
+                quantity=1.0, entry_time=datetime(2024, 1, 1),
+                stop_loss=stop_loss[j], take_profit=take_profit[j],
+            )
+            expected = position.check_exit(price, datetime(2024, 1, 1))
+            assert bool(hit_sl[j]) == (expected == "Stop Loss")
+            assert bool(hit_tp[j]) == (expected == "Take Profit")
+
+
+@pytest.mark.parametrize("dynamic", [True, False])
+def test_process_bar_exits_matches_simulate_order_and_close(dynamic):
+    engine = BacktestEngine(config={}, use_dynamic_slippage=dynamic)
+    model = engine.slippage_model
+    side = np.array([1, 1, -1, -1], dtype=np.int8)
+    stop_loss = np.array([97.0, 90.0, 105.0, 110.0])
+    take_profit = np.array([110.0, 96.0, 90.0, 97.0])
+    entry = np.array([100.0, 100.0, 100.0, 100.0])
+    qty = np.array([1.5, 200.0, 3.0, 0.5])
+    price, volume_24h, volatility = 96.0, 50_000.0, 0.035
+
+    pnl_total, exit_code, exit_prices = process_bar_exits(
+        price, side, stop_loss, take_profit, entry, qty, engine.commission_rate,
+        dynamic, engine.slippage_rate,
+        model.base_slippage_buy if dynamic else 0.0,
+        model.base_slippage_sell if dynamic else 0.0,
+        1.0, volume_24h, volatility,
+    )
+
+    expected_total = 0.0
+    for j in range(len(side)):
+        position = BacktestPosition(
+            trade_id=j, symbol="BTCUSDT", side=int(side[j]), entry_price=entry[j],
+            quantity=qty[j], entry_time=datetime(2024, 1, 1),
+            stop_loss=stop_loss[j], take_profit=take_profit[j],
+            commission_rate=engine.commission_rate,
+        )
+        reason = position.check_exit(price, datetime(2024, 1, 1))
+        if reason is None:
+            assert exit_code[j] == EXIT_NONE
+            continue
+        assert (exit_code[j] == EXIT_STOP_LOSS) == (reason == "Stop Loss")
+        expected_price = engine.simulate_order(
+            "BTCUSDT", "Sell" if side[j] > 0 else "Buy", price, qty[j],
+            volume_24h_usd=volume_24h, volatility=volatility,
+        )
+        assert exit_prices[j] == pytest.approx(expected_price)
+        position.close(expected_price, datetime(2024, 1, 1), reason)
+        expected_total += position.realized_pnl
+
+    assert (exit_code != EXIT_NONE).sum() == 3
+    assert pnl_total == pytest.approx(expected_total)
+
+
+@pytest.mark.parametrize("scan", [scan_exits, scan_exits_blocked])
+def test_scan_exits_finds_first_exit_bar(scan):
+    rng = np.random.default_rng(3)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.002, 3000)))
+    side = np.array([1, -1], dtype=np.int8)
+    stop_loss = np.array([close[0] * 0.9, close[0] * 1.1])
+    take_profit = np.array([close[0] * 1.1, close[0] * 0.9])
+
+    for start in (0, 5, 700, 2999):
+        expected = len(close)
+        for i in range(start, len(close)):
+            hit_sl, hit_tp = check_exits(side, stop_loss, take_profit, close[i])
+            if hit_sl.any() or hit_tp.any():
+                expected = i
+                break
+        assert scan(close, side, stop_loss, take_profit, start, len(close)) == expected
+
+    # Empty range
+    assert scan(close, side, stop_loss, take_profit, 10, 10) == 10
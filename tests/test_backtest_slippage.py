@@ -3,11 +3,13 @@
 import os
 import sys
 
+import numpy as np
+import pandas as pd
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from backtesting.backtest_engine import BacktestEngine
+from backtesting.backtest_engine import BacktestEngine, rolling_market_stats
 
 
 class _StubSlippageModel:
@@ -49,3 +51,62 @@ def test_simulate_order_fallbacks_when_disabled(monkeypatch):
     )
 
     assert price == pytest.approx(50000.0 * (1 - 0.0002))
+
+
+def test_rolling_market_stats_match_window_recomputation():
+    rng = np.random.default_rng(7)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 300)))
+    volume = rng.uniform(1, 50, 300)
+    window = 40
+
+    notional, volatility = rolling_market_stats(close, volume, window)
+
+    for i in (0, 1, 2, 39, 40, 41, 299):
+        start = max(0, i - window)
+        window_close = pd.Series(close[start:i + 1])
+        expected_notional = (pd.Series(volume[start:i + 1]) * window_close).sum()
+        expected_vol = window_close.pct_change().std()
+        assert notional[i] == pytest.approx(expected_notional)
+        if np.isnan(expected_vol):
+            assert np.isnan(volatility[i])
+        else:
+            assert volatility[i] == pytest.approx(expected_vol)
+
+
+def test_calculate_slippage_vec_matches_scalar_model():
+    from trading.slippage_model import SlippageModel
+
+    model = SlippageModel()
+    sizes = np.array([50.0, 500.0, 5_000.0, 20_000.0, 80_000.0, 500_000.0])
+    for volume in (None, 0.0, 1_000_000.0):
+        for volatility in (None, 0.01, 0.025, 0.04, 0.08):
+            for side, sign in (("Buy", 1), ("Sell", -1)):
+                vec = model.calculate_slippage_vec(
+                    price=np.full(len(sizes), 50000.0),
+                    order_size_usd=sizes,
+                    side_sign=np.full(len(sizes), sign),
+                    volatility=volatility,
+                    volume_24h_usd=volume,
+                )
+                for size, value in zip(sizes, vec):
+                    expected = model.calculate_slippage(
+                        price=50000.0,
+                        order_size_usd=size,
+                        volume_24h_usd=volume,
+                        side=side,
+                        volatility=volatility,
+                    )
+                    assert value == pytest.approx(expected)
+
+
+def test_simulate_order_batch_fallback_matches_single_orders():
+    engine = BacktestEngine(config={}, use_dynamic_slippage=False, slippage_rate=0.0002)
+
+    prices = engine.simulate_order_batch(
+        prices=np.array([50000.0, 50000.0]),
+        side_signs=np.array([1, -1]),
+        quantities=np.array([0.01, 0.01]),
+    )
+
+    assert prices[0] == pytest.approx(engine.simulate_order("BTCUSDT", "Buy", 50000.0, 0.01))
+    assert prices[1] == pytest.approx(engine.simulate_order("BTCUSDT", "Sell", 50000.0, 0.01))
@@ -43,3 +43,28 @@ def test_save_trade_entry_returns_id_and_persists():
     finally:
         db.close()
         os.unlink(db_path)
+
+
+def test_save_klines_batches_and_ignores_duplicates():
+    """Kline batch insert should persist rows once and skip duplicates."""
+    fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+
+    try:
+        db = Database(db_path)
+        collector = DataCollector(db)
+
+        klines = [
+            {"timestamp": f"2024-01-01 00:0{i}:00", "open": 1.0, "high": 2.0,
+             "low": 0.5, "close": 1.5, "volume": 10.0}
+            for i in range(5)
+        ]
+
+        assert collector.save_klines("BTCUSDT", klines) is True
+        assert collector.save_klines("BTCUSDT", klines[:2]) is True
+
+        row = db.fetch_one("SELECT COUNT(*) as count FROM klines_archive WHERE symbol = ?", ("BTCUSDT",))
+        assert row["count"] == 5
+    finally:
+        db.close()
+        os.unlink(db_path)
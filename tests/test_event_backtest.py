@@ -0,0 +1,238 @@
+"""Tests for the event-based backtest engine"""
+
+import os
+import sys
+from typing import Dict, List
+
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from backtesting.event_backtest import EventBacktest
+from core.trading_state import TradingState
+from events.market_event import MarketEvent
+from events.signal_event import SignalEvent
+from strategies.base import BaseStrategy
+
+
+class RecordingStrategy(BaseStrategy):
+    """Never trades, only remembers what each market event contained"""
+
+    def __init__(self) -> None:
+        super().__init__("recording", {})
+        self.events: List[dict] = []
+
+    def generate_signals(self, market_event: MarketEvent) -> List[SignalEvent]:
+        # The backtest reuses one event object, so copy the fields
+        self.events.append({
+            "symbol": market_event.symbol,
+            "price": market_event.price,
+            "volume": market_event.volume,
+            **market_event.additional_data,
+        })
+        return []
+
+
+class EveryTwentyMinutes(BaseStrategy):
+    """Buys on every bar whose minute is a multiple of 20"""
+
+    def __init__(self, vectorized: bool) -> None:
+        super().__init__("every_twenty_minutes", {})
+        self.supports_vectorized = vectorized
+
+    @staticmethod
+    def _signal(symbol: str, price: float, timestamp: str) -> SignalEvent:
+        return SignalEvent(
+            symbol=symbol,
+            side="Buy",
+            strategy_name="every_twenty_minutes",
+            entry_price=Decimal(str(round(price, 2))),
+            stop_loss=Decimal(str(round(price * 0.995, 2))),
+            take_profit=Decimal(str(round(price * 1.0075, 2))),
+            confidence=0.8,
+            timestamp=timestamp,
+        )
+
+    def generate_signals(self, market_event: MarketEvent) -> List[SignalEvent]:
+        if pd.Timestamp(market_event.timestamp).minute % 20:
+            return []
+        return [self._signal(market_event.symbol, market_event.price, market_event.timestamp)]
+
+    def generate_signals_vectorized(self, bars: Dict[str, np.ndarray]) -> Dict[int, List[SignalEvent]]:
+        minutes = pd.DatetimeIndex(bars["timestamp"]).minute
+        return {
+            int(i): [self._signal(bars["symbol"][i], float(bars["close"][i]),
+                                  pd.Timestamp(bars["timestamp"][i]).isoformat())]
+            for i in np.flatnonzero(minutes % 20 == 0)
+        }
+
+
+RISK_CONFIG = {"riskPct": 0.01, "maxTradesPerDay": 1000, "maxExposurePerAsset": 5.0, "maxDailyLoss": 0.5}
+
+
+def make_klines(n: int = 80) -> pd.DataFrame:
+    """Minute bars with a gentle uptrend"""
+    close = np.linspace(100.0, 110.0, n)
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=n, freq="1min").astype(str),
+        "symbol": "BTCUSDT",
+        "open": close - 0.1,
+        "high": close + 0.5,
+        "low": close - 0.5,
+        "close": close,
+        "volume": np.full(n, 25.0),
+    })
+
+
+def test_market_events_match_bars():
+    """Each event carries the current bar; the klines window stops before it"""
+    data = make_klines()
+    strategy = RecordingStrategy()
+
+    result = EventBacktest(initial_equity=10000.0).run_backtest(data, [strategy], {})
+
+    assert len(strategy.events) == len(data) - 30
+    assert len(result["equity_curve"]) == len(data) - 30
+
+    event = strategy.events[0]
+    assert event["symbol"] == "BTCUSDT"
+    assert event["price"] == data["close"].iloc[30]
+    assert event["volume"] == 25.0
+    assert event["high"] == data["high"].iloc[30]
+
+    klines = event["klines_m1"]
+    assert len(klines) == 30
+    assert float(klines[-1][4]) == data["close"].iloc[29]
+
+
+def test_optional_columns_default():
+    """open/high/low fall back to close, volume to 0, symbol to UNKNOWN"""
+    data = make_klines()[["timestamp", "close"]]
+    strategy = RecordingStrategy()
+
+    EventBacktest(initial_equity=10000.0).run_backtest(data, [strategy], {})
+
+    event = strategy.events[-1]
+    assert event["symbol"] == "UNKNOWN"
+    assert event["volume"] == 0.0
+    assert event["open"] == event["price"]
+    assert event["low"] == event["price"]
+
+
+def test_drawdown_metrics():
+    """Max drawdown and Ulcer Index are measured from the running peak"""
+    timestamps = pd.date_range("2024-01-01", periods=5, freq="h")
+    equity = [10000.0, 11000.0, 9900.0, 10450.0, 12000.0]
+    curve = [{"timestamp": t, "equity": e, "drawdown": 0.0} for t, e in zip(timestamps, equity)]
+
+    metrics = EventBacktest(initial_equity=10000.0)._calculate_metrics([], curve, 12000.0, None)
+
+    drawdowns = np.array([0.0, 0.0, 0.1, 0.05, 0.0])
+    assert np.isclose(metrics["max_drawdown"], 0.1)
+    assert np.isclose(metrics["ulcer_index"], np.sqrt(np.mean(drawdowns ** 2)))
+    assert np.isclose(metrics["profit_factor"], (1000.0 + 550.0 + 1550.0) / 1100.0)
+
+
+def test_position_exits():
+    """Stop loss wins over take profit; untouched positions stay open"""
+    engine = EventBacktest(initial_equity=10000.0)
+    engine.trading_state = TradingState(initial_cash=Decimal("10000"))
+    engine.trading_state.add_position("BTCUSDT", "Buy", Decimal("1"), Decimal("100"), Decimal("95"), Decimal("110"))
+    engine.trading_state.add_position("ETHUSDT", "Sell", Decimal("2"), Decimal("100"), Decimal("105"), Decimal("96"))
+    engine.trading_state.add_position("SOLUSDT", "Buy", Decimal("1"), Decimal("100"), Decimal("90"), Decimal("120"))
+
+    trades = []
+    engine._check_position_exits(pd.Series({"close": 95.0}), pd.Timestamp("2024-01-01"), trades)
+
+    assert [t["symbol"] for t in trades] == ["BTCUSDT", "ETHUSDT"]
+    assert trades[0]["exit_reason"] == "Stop Loss"
+    assert trades[0]["price"] == 95.0
+    assert trades[1]["exit_reason"] == "Take Profit"
+    assert trades[1]["side"] == "Buy"
+    assert np.isclose(trades[1]["realized_pnl"], (100 - 96) * 2 - 96 * 2 * 0.001)
+    assert list(engine.trading_state.get_open_positions()) == ["SOLUSDT"]
+
+
+def test_initial_equity_decimal_or_float():
+    """Decimal and float starting equity give the same result"""
+    data = make_klines()
+
+    from_float = EventBacktest(initial_equity=10000.0).run_backtest(data, [], {})
+    from_decimal = EventBacktest(initial_equity=Decimal("10000")).run_backtest(data, [], {})
+
+    assert from_decimal["final_equity"] == from_float["final_equity"] == 10000.0
+    assert from_decimal["total_return"] == 0.0
+
+
+def test_filter_data_by_date_inclusive():
+    """Both bounds are inclusive and the input frame is left untouched"""
+    data = make_klines(10)
+    start, end = pd.Timestamp("2024-01-01 00:02"), pd.Timestamp("2024-01-01 00:05")
+
+    filtered = EventBacktest()._filter_data_by_date(data, start.to_pydatetime(), end.to_pydatetime())
+
+    assert pd.to_datetime(filtered["timestamp"]).tolist() == list(pd.date_range(start, end, freq="1min"))
+    assert list(data.columns) == list(make_klines(10).columns)
+
+
+def test_vectorized_signals_match_per_bar():
+    """Precomputed signals give the same backtest as per-bar generation"""
+    data = make_klines(200)
+
+    per_bar = EventBacktest(initial_equity=10000.0).run_backtest(
+        data, [EveryTwentyMinutes(vectorized=False)], RISK_CONFIG
+    )
+    vectorized = EventBacktest(initial_equity=10000.0).run_backtest(
+        data, [EveryTwentyMinutes(vectorized=True)], RISK_CONFIG
+    )
+
+    assert per_bar["num_trades"] >= 1
+    assert vectorized["trades"] == per_bar["trades"]
+    assert vectorized["equity_curve"] == per_bar["equity_curve"]
+
+
+def test_tail_loss_percentiles():
+    """Tail loss is the 95th/99th percentile of loss sizes (largest losses)"""
+    timestamps = pd.date_range("2024-01-01", periods=2, freq="h")
+    curve = [{"timestamp": t, "equity": 10000.0, "drawdown": 0.0} for t in timestamps]
+    losses = np.arange(1.0, 101.0)
+    trades = [{"realized_pnl": -loss} for loss in losses] + [{"realized_pnl": 50.0}]
+
+    metrics = EventBacktest(initial_equity=10000.0)._calculate_metrics(trades, curve, 10000.0, None)
+
+    assert np.isclose(metrics["tail_loss_95"], np.percentile(losses, 95))
+    assert np.isclose(metrics["tail_loss_99"], np.percentile(losses, 99))
+    assert metrics["tail_loss_99"] > metrics["tail_loss_95"] > 90.0
+
+
+def test_time_to_recovery():
+    """Hours from the peak before the max drawdown to the first equity above it"""
+    timestamps = pd.date_range("2024-01-01", periods=5, freq="h")
+
+    def recovery(equity):
+        curve = [{"timestamp": t, "equity": e, "drawdown": 0.0} for t, e in zip(timestamps, equity)]
+        metrics = EventBacktest(initial_equity=10000.0)._calculate_metrics([], curve, max(equity), None)
+        return metrics["time_to_recovery_hours"]
+
+    assert recovery([10000.0, 11000.0, 9900.0, 10450.0, 12000.0]) == 3.0
+    assert recovery([10000.0, 11000.0, 9900.0, 11000.0, 10500.0]) == -1.0
+    assert recovery([10000.0, 10100.0, 10200.0, 10300.0, 10400.0]) is None
+
+
+def test_unsorted_input_is_sorted():
+    """Shuffled bars give the same backtest as sorted ones"""
+    data = make_klines(200)
+    shuffled = data.sample(frac=1.0, random_state=0)
+
+    expected = EventBacktest(initial_equity=10000.0).run_backtest(
+        data, [EveryTwentyMinutes(vectorized=False)], RISK_CONFIG
+    )
+    result = EventBacktest(initial_equity=10000.0).run_backtest(
+        shuffled, [EveryTwentyMinutes(vectorized=False)], RISK_CONFIG
+    )
+
+    assert result["trades"] == expected["trades"]
+    assert result["equity_curve"] == expected["equity_curve"]
@@ -0,0 +1,78 @@
+"""Tests for the event dispatcher"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from events.dispatcher import EventDispatcher
+from events.event import BaseEvent
+from events.market_event import MarketEvent
+from events.signal_event import SignalEvent
+
+
+def test_priority_order_and_error_isolation():
+    """Handlers run highest priority first; a failing handler doesn't stop the others"""
+    dispatcher = EventDispatcher()
+    calls = []
+
+    def failing(event):
+        calls.append("failing")
+        raise RuntimeError("boom")
+
+    dispatcher.register_handler(MarketEvent, lambda e: calls.append("low"), priority=10)
+    dispatcher.register_handler(MarketEvent, lambda e: calls.append("high"), priority=200)
+    dispatcher.register_handler(MarketEvent, failing, priority=100)
+
+    assert dispatcher.dispatch(MarketEvent(symbol="BTCUSDT", source="Test")) == 2
+    assert calls == ["high", "failing", "low"]
+    assert dispatcher.dispatch(SignalEvent(symbol="BTCUSDT", source="Test")) == 0
+    assert dispatcher.get_stats() == {"total_dispatched": 1, "total_handled": 2, "total_errors": 1}
+
+
+def test_unregister_updates_dispatch():
+    """Removing the last handler for a type stops dispatching it"""
+    dispatcher = EventDispatcher()
+    calls = []
+    handler = calls.append
+    dispatcher.register_handler(MarketEvent, handler)
+
+    assert dispatcher.has_handlers(MarketEvent)
+    assert dispatcher.unregister_handler(MarketEvent, handler)
+    assert not dispatcher.unregister_handler(MarketEvent, handler)
+    assert not dispatcher.has_handlers(MarketEvent)
+    assert dispatcher.dispatch(MarketEvent(symbol="BTCUSDT", source="Test")) == 0
+    assert calls == []
+
+
+def test_base_class_handlers_receive_subclass_events():
+    """A BaseEvent handler sees every event, after higher-priority specific handlers"""
+    dispatcher = EventDispatcher()
+    calls = []
+    dispatcher.register_handler(BaseEvent, lambda e: calls.append(("any", e.event_type)), priority=50)
+    dispatcher.register_handler(MarketEvent, lambda e: calls.append(("market", e.event_type)), priority=100)
+
+    dispatcher.dispatch(MarketEvent(symbol="BTCUSDT", source="Test"))
+    dispatcher.dispatch(SignalEvent(symbol="BTCUSDT", source="Test"))
+
+    assert calls == [("market", "MarketEvent"), ("any", "MarketEvent"), ("any", "SignalEvent")]
+    assert dispatcher.has_handlers(SignalEvent)
+
+
+def test_dispatch_many_matches_dispatch():
+    """A batch is dispatched in order, skipping None, with the same stats as one-by-one"""
+    dispatcher = EventDispatcher()
+    calls = []
+    dispatcher.register_handler(MarketEvent, lambda e: calls.append(e.symbol))
+    dispatcher.register_handler(SignalEvent, lambda e: calls.append("signal"))
+
+    events = [
+        MarketEvent(symbol="BTCUSDT", source="Test"),
+        None,
+        SignalEvent(symbol="BTCUSDT", source="Test"),
+        MarketEvent(symbol="ETHUSDT", source="Test"),
+    ]
+
+    assert dispatcher.dispatch_many(events) == 3
+    assert calls == ["BTCUSDT", "signal", "ETHUSDT"]
+    assert dispatcher.get_stats() == {"total_dispatched": 3, "total_handled": 3, "total_errors": 0}
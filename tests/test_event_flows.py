@@ -11,6 +11,11 @@ from events.market_event import MarketEvent
 from events.signal_event import SignalEvent
 from events.order_intent_event import OrderIntentEvent
 from events.risk_approval_event import RiskApprovalEvent
+from events.order_submission_event import OrderSubmissionEvent
+from events.fill_event import FillEvent
+from events.position_update_event import PositionUpdateEvent
+from events.kill_switch_event import KillSwitchEvent
+from events.system_health_event import SystemHealthEvent
 
 
 class TestEventFlows(unittest.TestCase):
@@ -149,6 +154,10 @@ class TestEventFlows(unittest.TestCase):
         # Check position was created
         position = self.trading_state.get_position("BTCUSDT")
         self.assertIsNotNone(position)
+        
+        # Stop loss / take profit kept on the order as Decimal for fill handling
+        order = self.trading_state.get_order(order_submission.client_order_id)
+        self.assertEqual(order.metadata, {"stop_loss": Decimal("49900"), "take_profit": Decimal("51000")})
     
     def test_rejected_order_flow(self) -> None:
         """Test flow when order is rejected by risk engine"""
@@ -175,6 +184,33 @@ class TestEventFlows(unittest.TestCase):
         position = self.trading_state.get_position("BTCUSDT")
         self.assertIsNone(position)
 
+    def test_slotted_event_to_dict(self) -> None:
+        """Test events have no per-instance __dict__ and still serialize all fields"""
+        signal = SignalEvent(symbol="BTCUSDT", side="Sell", confidence=0.7, source="Test")
+        order_intent = OrderIntentEvent(symbol="BTCUSDT", original_signal=signal, source="Test")
+
+        self.assertFalse(hasattr(order_intent, "__dict__"))
+
+        data = order_intent.to_dict()
+        self.assertEqual(data["event_type"], "OrderIntentEvent")
+        self.assertEqual(data["symbol"], "BTCUSDT")
+        self.assertEqual(data["order_type"], "Market")
+        self.assertIsInstance(data["original_signal"], str)
+        self.assertEqual(signal.to_dict()["confidence"], 0.7)
+
+    def test_event_loop_events_are_slotted(self) -> None:
+        """Test every event type the event loop handles rejects unknown attributes"""
+        event_types = (
+            MarketEvent, SignalEvent, OrderIntentEvent, RiskApprovalEvent, OrderSubmissionEvent,
+            FillEvent, PositionUpdateEvent, KillSwitchEvent, SystemHealthEvent,
+        )
+        for event_type in event_types:
+            with self.subTest(event_type=event_type.__name__):
+                event = event_type(source="Test")
+                self.assertFalse(hasattr(event, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    event.not_a_field = 1
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,236 @@
+"""Tests for the event loop"""
+
+import os
+import sys
+import threading
+import time
+from decimal import Decimal
+from typing import List
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from core.event_loop import EventLoop
+from core.order_executor import OrderExecutor
+from core.risk_engine import RiskEngine
+from core.strategy_allocator import StrategyAllocator
+from core.trading_state import Order, TradingState
+from events.fill_event import FillEvent
+from events.market_event import MarketEvent
+from events.position_update_event import PositionUpdateEvent
+from events.signal_event import SignalEvent
+from events.system_health_event import SystemHealthEvent
+from strategies.base import BaseStrategy
+
+CONFIG = {
+    "risk": {"riskPct": 0.002, "maxDailyLoss": 0.005, "maxTradesPerDay": 10, "maxExposurePerAsset": 0.10},
+    "circuitBreaker": {"maxDailyDrawdown": 0.05},
+    "allocator": {"maxTradesPerStrategy": 5},
+}
+
+
+class RecordingStrategy(BaseStrategy):
+    """Never trades, only records which thread saw which market event"""
+
+    def __init__(self) -> None:
+        super().__init__("recording", {})
+        self.seen: List[tuple] = []
+        self.done = threading.Event()
+
+    def generate_signals(self, market_event: MarketEvent) -> List[SignalEvent]:
+        self.seen.append((market_event.symbol, threading.get_ident()))
+        self.done.set()
+        return []
+
+
+@pytest.fixture
+def strategy() -> RecordingStrategy:
+    return RecordingStrategy()
+
+
+def make_loop(strategy: BaseStrategy, config: dict = CONFIG) -> EventLoop:
+    state = TradingState(initial_cash=Decimal("10000"))
+    state.enable_trading()
+    return EventLoop(
+        trading_state=state,
+        risk_engine=RiskEngine(config, state),
+        strategy_allocator=StrategyAllocator(config, state),
+        order_executor=OrderExecutor(state, None, "PAPER"),
+        strategies=[strategy],
+        config=config,
+    )
+
+
+@pytest.fixture
+def event_loop(strategy: RecordingStrategy) -> EventLoop:
+    loop = make_loop(strategy)
+    yield loop
+    loop.stop()
+
+
+def test_stop_wakes_blocked_loop(event_loop: EventLoop, strategy: RecordingStrategy):
+    """The loop blocks without polling; stop() returns promptly and the loop can be restarted"""
+    for _ in range(2):
+        event_loop.start()
+        event_loop.publish_event(MarketEvent(symbol="BTCUSDT", price=50000.0, source="Test"))
+        assert strategy.done.wait(timeout=5.0)
+        strategy.done.clear()
+
+        started = time.monotonic()
+        event_loop.stop()
+        assert time.monotonic() - started < 1.0
+        assert not event_loop.thread.is_alive()
+
+    assert [symbol for symbol, _ in strategy.seen] == ["BTCUSDT", "BTCUSDT"]
+
+
+def test_paper_mode_dispatches_inline_on_loop_thread(event_loop: EventLoop, strategy: RecordingStrategy):
+    """Before start() and on the loop thread events skip the queue; other threads still enqueue"""
+    event_loop.publish_event(MarketEvent(symbol="INLINE", price=1.0, source="Test"))
+    assert strategy.seen == [("INLINE", threading.get_ident())]
+    assert event_loop.event_queue.get_stats()["total_enqueued"] == 0
+
+    event_loop.start()
+    strategy.done.clear()
+    event_loop.publish_event(MarketEvent(symbol="QUEUED", price=1.0, source="Test"))
+    assert strategy.done.wait(timeout=5.0)
+    assert strategy.seen[-1] == ("QUEUED", event_loop.thread.ident)
+    assert event_loop.event_queue.get_stats()["total_enqueued"] == 1
+
+
+def test_sync_dispatch_can_be_disabled(strategy: RecordingStrategy):
+    """With eventLoop.syncDispatch off every event goes through the queue"""
+    loop = make_loop(strategy, {**CONFIG, "eventLoop": {"syncDispatch": False}})
+
+    loop.publish_event(MarketEvent(symbol="BTCUSDT", price=1.0, source="Test"))
+
+    assert strategy.seen == []
+    assert loop.event_queue.qsize() == 1
+
+
+def test_disabled_strategy_is_skipped(event_loop: EventLoop, strategy: RecordingStrategy):
+    """set_enabled() updates the loop's strategy snapshot"""
+    strategy.set_enabled(False)
+    event_loop.publish_event(MarketEvent(symbol="OFF", price=1.0, source="Test"))
+
+    strategy.set_enabled(True)
+    event_loop.publish_event(MarketEvent(symbol="ON", price=1.0, source="Test"))
+
+    assert [symbol for symbol, _ in strategy.seen] == ["ON"]
+
+
+def test_market_events_dropped_while_trading_disabled(event_loop: EventLoop, strategy: RecordingStrategy):
+    """The loop follows enable_trading()/disable_trading() on the shared TradingState"""
+    event_loop.trading_state.disable_trading()
+    event_loop.publish_event(MarketEvent(symbol="OFF", price=1.0, source="Test"))
+
+    # Events are handled in order, so once the marker is dispatched the OFF event has been too
+    marker_seen = threading.Event()
+    event_loop.dispatcher.register_handler(SystemHealthEvent, lambda e: marker_seen.set())
+
+    event_loop.start()
+    event_loop.publish_event(MarketEvent(symbol="OFF", price=1.0, source="Test"))
+    event_loop.publish_event(SystemHealthEvent(source="Test"))
+    assert marker_seen.wait(timeout=5.0)
+
+    event_loop.trading_state.enable_trading()
+    event_loop.publish_event(MarketEvent(symbol="ON", price=1.0, source="Test"))
+
+    assert strategy.done.wait(timeout=5.0)
+    assert [symbol for symbol, _ in strategy.seen] == ["ON"]
+
+
+class FixedSignalStrategy(BaseStrategy):
+    """Emits one Buy signal per market event"""
+
+    def __init__(self, name: str, confidence: float) -> None:
+        super().__init__(name, {})
+        self.confidence = confidence
+
+    def generate_signals(self, market_event: MarketEvent) -> List[SignalEvent]:
+        return [SignalEvent(symbol=market_event.symbol, side="Buy", strategy_name=self.name,
+                            confidence=self.confidence, source="Test")]
+
+
+def test_signals_of_one_tick_allocated_together():
+    """All strategies' signals for a MarketEvent reach the allocator in a single call"""
+    loop = make_loop(FixedSignalStrategy("first", 0.6))
+    loop.strategies.append(FixedSignalStrategy("second", 0.9))
+    loop._refresh_enabled_strategies()
+    batches = []
+    loop.strategy_allocator.process_signals = lambda signals: batches.append(list(signals)) or []
+
+    loop.publish_event(MarketEvent(symbol="BTCUSDT", price=1.0, source="Test"))
+    loop.publish_event(MarketEvent(symbol="ETHUSDT", price=1.0, source="Test"))
+
+    assert [[(s.symbol, s.strategy_name) for s in batch] for batch in batches] == [
+        [("BTCUSDT", "first"), ("BTCUSDT", "second")],
+        [("ETHUSDT", "first"), ("ETHUSDT", "second")],
+    ]
+
+
+def test_loop_error_tracebacks_rate_limited(event_loop: EventLoop, caplog):
+    """A burst of loop errors logs one traceback, the rest as single lines"""
+    failures = []
+    burst_done = threading.Event()
+
+    def failing_dispatch(events):
+        failures.append(events)
+        if len(failures) == 3:
+            burst_done.set()
+        raise RuntimeError("boom")
+
+    event_loop.dispatcher.dispatch_many = failing_dispatch
+    event_loop.start()
+    for _ in range(3):
+        event_loop.event_queue.put(MarketEvent(symbol="BTCUSDT", price=1.0, source="Test"))
+        time.sleep(0.01)
+    assert burst_done.wait(timeout=5.0)
+    # The stop sentinel fails once more; joining the thread makes all records visible
+    event_loop.stop()
+
+    errors = [r for r in caplog.records if r.getMessage() == "Error in event loop: boom"]
+    assert len(errors) == len(failures) >= 3
+    assert [r.exc_info is not None for r in errors] == [True] + [False] * (len(errors) - 1)
+
+
+def test_position_update_modifies_then_closes(event_loop: EventLoop):
+    """Exchange updates resize the position in place; a zero quantity closes it with the realized PnL"""
+    state = event_loop.trading_state
+    state.add_position("BTCUSDT", "Buy", Decimal("0.1"), Decimal("50000"), Decimal("49000"), Decimal("51000"))
+
+    event_loop._handle_position_update(PositionUpdateEvent(
+        symbol="BTCUSDT", side="Buy", quantity=Decimal("0.2"), source="Test"
+    ))
+    position = state.get_position("BTCUSDT")
+    assert (position.quantity, position.entry_price, position.stop_loss) == (
+        Decimal("0.2"), Decimal("50000"), Decimal("49000")
+    )
+    assert state.trades_today == 0
+
+    event_loop._handle_position_update(PositionUpdateEvent(
+        symbol="BTCUSDT", side="Buy", realized_pnl=Decimal("12.5"), source="Test"
+    ))
+    assert state.get_position("BTCUSDT") is None
+    assert state.daily_pnl == Decimal("12.5")
+
+
+def test_fill_opens_position_from_order_metadata(event_loop: EventLoop):
+    """A fill for a symbol without a position opens one with the order's stop loss / take profit"""
+    state = event_loop.trading_state
+    state.add_order(Order(
+        client_order_id="order-1", symbol="BTCUSDT", side="Buy", quantity=Decimal("0.1"),
+        metadata={"stop_loss": Decimal("49000"), "take_profit": Decimal("51000")},
+    ))
+    fill = FillEvent(
+        client_order_id="order-1", symbol="BTCUSDT", side="Buy",
+        filled_quantity=Decimal("0.1"), filled_price=Decimal("50000"), source="Test",
+    )
+
+    event_loop._handle_fill_event(fill)
+
+    position = state.get_position("BTCUSDT")
+    assert (position.side, position.quantity, position.entry_price) == ("Buy", Decimal("0.1"), Decimal("50000"))
+    assert (position.stop_loss, position.take_profit) == (Decimal("49000"), Decimal("51000"))
+    assert position.entry_time == fill.fill_time
@@ -0,0 +1,88 @@
+"""Tests for the event queue"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from events.market_event import MarketEvent
+from events.queue import EventQueue
+
+
+def make_event(i: int) -> MarketEvent:
+    return MarketEvent(symbol=f"SYM{i}", price=float(i), source="Test")
+
+
+def test_fifo_and_stats():
+    """Events come out in order; get() without block returns None when empty"""
+    q = EventQueue(maxsize=10)
+    events = [make_event(i) for i in range(5)]
+    for event in events:
+        assert q.put(event)
+
+    assert q.qsize() == 5
+    assert [q.get(block=False) for _ in range(5)] == events
+    assert q.get(block=False) is None
+    assert q.get(timeout=0.01) is None
+    assert q.empty()
+    assert q.get_stats() == {"total_enqueued": 5, "total_dequeued": 5, "total_dropped": 0}
+
+
+def test_full_queue_drops_or_waits():
+    """A full queue drops non-blocking puts and unblocks waiting producers once drained"""
+    q = EventQueue(maxsize=2)
+    q.put(make_event(0))
+    q.put(make_event(1))
+
+    assert not q.put(make_event(2), block=False)
+    assert not q.put(make_event(2), timeout=0.01)
+    assert q.get_stats()["total_dropped"] == 2
+
+    threading.Timer(0.05, q.get).start()
+    assert q.put(make_event(3), timeout=5.0)
+    assert [q.get(block=False).symbol for _ in range(2)] == ["SYM1", "SYM3"]
+
+
+def test_blocking_get_wakes_on_put():
+    """Several producers, one blocked consumer: every event arrives exactly once"""
+    q = EventQueue(maxsize=0)
+    received = []
+
+    def consume() -> None:
+        for _ in range(400):
+            received.append(q.get(timeout=5.0))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    producers = [
+        threading.Thread(target=lambda p=p: [q.put(make_event(p * 100 + i)) for i in range(100)])
+        for p in range(4)
+    ]
+    for t in producers:
+        t.start()
+    for t in producers:
+        t.join()
+    consumer.join(timeout=10.0)
+
+    assert sorted(e.price for e in received) == [float(i) for i in range(400)]
+    assert q.get_stats() == {"total_enqueued": 400, "total_dequeued": 400, "total_dropped": 0}
+
+
+def test_get_many_drains_in_order():
+    """get_many waits for the first event only and returns at most max_n"""
+    q = EventQueue(maxsize=10)
+    assert q.get_many(5, block=False) == []
+    assert q.get_many(5, timeout=0.01) == []
+
+    events = [make_event(i) for i in range(7)]
+    for event in events:
+        q.put(event)
+
+    assert q.get_many(5) == events[:5]
+    assert q.get_many(5) == events[5:]
+    assert q.get_stats()["total_dequeued"] == 7
+
+    q.put(make_event(7))
+    q.clear()
+    assert q.get_stats() == {"total_enqueued": 8, "total_dequeued": 7, "total_dropped": 0}
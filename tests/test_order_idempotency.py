@@ -120,6 +120,118 @@ class TestOrderIdempotency(unittest.TestCase):
         updated_order = self.trading_state.get_order(result.client_order_id)
         self.assertEqual(updated_order.status, "cancelled")
 
+    def test_fallback_client_order_id_deterministic(self) -> None:
+        """Test intents without a signal id get the same ID for equal entry prices"""
+        def client_order_id(entry_price: Decimal) -> str:
+            order_intent = OrderIntentEvent(
+                symbol="BTCUSDT",
+                side="Buy",
+                quantity=Decimal("0.1"),
+                entry_price=entry_price,
+                strategy_name="test",
+                source="Test",
+            )
+            approval = RiskApprovalEvent(approved=True, original_intent=order_intent, source="Test")
+            return self.order_executor.execute_approved_order(approval).client_order_id
+        
+        first = client_order_id(Decimal("50000"))
+        self.assertRegex(first, r"^ORDER_[0-9a-f]{16}$")
+        self.assertEqual(client_order_id(Decimal("50000.00")), first)
+        self.assertNotEqual(client_order_id(Decimal("50000.01")), first)
+
+    def test_retry_answered_from_recent_orders(self) -> None:
+        """Test retries of a recent submission skip the TradingState lookup; old entries are evicted"""
+        def approval(strategy_name: str) -> RiskApprovalEvent:
+            order_intent = OrderIntentEvent(
+                symbol="BTCUSDT",
+                side="Buy",
+                quantity=Decimal("0.01"),
+                entry_price=Decimal("50000"),
+                strategy_name=strategy_name,
+                source="Test",
+            )
+            return RiskApprovalEvent(approved=True, original_intent=order_intent, source="Test")
+        
+        with patch("core.order_executor.RECENT_ORDERS_MAX", 2):
+            first = approval("first")
+            result = self.order_executor.execute_approved_order(first)
+            
+            with patch.object(self.trading_state, "get_order", wraps=self.trading_state.get_order) as get_order:
+                retry = self.order_executor.execute_approved_order(first)
+                get_order.assert_not_called()
+                self.assertEqual((retry.client_order_id, retry.status), (result.client_order_id, "filled"))
+                
+                self.order_executor.execute_approved_order(approval("second"))
+                self.order_executor.execute_approved_order(approval("third"))
+                get_order.reset_mock()
+                
+                # Evicted from the cache, still deduplicated through TradingState
+                retry = self.order_executor.execute_approved_order(first)
+                get_order.assert_called_once_with(result.client_order_id)
+                self.assertEqual(retry.client_order_id, result.client_order_id)
+
+    def test_reconcile_one_request_per_symbol(self) -> None:
+        """Test reconciliation fetches each symbol's open orders once and publishes fills"""
+        event_queue = Mock()
+        executor = OrderExecutor(self.trading_state, self.bybit_client, "LIVE", event_queue=event_queue)
+        for client_order_id, symbol, exchange_order_id in [
+            ("btc_open", "BTCUSDT", "1"),
+            ("btc_done", "BTCUSDT", "2"),
+            ("eth_open", "ETHUSDT", "3"),
+        ]:
+            self.trading_state.add_order(Order(
+                client_order_id=client_order_id,
+                exchange_order_id=exchange_order_id,
+                symbol=symbol,
+                side="Buy",
+                quantity=Decimal("0.1"),
+                price=Decimal("100"),
+                status="submitted",
+            ))
+        self.bybit_client._authenticated_request.side_effect = lambda method, endpoint, params: {
+            "result": {"list": [
+                {"orderId": "1", "orderLinkId": "btc_open", "orderStatus": "New"},
+                {"orderId": "x", "orderLinkId": "eth_open", "orderStatus": "PartiallyFilled"},
+            ]}
+        }
+        
+        executor.reconcile_orders()
+        
+        symbols = [call.kwargs["params"]["symbol"] for call in self.bybit_client._authenticated_request.call_args_list]
+        self.assertEqual(sorted(symbols), ["BTCUSDT", "ETHUSDT"])
+        self.assertEqual(self.trading_state.get_order("btc_open").status, "New")
+        self.assertEqual(self.trading_state.get_order("btc_done").status, "Filled")
+        self.assertEqual(self.trading_state.get_order("eth_open").status, "PartiallyFilled")
+        
+        fill = event_queue.put.call_args.args[0]
+        self.assertEqual(fill.client_order_id, "btc_done")
+        self.assertEqual(fill.remaining_quantity, Decimal("0"))
+
+    def test_retry_after_reconcile_reports_current_status(self) -> None:
+        """Test a cached retry reflects status changes made after submission"""
+        executor = OrderExecutor(self.trading_state, self.bybit_client, "LIVE")
+        self.bybit_client._authenticated_request.side_effect = lambda method, endpoint, params: {
+            "result": {"list": []}
+        }
+        self.bybit_client.create_order.return_value = {"orderId": "42", "orderStatus": "New"}
+        order_intent = OrderIntentEvent(
+            symbol="BTCUSDT",
+            side="Buy",
+            quantity=Decimal("0.01"),
+            entry_price=Decimal("50000"),
+            strategy_name="test",
+            source="Test",
+        )
+        approval = RiskApprovalEvent(approved=True, original_intent=order_intent, source="Test")
+        
+        result = executor.execute_approved_order(approval)
+        self.assertEqual(result.status, "submitted")
+        
+        executor.reconcile_orders()
+        self.assertEqual(self.trading_state.get_order(result.client_order_id).status, "Filled")
+        
+        self.assertEqual(executor.execute_approved_order(approval).status, "Filled")
+
 
 if __name__ == "__main__":
     unittest.main()
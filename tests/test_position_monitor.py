@@ -0,0 +1,62 @@
+"""Tests for the position monitor"""
+
+import os
+import sys
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from core.position_monitor import PositionMonitor
+from core.trading_state import TradingState
+
+
+def make_monitor() -> PositionMonitor:
+    state = TradingState(initial_cash=Decimal("10000"))
+    state.add_position("BTCUSDT", "Buy", Decimal("0.1"), Decimal("50000"), Decimal("49000"), Decimal("51000"))
+    state.add_position("ETHUSDT", "Sell", Decimal("1"), Decimal("3000"), Decimal("3100"), Decimal("2900"))
+    state.add_position("SOLUSDT", "Buy", Decimal("10"), Decimal("100"), Decimal("90"), Decimal("120"))
+    return PositionMonitor(state, None, "PAPER", {"risk": {"takerFee": 0.001, "leverageMax": 10}})
+
+
+def test_exits_and_marks():
+    """Stop loss / take profit close positions; the rest are marked to market together"""
+    monitor = make_monitor()
+
+    exits = monitor.check_positions({
+        "BTCUSDT": Decimal("48900"),
+        "ETHUSDT": Decimal("2900"),
+        "SOLUSDT": Decimal("105"),
+    })
+
+    assert [(e["symbol"], e["exit_reason"]) for e in exits] == [
+        ("BTCUSDT", "Stop Loss"),
+        ("ETHUSDT", "Take Profit"),
+    ]
+    assert exits[1]["realized_pnl"] == Decimal("100") - Decimal("3000") * Decimal("0.001") - Decimal("2900") * Decimal("0.001")
+    remaining = monitor.trading_state.get_open_positions()
+    assert list(remaining) == ["SOLUSDT"]
+    assert remaining["SOLUSDT"].unrealized_pnl == Decimal("50")
+
+
+def test_missing_or_invalid_price_skips_position():
+    """Positions without a usable price are neither closed nor marked"""
+    monitor = make_monitor()
+
+    exits = monitor.check_positions({"BTCUSDT": Decimal("0"), "SOLUSDT": Decimal("110")})
+
+    assert exits == []
+    positions = monitor.trading_state.get_open_positions()
+    assert len(positions) == 3
+    assert positions["BTCUSDT"].unrealized_pnl == Decimal("0")
+    assert positions["SOLUSDT"].unrealized_pnl == Decimal("100")
+
+
+def test_close_returns_margin_at_risk_leverage():
+    """Closing credits margin (notional / leverageMax) plus realized PnL"""
+    monitor = make_monitor()
+    cash_before = monitor.trading_state.cash
+
+    exits = monitor.check_positions({"SOLUSDT": Decimal("120")})
+
+    assert exits[0]["exit_reason"] == "Take Profit"
+    assert monitor.trading_state.cash - cash_before == Decimal("100") + exits[0]["realized_pnl"]
@@ -175,6 +175,61 @@ class TestStrategies(unittest.TestCase):
                 self.assertIn("side", signal)
                 self.assertIn("confidence", signal)
 
+    
+    def test_end_idx_matches_sliced_candles(self):
+        """Full-history arrays with end_idx give the same signals as sliced frames"""
+        klines = self.create_test_klines(200)
+        columns = {c: klines[c].to_numpy() for c in ['open', 'high', 'low', 'close', 'volume']}
+        regimes = [
+            {"type": "volatile", "isBullish": True, "isBearish": False},
+            {"type": "trending", "isBullish": False, "isBearish": True},
+        ]
+        indicators = self.create_test_indicators("volatile")
+        indicators["atr"] = 10.0
+        
+        for end_idx in (19, 60, 120, 199):
+            sliced = klines.iloc[:end_idx + 1]
+            price = float(sliced["close"].iloc[-1])
+            for regime in regimes:
+                self.assertEqual(
+                    self.strategies.volume_profile(sliced, regime, indicators),
+                    self.strategies.volume_profile(columns, regime, indicators, end_idx)
+                )
+                self.assertEqual(
+                    self.strategies.volatility_breakout(indicators, regime, price, sliced),
+                    self.strategies.volatility_breakout(indicators, regime, price, columns, end_idx)
+                )
+                self.assertEqual(
+                    self.strategies.multi_timeframe(sliced, sliced, sliced, regime, indicators),
+                    self.strategies.multi_timeframe(columns, columns, columns, regime, indicators, end_idx)
+                )
+
+    
+    def test_precompute_signals_matches_per_bar_run(self):
+        """Pre-pass signals equal the first confident per-bar signal"""
+        klines = self.create_test_klines(150)
+        for key, value in self.create_test_indicators("trending").items():
+            klines[key] = value
+        indicators = self.create_test_indicators("trending")
+        
+        sig_side, sig_conf = self.strategies.precompute_signals(klines, min_confidence=0.6, start=50)
+        
+        self.assertTrue((sig_side[:50] == 0).all())
+        for i in (50, 90, 149):
+            sliced = klines.iloc[:i + 1]
+            price = float(sliced["close"].iloc[-1])
+            regime = self.regime_detector.detect_regime(indicators, price)
+            signals = self.strategies.run_all_strategies(
+                indicators=indicators, regime=regime, price=price,
+                candles_m1=sliced, candles_m5=sliced, candles_m15=sliced
+            )
+            expected = next((sig for sig in signals if sig.get("confidence", 0) > 0.6), None)
+            if expected is None:
+                self.assertEqual(sig_side[i], 0)
+            else:
+                self.assertEqual(sig_side[i], 1 if expected["side"] == "Buy" else -1)
+                self.assertAlmostEqual(sig_conf[i], expected["confidence"])
+
 
 if __name__ == '__main__':
     unittest.main()
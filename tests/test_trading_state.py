@@ -108,7 +108,49 @@ class TestTradingState(unittest.TestCase):
         
         self.assertEqual(drawdown, Decimal("3000"))
         self.assertAlmostEqual(float(drawdown_pct), 20.0, places=1)
+
+    def test_update_position(self) -> None:
+        """Test quantity/entry price updates accept Decimal or float and refresh exposure"""
+        self.state.add_position(
+            symbol="BTCUSDT",
+            side="Buy",
+            quantity=Decimal("0.1"),
+            entry_price=Decimal("50000"),
+            stop_loss=Decimal("49000"),
+            take_profit=Decimal("51000"),
+        )
+        
+        self.assertTrue(self.state.update_position("BTCUSDT", quantity=Decimal("0.3"), entry_price=50500.0))
+        position = self.state.get_position("BTCUSDT")
+        self.assertEqual(position.quantity, Decimal("0.3"))
+        self.assertEqual(position.entry_price, Decimal("50500.0"))
+        self.assertEqual(self.state.get_exposure_per_asset()["BTCUSDT"], Decimal("15150.00"))
+        
+        self.assertFalse(self.state.update_position("BTCUSDT", quantity=Decimal("0")))
+        self.assertFalse(self.state.update_position("ETHUSDT", quantity=Decimal("1")))
     
+    def test_update_mark(self) -> None:
+        """Test marking positions to market refreshes equity and drawdown together"""
+        self.state.add_position(
+            symbol="BTCUSDT",
+            side="Buy",
+            quantity=Decimal("0.1"),
+            entry_price=Decimal("50000"),
+            stop_loss=Decimal("49000"),
+            take_profit=Decimal("51000"),
+        )
+
+        equity, drawdown = self.state.update_mark({"BTCUSDT": Decimal("51000")})
+        self.assertEqual(equity, Decimal("10100"))
+        self.assertEqual(drawdown, Decimal("0"))
+
+        equity, drawdown = self.state.update_mark({"BTCUSDT": Decimal("49500"), "ETHUSDT": Decimal("1")})
+        self.assertEqual(equity, Decimal("9950"))
+        self.assertEqual(drawdown, Decimal("150"))
+
+        # Without prices the last marks are kept
+        self.assertEqual(self.state.update_mark(), (Decimal("9950"), Decimal("150")))
+
     def test_snapshot(self) -> None:
         """Test state snapshot"""
         self.state.enable_trading()
@@ -0,0 +1,60 @@
+"""Tests for walk-forward analysis"""
+
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from backtesting.walk_forward import WalkForwardAnalysis
+
+
+def make_klines(days: int = 20) -> pd.DataFrame:
+    """Hourly random-walk bars"""
+    rng = np.random.default_rng(3)
+    n = days * 24
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=n, freq="h"),
+        "open": close,
+        "high": close * 1.005,
+        "low": close * 0.995,
+        "close": close,
+        "volume": rng.uniform(100, 1000, n),
+    })
+
+
+def test_parallel_windows_match_serial():
+    """Windows backtested in worker processes give the serial results, in window order"""
+    klines = make_klines()
+    analysis = WalkForwardAnalysis({}, train_period_days=5, test_period_days=3, step_days=3)
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 20)
+
+    serial = analysis.run_walk_forward("BTCUSDT", klines, start, end, max_workers=1)
+    parallel = analysis.run_walk_forward("BTCUSDT", klines, start, end, max_workers=2)
+
+    assert serial["windows"] == parallel["windows"] == 4
+    assert [w["test_start"] for w in parallel["window_results"]] == [
+        datetime(2024, 1, 6), datetime(2024, 1, 9), datetime(2024, 1, 12), datetime(2024, 1, 15)
+    ]
+    for s, p in zip(serial["window_results"], parallel["window_results"]):
+        assert s["metrics"]["total_trades"] == p["metrics"]["total_trades"]
+        assert s["metrics"]["total_pnl"] == p["metrics"]["total_pnl"]
+    assert {k: v for k, v in serial.items() if k != "window_results"} == \
+        {k: v for k, v in parallel.items() if k != "window_results"}
+
+
+def test_aggregates_average_over_windows():
+    """Averages are plain means over the windows, trades are summed"""
+    analysis = WalkForwardAnalysis({}, train_period_days=5, test_period_days=3, step_days=3)
+    result = analysis.run_walk_forward(
+        "BTCUSDT", make_klines(), datetime(2024, 1, 1), datetime(2024, 1, 20), max_workers=1
+    )
+
+    windows = [w["metrics"] for w in result["window_results"]]
+    assert result["total_trades"] == sum(m["total_trades"] for m in windows)
+    assert result["average_sharpe_ratio"] == round(np.mean([m["sharpe_ratio"] for m in windows]), 2)
+    assert result["average_max_drawdown"] == round(np.mean([m["max_drawdown"] for m in windows]), 2)